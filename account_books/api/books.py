@@ -1,15 +1,23 @@
 from ninja import Router
 
-from typing import Optional, List
+from typing   import Optional, List
+from datetime import date
 
-from django.http      import HttpRequest, JsonResponse
-from django.db.models import Q
+from django.conf                import settings
+from django.http                import HttpRequest, JsonResponse
+from django.db.models           import Q, Sum, Value, BigIntegerField
+from django.db.models.functions import Coalesce
 
 from core.schema                    import ErrorMessage
 from core.utils.auth                import AuthBearer
 from core.utils.get_obj_n_check_err import GetAccountBook
+from core.utils.archive             import restore_archived_book
+from core.fields                    import get_enum_value
+from core.utils.log_filter          import check_date_range, check_status
+from core.utils.fieldset            import parse_fields, apply_fieldset, serialize_fieldset, fieldset_response
 
-from account_books.schema import AccountBookCreateInput, AccountBookUpdateInput, AccountBookOutput
+from account_books.schema import AccountBookCreateInput, AccountBookUpdateInput, AccountBookOutput, AccountBookDashboardOutput,\
+                                 ACCOUNT_BOOK_OUTPUT_COLUMNS
 from account_books.models import AccountBook
 
 
@@ -23,7 +31,7 @@ router = Router()
     '',
     tags     = ['2. 가계부'],
     summary  = '가계부 리스트 조회',
-    response = List[AccountBookOutput],
+    response = {200: List[AccountBookOutput], 400: ErrorMessage},
     auth     = AuthBearer()
 )
 def get_list_account_book(
@@ -31,6 +39,7 @@ def get_list_account_book(
     search : Optional[str] = None,
     sort   : str = 'up_to_date',
     status : str = 'deleted',
+    fields : Optional[str] = None,
     offset : int = 0,
     limit  : int = 10
     ) -> JsonResponse:
@@ -40,6 +49,27 @@ def get_list_account_book(
     """
     user = request.auth
 
+    """
+    조회 개수(1개 이상, 최대 조회 개수 이하)/시작 위치(0 이상) 제한
+    """
+    limit  = max(min(limit, settings.API_MAX_LIST_LIMIT), 1)
+    offset = max(offset, 0)
+    
+    """
+    제외할 상태값 확인
+    """
+    err = check_status(AccountBook, status)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    조회 필드 확인(sparse fieldset)
+    """
+    if fields:
+        names, err = parse_fields(fields, AccountBookOutput)
+        if err:
+            return JsonResponse({'detail': err}, status=400)
+
     """
     정렬 기준
     """
@@ -65,10 +95,87 @@ def get_list_account_book(
     books = AccountBook.objects\
                        .select_related('user')\
                        .filter(q)\
-                       .exclude(status__iexact=status)\
-                       .order_by(sort_set[sort])[offset:offset+limit]
+                       .exclude(status=get_enum_value(AccountBook, 'status', status))\
+                       .order_by(sort_set[sort])
+
+    """
+    요청한 필드만 조회/반환
+    """
+    if fields:
+        books = apply_fieldset(books, names, ACCOUNT_BOOK_OUTPUT_COLUMNS)
+        return fieldset_response(serialize_fieldset(books[offset:offset+limit], AccountBookOutput, names))
+
+    return books[offset:offset+limit]
 
-    return books
+
+"""
+가계부 대시보드 조회 API
+"""
+@router.get(
+    '/dashboard',
+    tags     = ['2. 가계부'],
+    summary  = '가계부 대시보드 조회(가계부별 예산/총수입/총지출)',
+    response = {200: AccountBookDashboardOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_account_book_dashboard(
+    request  : HttpRequest,
+    date_from: Optional[date] = None,
+    date_to  : Optional[date] = None
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    조회 기간 확인
+    """
+    err = check_date_range(date_from, date_to)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    집계 대상 기록 필터링(사용중인 기록, 조회 기간)
+    """
+    q = Q(logs__status='in_use')
+    
+    if date_from:
+        q &= Q(logs__occurred_at__gte=date_from)
+    if date_to:
+        q &= Q(logs__occurred_at__lte=date_to)
+    
+    """
+    가계부별 총수입/총지출 산출:
+        - 가계부 개수와 관계없이 하나의 GROUP BY 쿼리로 집계
+    """
+    def total(types):
+        return Coalesce(
+            Sum('logs__price', filter=q & Q(logs__types=types)),
+            Value(0),
+            output_field = BigIntegerField()
+        )
+    
+    books = AccountBook.objects\
+                       .filter(user=user)\
+                       .exclude(status='deleted')\
+                       .annotate(
+                           total_income      = total('income'),
+                           total_expenditure = total('expenditure')
+                       )\
+                       .order_by('-created_at')
+    books = list(books)
+    
+    data = {
+        'nickname'         : user.nickname,
+        'total_budget'     : sum(book.budget for book in books),
+        'total_income'     : sum(book.total_income for book in books),
+        'total_expenditure': sum(book.total_expenditure for book in books),
+        'books'            : books
+    }
+    
+    return data
 
 
 """
@@ -204,6 +311,11 @@ def restore_account_book(
     """
     user = request.auth
 
+    """
+    보관 테이블로 이동된 가계부라면 hot 테이블로 복원
+    """
+    restore_archived_book(account_book_id, user)
+
     """
     가계부 객체/유저정보 확인
     """
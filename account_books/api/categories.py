@@ -1,16 +1,26 @@
 from ninja import Router
 
-from typing import Optional, List
+from typing   import Optional, List
+from decimal  import Decimal
+from datetime import date
 
-from django.http      import HttpRequest, JsonResponse
-from django.db.models import Q
+from django.conf       import settings
+from django.core.cache import cache
+from django.http       import HttpRequest, JsonResponse
+from django.db.models  import Q, Sum, Count, Avg
 
 from core.schema                    import ErrorMessage
 from core.utils.auth                import AuthBearer
-from core.utils.get_obj_n_check_err import GetAccountBookCategory
+from core.utils.get_obj_n_check_err import GetAccountBook, GetAccountBookCategory
+from core.utils.archive             import restore_archived_category
+from core.fields                    import get_enum_value
+from core.utils.log_filter          import check_date_range, check_status, check_log_types
+from core.utils.cache               import get_user_cache_key
+from core.utils.fieldset            import parse_fields, apply_fieldset, serialize_fieldset, fieldset_response
 
-from account_books.schema import AccountBookCategoryCreateInput, AccountBookCategoryUpdateInput, AccountBookCategoryOutput
-from account_books.models import AccountBookCategory
+from account_books.schema import AccountBookCategoryCreateInput, AccountBookCategoryUpdateInput, AccountBookCategoryOutput,\
+                                 AccountBookCategoryBreakdownOutput, ACCOUNT_BOOK_CATEGORY_OUTPUT_COLUMNS
+from account_books.models import AccountBookCategory, AccountBookLog
 
 
 router = Router()
@@ -23,7 +33,7 @@ router = Router()
     '',
     tags     = ['3. 가계부 카테고리'],
     summary  = '가계부 카테고리 리스트 조회',
-    response = List[AccountBookCategoryOutput],
+    response = {200: List[AccountBookCategoryOutput], 400: ErrorMessage},
     auth     = AuthBearer()
 )
 def get_list_account_book_categories(
@@ -31,6 +41,7 @@ def get_list_account_book_categories(
     search : Optional[str] = None,
     sort   : str = 'up_to_date',
     status : str = 'deleted',
+    fields : Optional[str] = None,
     offset : int = 0,
     limit  : int = 10
     ) -> JsonResponse:
@@ -40,6 +51,27 @@ def get_list_account_book_categories(
     """
     user = request.auth
 
+    """
+    조회 개수(1개 이상, 최대 조회 개수 이하)/시작 위치(0 이상) 제한
+    """
+    limit  = max(min(limit, settings.API_MAX_LIST_LIMIT), 1)
+    offset = max(offset, 0)
+    
+    """
+    제외할 상태값 확인
+    """
+    err = check_status(AccountBookCategory, status)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    조회 필드 확인(sparse fieldset)
+    """
+    if fields:
+        names, err = parse_fields(fields, AccountBookCategoryOutput)
+        if err:
+            return JsonResponse({'detail': err}, status=400)
+
     """
     정렬 기준
     """
@@ -63,10 +95,144 @@ def get_list_account_book_categories(
     categories = AccountBookCategory.objects\
                                     .select_related('user')\
                                     .filter(q)\
-                                    .exclude(status__iexact=status)\
-                                    .order_by(sort_set[sort])[offset:offset+limit]
-                                    
-    return categories
+                                    .exclude(status=get_enum_value(AccountBookCategory, 'status', status))\
+                                    .order_by(sort_set[sort])
+    
+    """
+    요청한 필드만 조회/반환
+    """
+    if fields:
+        categories = apply_fieldset(categories, names, ACCOUNT_BOOK_CATEGORY_OUTPUT_COLUMNS)
+        return fieldset_response(serialize_fieldset(categories[offset:offset+limit], AccountBookCategoryOutput, names))
+    
+    return categories[offset:offset+limit]
+
+
+"""
+가계부 카테고리별 집계 조회 API
+"""
+@router.get(
+    '/breakdown',
+    tags     = ['3. 가계부 카테고리'],
+    summary  = '가계부 카테고리별 수입/지출 집계 조회',
+    response = {200: AccountBookCategoryBreakdownOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_account_book_category_breakdown(
+    request  : HttpRequest,
+    book_id  : Optional[int] = None,
+    types    : Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to  : Optional[date] = None
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    조회 기간 확인
+    """
+    err = check_date_range(date_from, date_to)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    가계부 기록 타입 확인
+    """
+    err = check_log_types(types)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    types = get_enum_value(AccountBookLog, 'types', types)
+    
+    """
+    가계부 객체/유저정보 확인(가계부 id가 없는 경우 유저의 전체 가계부 기준으로 집계)
+    """
+    if book_id:
+        book, err = GetAccountBook.get_book_n_check_error(book_id, user)
+        if err:
+            return JsonResponse({'detail': err}, status=400)
+    
+    """
+    캐시 확인:
+        - 가계부/카테고리/기록이 변경되면 유저의 캐시 버전이 올라가므로 이전 캐시는 사용되지 않음
+    """
+    cache_key = get_user_cache_key(
+        'category_breakdown', 
+        user.id, 
+        book_id   = book_id, 
+        types     = types, 
+        date_from = date_from, 
+        date_to   = date_to
+    )
+    data = cache.get(cache_key)
+    if data is not None:
+        return data
+    
+    """
+    Q 객체 활용:
+        - 필터링 기능(본인의 사용중인 기록, 가계부/타입/기간을 기준으로 필터링)
+    """
+    q = Q(user_id=user.id, status='in_use')
+    
+    if book_id:
+        q &= Q(book_id=book_id)
+    else:
+        q &= ~Q(book__status='deleted')
+    if types:
+        q &= Q(types=types)
+    if date_from:
+        q &= Q(occurred_at__gte=date_from)
+    if date_to:
+        q &= Q(occurred_at__lte=date_to)
+    
+    """
+    타입/카테고리별 합계/건수/평균 산출(카테고리 테이블은 한번만 조인하는 하나의 GROUP BY 쿼리)
+    """
+    rows = AccountBookLog.objects\
+                         .filter(q)\
+                         .values('types', 'category_id', 'category__name')\
+                         .annotate(
+                             total   = Sum('price'),
+                             count   = Count('id'),
+                             average = Avg('price')
+                         )\
+                         .order_by('types', '-total')
+    rows = list(rows)
+    
+    totals = {'income': 0, 'expenditure': 0}
+    for row in rows:
+        totals[row['types']] += row['total']
+    
+    """
+    타입별 비중(share) 산출
+    """
+    breakdown = {'income': [], 'expenditure': []}
+    for row in rows:
+        if row['types'] not in breakdown:
+            continue
+        type_total = totals[row['types']]
+        breakdown[row['types']].append({
+            'category_id': row['category_id'],
+            'category'   : row['category__name'],
+            'total'      : row['total'],
+            'count'      : row['count'],
+            'share'      : round(float(row['total'] / type_total * 100), 2) if type_total else 0.0,
+            'average'    : round(Decimal(row['average']), 0),
+        })
+    
+    data = {
+        'nickname'         : user.nickname,
+        'total_income'     : totals['income'],
+        'total_expenditure': totals['expenditure'],
+        'income'           : breakdown['income'],
+        'expenditure'      : breakdown['expenditure']
+    }
+    
+    cache.set(cache_key, data, settings.CATEGORY_BREAKDOWN_CACHE_SECONDS)
+    
+    return data
 
 
 """
@@ -196,6 +362,11 @@ def restore_account_book_category(
     """
     user = request.auth
 
+    """
+    보관 테이블로 이동된 카테고리라면 hot 테이블로 복원
+    """
+    restore_archived_category(account_book_category_id, user)
+
     """
     가계부 카테고리 객체/유저정보 확인
     """
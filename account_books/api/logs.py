@@ -1,16 +1,29 @@
 from ninja import Router
 
-from typing import Optional
+from typing   import Optional
+from datetime import date
 
+from django.conf      import settings
 from django.http      import HttpRequest, JsonResponse
 from django.db.models import Q, Sum
 
 from core.schema                    import ErrorMessage
 from core.utils.auth                import AuthBearer
 from core.utils.get_obj_n_check_err import GetAccountBook, GetAccountBookCategory, GetAccountBookLog
-
-from account_books.schema import AccountBookLogCreateInput, AccountBookLogUpdateInput, AccountBookLogCreateUpdateOutput, AccountBookLogListOutput
-from account_books.models import AccountBookLog
+from core.utils.archive             import restore_archived_log
+from core.fields                    import get_enum_value
+from core.utils.log_filter          import LOG_SORT_SET, get_log_filter, check_date_range, check_status, check_log_types, parse_ids
+from core.utils.cursor              import encode_cursor, decode_cursor, get_cursor_filter
+from core.utils.series              import SERIES_INTERVALS, SERIES_MAX_BUCKETS, get_series_period, get_bucket_count, get_log_series
+from core.utils.analytics           import STATS_MAX_DAYS, STATS_DEFAULT_WINDOW, STATS_MAX_WINDOW, get_stats_period, get_ledger, get_log_stats
+from core.utils.fieldset            import parse_fields, apply_fieldset, serialize_fieldset, fieldset_response
+
+from account_books.schema import AccountBookLogCreateInput, AccountBookLogUpdateInput, AccountBookLogCreateUpdateOutput, AccountBookLogListOutput,\
+                                 AccountBookLogFeedOutput, AccountBookLogSeriesOutput, AccountBookLogStatsOutput, AccountBookLogOutput,\
+                                 ACCOUNT_BOOK_LOG_OUTPUT_COLUMNS
+from account_books.models import AccountBookLog, AccountBookCategory
+from core.schema          import JobOutput
+from core.jobs            import enqueue_job
 
 
 router = Router()
@@ -23,7 +36,7 @@ router = Router()
     '',
     tags     = ['4. 가계부 기록'],
     summary  = '가계부 기록 리스트 조회',
-    response = AccountBookLogListOutput,
+    response = {200: AccountBookLogListOutput, 400: ErrorMessage},
     auth     = AuthBearer()
 )
 def get_list_account_book_log(
@@ -32,8 +45,11 @@ def get_list_account_book_log(
     cateogry_id: Optional[str] = None,
     search     : Optional[str] = None,
     types      : Optional[str] = None,
+    date_from  : Optional[date] = None,
+    date_to    : Optional[date] = None,
     sort       : str = 'up_to_date',
     status     : str = 'deleted',
+    fields     : Optional[str] = None,
     offset     : int = 0,
     limit      : int = 10
     ) -> JsonResponse:
@@ -42,16 +58,20 @@ def get_list_account_book_log(
     JWT 토큰에서 유저정보 추출
     """
     user = request.auth
-
+    
     """
-    정렬 기준
+    조회 개수(1개 이상, 최대 조회 개수 이하)/시작 위치(0 이상) 제한
     """
-    sort_set = {
-        'up_to_date' : '-created_at',
-        'out_of_date': 'created_at',
-        'high_price' : '-price',
-        'low_price'  : 'price',    
-    }
+    limit  = max(min(limit, settings.API_MAX_LIST_LIMIT), 1)
+    offset = max(offset, 0)
+    
+    """
+    조회 필드 확인(sparse fieldset)
+    """
+    if fields:
+        names, err = parse_fields(fields, AccountBookLogOutput)
+        if err:
+            return JsonResponse({'detail': err}, status=400)
     
     """
     가계부 id 필수값 확인
@@ -60,6 +80,27 @@ def get_list_account_book_log(
     if not account_book_id:
         return JsonResponse({'detail': '가계부는 필수 입력값입니다.'}, status=400)
     
+    """
+    조회 기간 확인
+    """
+    err = check_date_range(date_from, date_to)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    가계부 기록 타입/제외할 상태값 확인
+    """
+    err = check_log_types(types) or check_status(AccountBookLog, status)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    카테고리 id 목록 확인
+    """
+    _, err = parse_ids(cateogry_id)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
     """
     가계부 객체/유저정보 확인
     """
@@ -69,35 +110,28 @@ def get_list_account_book_log(
     
     """
     Q 객체 활용:
-        - 검색 기능(가계부 기록 제목/설명/카테고리를 기준으로 검색 필터링)
-        - 필터링 기능(가계부 기록 카테고리/타입을 기준으로 필터링)
+        - 검색/필터링 기능(가계부 기록 제목/설명/카테고리 검색, 카테고리/타입/기간 필터링)
         - 필터링 기능(본인의 가계부 기록 필터링)
+        - 기간 필터링은 기록 리스트와 총수입/총지출 산출에 모두 적용((book, occurred_at) 인덱스 사용)
     """
-    q = Q()
+    q = get_log_filter(search, cateogry_id, types, date_from, date_to)
     
-    if search:
-        q |= Q(title__icontains = search)
-        q |= Q(description__icontains = search)
-        q |= Q(category__name__icontains = search)
     if account_book_id:
         q &= Q(book_id = book.id)
-    if cateogry_id:
-        categories = cateogry_id.split(',')
-        q &= Q(category_id__in = categories)
-    if types:
-        q &= Q(types__iexact = types)
         
     logs = AccountBookLog.objects\
                          .select_related('category', 'book')\
                          .filter(q)\
-                         .exclude(status__iexact=status)\
-                         .order_by(sort_set[sort])
+                         .exclude(status=get_enum_value(AccountBookLog, 'status', status))\
+                         .order_by(LOG_SORT_SET[sort])
     
     """
-    총수입/총지출 기록 산출
+    총수입/총지출 기록 산출(하나의 집계 쿼리로 산출)
     """                      
-    income      = logs.filter(types='income').aggregate(total=Sum('price'))
-    expenditure = logs.filter(types='expenditure').aggregate(total=Sum('price'))
+    totals = logs.aggregate(
+        total_income      = Sum('price', filter=Q(types='income')),
+        total_expenditure = Sum('price', filter=Q(types='expenditure'))
+    )
     
     """
     가계부 기록 반환 데이터(페이지네이션 기능 포함)
@@ -105,14 +139,321 @@ def get_list_account_book_log(
     data = {
         'nickname'         : user.nickname,
         'expected_budget'  : book.budget,
-        'total_income'     : income['total'],
-        'total_expenditure': expenditure['total'],
-        'logs'             : list(logs)[offset:offset+limit]
+        'total_income'     : totals['total_income'],
+        'total_expenditure': totals['total_expenditure']
+    }
+    
+    """
+    요청한 필드만 조회/반환
+    """
+    if fields:
+        logs         = apply_fieldset(logs, names, ACCOUNT_BOOK_LOG_OUTPUT_COLUMNS)
+        data         = AccountBookLogListOutput(**data).dict(exclude={'logs'})
+        data['logs'] = serialize_fieldset(logs[offset:offset+limit], AccountBookLogOutput, names)
+        return fieldset_response(data)
+    
+    data['logs'] = list(logs[offset:offset+limit])
+    
+    return data
+
+
+"""
+가계부 기록 통합 피드 조회 API
+"""
+@router.get(
+    '/feed',
+    tags     = ['4. 가계부 기록'],
+    summary  = '가계부 기록 통합 피드 조회(전체 가계부)',
+    response = {200: AccountBookLogFeedOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_feed_account_book_log(
+    request    : HttpRequest,
+    book_ids   : Optional[str] = None,
+    category_id: Optional[str] = None,
+    search     : Optional[str] = None,
+    types      : Optional[str] = None,
+    date_from  : Optional[date] = None,
+    date_to    : Optional[date] = None,
+    sort       : str = 'up_to_date',
+    status     : str = 'deleted',
+    cursor     : Optional[str] = None,
+    limit      : int = 10
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    조회 개수 제한(1개 이상, 최대 조회 개수 이하)
+    """
+    limit = max(min(limit, settings.API_MAX_LIST_LIMIT), 1)
+    
+    if sort not in LOG_SORT_SET:
+        return JsonResponse({'detail': f'{sort}은/는 올바른 정렬 기준이 아닙니다.'}, status=400)
+    order_field = LOG_SORT_SET[sort]
+    
+    """
+    조회 기간 확인
+    """
+    err = check_date_range(date_from, date_to)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    가계부 기록 타입/제외할 상태값 확인
+    """
+    err = check_log_types(types) or check_status(AccountBookLog, status)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    가계부/카테고리 id 목록 확인
+    """
+    book_id_list, err = parse_ids(book_ids)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    _, err = parse_ids(category_id)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    Q 객체 활용:
+        - 검색/필터링 기능(가계부 기록 제목/설명/카테고리 검색, 카테고리/타입/기간 필터링)
+        - 필터링 기능(본인의 가계부 기록 필터링, 기록의 유저정보 컬럼 사용)
+        - 필터링 기능(가계부 id 목록을 기준으로 필터링)
+    """
+    q = get_log_filter(search, category_id, types, date_from, date_to)
+    q &= Q(user_id = user.id)
+    
+    if book_id_list:
+        q &= Q(book_id__in = book_id_list)
+    
+    """
+    keyset 페이지네이션:
+        - (정렬 컬럼, id) 기준으로 커서 이후의 기록만 조회(offset 미사용)
+    """
+    if cursor:
+        position, err = decode_cursor(cursor, AccountBookLog, order_field)
+        if err:
+            return JsonResponse({'detail': err}, status=400)
+        q &= get_cursor_filter(*position, order_field)
+    
+    id_order = '-id' if order_field.startswith('-') else 'id'
+    
+    logs = AccountBookLog.objects\
+                         .select_related('category', 'book')\
+                         .filter(q)\
+                         .exclude(status=get_enum_value(AccountBookLog, 'status', status))\
+                         .exclude(book__status='deleted')\
+                         .order_by(order_field, id_order)[:limit+1]
+    logs = list(logs)
+    
+    """
+    다음 페이지 존재 여부 확인(limit+1개 조회)
+    """
+    next_cursor = None
+    if len(logs) > limit:
+        logs        = logs[:limit]
+        next_cursor = encode_cursor(logs[-1], order_field)
+    
+    data = {
+        'nickname'   : user.nickname,
+        'next_cursor': next_cursor,
+        'logs'       : logs
     }
     
     return data
     
 
+"""
+가계부 기록 시계열 조회 API
+"""
+@router.get(
+    '/series',
+    tags     = ['4. 가계부 기록'],
+    summary  = '가계부 기록 구간별(일/주/월) 수입/지출 조회',
+    response = {200: AccountBookLogSeriesOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_series_account_book_log(
+    request    : HttpRequest,
+    interval   : str = 'day',
+    book_id    : Optional[int] = None,
+    category_id: Optional[str] = None,
+    types      : Optional[str] = None,
+    date_from  : Optional[date] = None,
+    date_to    : Optional[date] = None
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    집계 단위/조회 기간 확인
+    """
+    if interval not in SERIES_INTERVALS:
+        return JsonResponse({'detail': f'{interval}은/는 올바른 집계 단위가 아닙니다.'}, status=400)
+    
+    date_from, date_to, err = get_series_period(interval, date_from, date_to)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    err = check_date_range(date_from, date_to)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    if get_bucket_count(date_from, date_to, interval) > SERIES_MAX_BUCKETS:
+        return JsonResponse({'detail': f'조회 구간은 최대 {SERIES_MAX_BUCKETS}개까지 가능합니다.'}, status=400)
+    
+    """
+    가계부 기록 타입 확인
+    """
+    err = check_log_types(types)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    카테고리 id 목록 확인
+    """
+    _, err = parse_ids(category_id)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    Q 객체 활용:
+        - 필터링 기능(본인의 사용중인 기록, 가계부/카테고리/타입을 기준으로 필터링)
+    """
+    q = get_log_filter(category_id=category_id, types=types)
+    q &= Q(user_id=user.id, status='in_use')
+    
+    if book_id:
+        book, err = GetAccountBook.get_book_n_check_error(book_id, user)
+        if err:
+            return JsonResponse({'detail': err}, status=400)
+        q &= Q(book_id=book.id)
+    else:
+        q &= ~Q(book__status='deleted')
+    
+    return get_log_series(q, interval, date_from, date_to)
+
+
+"""
+가계부 기록 통계 조회 API
+    - 유저의 기록을 배열로 적재(캐시)하여 중앙값/백분위수/이동평균/지출 속도를 카테고리별로 산출
+"""
+@router.get(
+    '/stats',
+    tags     = ['4. 가계부 기록'],
+    summary  = '가계부 기록 카테고리별 통계(중앙값/백분위수/이동평균/지출 속도) 조회',
+    response = {200: AccountBookLogStatsOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_stats_account_book_log(
+    request    : HttpRequest,
+    book_id    : Optional[int] = None,
+    category_id: Optional[str] = None,
+    types      : str = 'expenditure',
+    date_from  : Optional[date] = None,
+    date_to    : Optional[date] = None,
+    window     : int = STATS_DEFAULT_WINDOW
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    가계부 기록 타입/조회 기간/이동평균 기간 확인
+    """
+    log_types = get_enum_value(AccountBookLog, 'types', types)
+    if not log_types:
+        return JsonResponse({'detail': f'{types}은/는 올바른 가계부 기록 타입이 아닙니다.'}, status=400)
+    
+    date_from, date_to, err = get_stats_period(date_from, date_to)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    err = check_date_range(date_from, date_to)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    if (date_to - date_from).days + 1 > STATS_MAX_DAYS:
+        return JsonResponse({'detail': f'조회 기간은 최대 {STATS_MAX_DAYS}일까지 가능합니다.'}, status=400)
+    if not 1 <= window <= STATS_MAX_WINDOW:
+        return JsonResponse({'detail': f'이동평균 기간은 1일 이상 {STATS_MAX_WINDOW}일 이하여야 합니다.'}, status=400)
+    
+    """
+    카테고리/가계부 확인
+    """
+    category_ids, err = parse_ids(category_id)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    if book_id:
+        book, err = GetAccountBook.get_book_n_check_error(book_id, user)
+        if err:
+            return JsonResponse({'detail': err}, status=400)
+    
+    """
+    통계 산출(기록 배열은 유저별로 캐시되며, 가계부/카테고리/기록 변경 시 무효화)
+    """
+    data = get_log_stats(
+        get_ledger(user.id),
+        types        = log_types,
+        date_from    = date_from,
+        date_to      = date_to,
+        window       = window,
+        book_id      = book_id,
+        category_ids = category_ids
+    )
+    
+    names = dict(
+        AccountBookCategory.objects\
+                           .filter(id__in=[item['category_id'] for item in data['categories'] if item['category_id']])\
+                           .values_list('id', 'name')
+    )
+    for item in data['categories']:
+        item['category'] = names.get(item['category_id'])
+    
+    return data
+
+
+"""
+가계부 기록 내보내기 API
+    - CSV 파일 생성은 작업 큐에서 실행되며, 작업 상태/결과는 /jobs/{job_id} API로 조회
+"""
+@router.post(
+    '/export',
+    tags     = ['4. 가계부 기록'],
+    summary  = '가계부 기록 CSV 내보내기(작업 등록)',
+    response = {200: JobOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def export_account_book_log(
+    request: HttpRequest,
+    book_id: int
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    가계부 객체/유저정보 확인
+    """
+    book, err = GetAccountBook.get_book_n_check_error(book_id, user)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    return enqueue_job('export_account_book_logs', {'book_id': book.id}, user=user)
+
+
 """
 가계부 기록 생성 API
 """
@@ -151,12 +492,16 @@ def create_account_book_log(
     types = data.types
     if not types:
         return JsonResponse({'detail': '가계부 기록 타입은 필수 입력값입니다.'}, status=400)
+    err = check_log_types(types)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
     price = data.price
     if price is None:
         return JsonResponse({'detail': '가계부 기록 가격은 필수 입력값입니다.'}, status=400)
     description = data.description
     if not description:
         return JsonResponse({'detail': '가계부 기록 설명은 필수 입력값입니다.'}, status=400)
+    occurred_at = data.occurred_at or date.today()
     
     """
     가계부 객체/유저정보 확인
@@ -174,12 +519,14 @@ def create_account_book_log(
     
     log = AccountBookLog.objects\
                         .create(
+                            user        = user,
                             book        = book,
                             category    = category,
                             title       = title,
                             price       = price,
                             description = description,
-                            types       = types               
+                            types       = get_enum_value(AccountBookLog, 'types', types),
+                            occurred_at = occurred_at
                         ) 
     return log    
 
@@ -219,7 +566,10 @@ def update_account_book_log(
         return JsonResponse({'detail': '가계부 카테고리는 필수 입력값입니다.'}, status=400)
     if not account_book_log_id:
         return JsonResponse({'detail': '가계부 기록은 필수 입력값입니다.'}, status=400)
-
+    err = check_log_types(data.types)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
     """
     가계부 객체/유저정보 확인
     """
@@ -244,11 +594,13 @@ def update_account_book_log(
     if data.title:
         log.title = data.title
     if data.types:
-        log.types = data.types
-    if data.price is None:
+        log.types = get_enum_value(AccountBookLog, 'types', data.types)
+    if data.price is not None:
         log.price = data.price
     if data.description:
         log.description = data.description
+    if data.occurred_at:
+        log.occurred_at = data.occurred_at
     if data.category_id:
         log.category = category
 
@@ -349,6 +701,11 @@ def restore_account_book_log(
     if err:
         return JsonResponse({'detail': err}, status=400)
 
+    """
+    보관 테이블로 이동된 가계부 기록이라면 hot 테이블로 복원
+    """
+    restore_archived_log(account_book_log_id, book)
+
     """
     가계부 기록 객체/유저정보 확인
     """
@@ -0,0 +1,198 @@
+from ninja import Router
+
+from typing   import Optional, List
+from datetime import date, timedelta
+
+from django.conf      import settings
+from django.http      import HttpRequest, JsonResponse
+from django.db        import transaction
+
+from core.fields                    import get_enum_value
+from core.schema                    import ErrorMessage
+from core.utils.auth                import AuthBearer
+from core.utils.get_obj_n_check_err import GetAccountBook, GetAccountBookCategory, GetAccountBookRecurringLog
+from core.utils.recurrence          import RECURRING_RULES, get_due_dates, materialize_recurring_logs
+from core.utils.log_filter          import check_status, check_log_types
+from core.jobs                      import enqueue_job
+
+from account_books.schema import AccountBookRecurringLogCreateInput, AccountBookRecurringLogOutput
+from account_books.models import AccountBookRecurringLog
+
+
+router = Router()
+
+
+"""
+가계부 반복 기록 조회 API
+"""
+@router.get(
+    '',
+    tags     = ['5. 가계부 반복 기록'],
+    summary  = '가계부 반복 기록 리스트 조회',
+    response = {200: List[AccountBookRecurringLogOutput], 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_list_account_book_recurring_log(
+    request: HttpRequest,
+    book_id: Optional[int] = None,
+    status : str = 'deleted',
+    offset : int = 0,
+    limit  : int = 10
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    조회 개수(1개 이상, 최대 조회 개수 이하)/시작 위치(0 이상) 제한
+    """
+    limit  = max(min(limit, settings.API_MAX_LIST_LIMIT), 1)
+    offset = max(offset, 0)
+    
+    """
+    제외할 상태값 확인
+    """
+    err = check_status(AccountBookRecurringLog, status)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    recurring_logs = AccountBookRecurringLog.objects\
+                                            .select_related('book', 'category')\
+                                            .filter(user=user)\
+                                            .exclude(status=get_enum_value(AccountBookRecurringLog, 'status', status))
+    if book_id:
+        recurring_logs = recurring_logs.filter(book_id=book_id)
+    
+    return recurring_logs.order_by('-created_at')[offset:offset+limit]
+
+
+"""
+가계부 반복 기록 생성 API
+"""
+@router.post(
+    '',
+    tags     = ['5. 가계부 반복 기록'],
+    summary  = '가계부 반복 기록 생성',
+    response = {200: AccountBookRecurringLogOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def create_account_book_recurring_log(
+    request: HttpRequest,
+    data   : AccountBookRecurringLogCreateInput
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    필수값 확인:
+        - 가계부 id
+        - 가계부 카테고리 id
+        - 반복 기록 제목/타입/가격/반복 주기
+    """
+    if not data.book_id:
+        return JsonResponse({'detail': '가계부는 필수 입력값입니다.'}, status=400)
+    if not data.category_id:
+        return JsonResponse({'detail': '가계부 카테고리는 필수 입력값입니다.'}, status=400)
+    if not data.title:
+        return JsonResponse({'detail': '가계부 기록 제목은 필수 입력값입니다.'}, status=400)
+    if not data.types:
+        return JsonResponse({'detail': '가계부 기록 타입은 필수 입력값입니다.'}, status=400)
+    err = check_log_types(data.types)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    if data.price is None:
+        return JsonResponse({'detail': '가계부 기록 가격은 필수 입력값입니다.'}, status=400)
+    if data.rule not in RECURRING_RULES:
+        return JsonResponse({'detail': f'{data.rule}은/는 올바른 반복 주기가 아닙니다.'}, status=400)
+    
+    """
+    반복 기간 확인(시작일은 최대 RECURRING_MAX_BACKFILL_DAYS일 전까지)
+    """
+    today      = date.today()
+    start_date = data.start_date or today
+    if start_date < today - timedelta(days=settings.RECURRING_MAX_BACKFILL_DAYS):
+        return JsonResponse({'detail': f'반복 시작일은 최대 {settings.RECURRING_MAX_BACKFILL_DAYS}일 전까지 가능합니다.'}, status=400)
+    if data.end_date and data.end_date < start_date:
+        return JsonResponse({'detail': '반복 종료일은 시작일보다 이전일 수 없습니다.'}, status=400)
+    
+    """
+    가계부 객체/유저정보 확인
+    """
+    book, err = GetAccountBook.get_book_n_check_error(data.book_id, user)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    가계부 카테고리 객체/유저정보 확인
+    """
+    category, err = GetAccountBookCategory.get_category_n_check_error(data.category_id, user)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    """
+    반복 기록 생성 및 이미 도래한 거래일자(시작일이 과거인 경우)의 기록 생성
+        - 생성할 기록이 RECURRING_SYNC_BACKFILL_LIMIT개 이하: 요청에서 바로 생성
+        - 초과: 작업 큐에서 생성(반복 기록 생성과 같은 트랜잭션에서 작업 추가)
+    """
+    with transaction.atomic():
+        recurring_log = AccountBookRecurringLog.objects\
+                                               .create(
+                                                   user          = user,
+                                                   book          = book,
+                                                   category      = category,
+                                                   title         = data.title,
+                                                   price         = data.price,
+                                                   description   = data.description,
+                                                   types         = get_enum_value(AccountBookRecurringLog, 'types', data.types),
+                                                   rule          = data.rule,
+                                                   start_date    = start_date,
+                                                   end_date      = data.end_date,
+                                                   next_run_date = start_date
+                                               )
+        if len(get_due_dates(recurring_log, today)) <= settings.RECURRING_SYNC_BACKFILL_LIMIT:
+            materialize_recurring_logs([recurring_log], today)
+        else:
+            enqueue_job('materialize_recurring_logs', {'recurring_log_id': recurring_log.id}, user=user)
+    
+    return recurring_log
+
+
+"""
+가계부 반복 기록 삭제 API
+"""
+@router.delete(
+    '/{int:account_book_recurring_log_id}',
+    tags     = ['5. 가계부 반복 기록'],
+    summary  = '가계부 반복 기록 삭제(이미 생성된 기록은 유지)',
+    response = {204: None, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def delete_account_book_recurring_log(
+    request: HttpRequest,
+    account_book_recurring_log_id: int
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    반복 기록 객체/유저정보 확인
+    """
+    recurring_log, err = GetAccountBookRecurringLog.get_recurring_log_n_check_error(account_book_recurring_log_id, user)
+    if err:
+        return JsonResponse({'detail': err}, status=400)
+    
+    if recurring_log.status == 'deleted':
+        return JsonResponse({'detail': f'가계부 반복 기록 {account_book_recurring_log_id}(id)는 이미 삭제된 상태입니다.'}, status=400)
+    
+    recurring_log.status = 'deleted'
+    recurring_log.save()
+    
+    return 204, None
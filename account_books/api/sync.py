@@ -0,0 +1,109 @@
+from ninja import Router
+
+from typing   import Optional
+from datetime import timedelta
+
+from django.conf  import settings
+from django.http  import HttpRequest, JsonResponse
+from django.utils import timezone
+
+from core.schema       import ErrorMessage
+from core.utils.auth   import AuthBearer
+from core.utils.cursor import encode_sync_cursor, decode_sync_cursor, get_cursor_filter
+
+from account_books.schema import AccountBookSyncListOutput
+from account_books.models import AccountBook, AccountBookCategory, AccountBookLog
+
+
+router = Router()
+
+
+"""
+변경분 동기화 대상 모델(응답 필드명 - 모델)
+"""
+SYNC_MODELS = {
+    'books'     : AccountBook,
+    'categories': AccountBookCategory,
+    'logs'      : AccountBookLog,
+}
+
+
+"""
+가계부 변경분 동기화 API
+"""
+@router.get(
+    '',
+    tags     = ['7. 가계부 동기화'],
+    summary  = '가계부/카테고리/기록 변경분 조회',
+    response = {200: AccountBookSyncListOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_account_book_sync(
+    request: HttpRequest,
+    cursor : Optional[str] = None,
+    limit  : int = 100
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    조회 개수 제한(모델별, 1개 이상, 최대 조회 개수 이하)
+    """
+    limit = max(min(limit, settings.API_MAX_LIST_LIMIT), 1)
+    now   = timezone.now()
+    
+    """
+    커서 확인
+        - 커서가 없다면 전체 데이터를 처음부터 조회(최초 동기화)
+        - 커서 발급 이후 보관 기간이 지났다면 삭제된 데이터가 cold 테이블로 이동했을 수 있으므로
+          reset을 반환하고 전체 데이터를 처음부터 다시 조회
+    """
+    positions, reset = {}, False
+    if cursor:
+        position, err = decode_sync_cursor(cursor)
+        if err:
+            return JsonResponse({'detail': err}, status=400)
+        
+        positions, synced_at = position
+        if synced_at < now - timedelta(days=settings.ARCHIVE_RETENTION_DAYS):
+            positions, reset = {}, True
+    
+    """
+    모델별로 (수정일자, id) 순서로 커서 이후의 변경분 조회
+        - 삭제(status='deleted') 처리된 데이터도 포함하여 클라이언트에서 삭제를 반영할 수 있도록 함
+        - 수정일자는 커밋 시각이 아닌 저장 시각이므로 긴 트랜잭션(일괄 처리, 반복 기록 생성, 보관 데이터 복원 등)이
+          발급된 커서보다 이전 수정일자로 커밋될 수 있음
+            - 커서는 SYNC_SAFETY_LAG_SECONDS 이전(horizon)까지의 변경분으로만 진행
+            - horizon 이전 변경분: limit+1개를 조회하여 다음 페이지 존재 여부 확인
+            - horizon 이후 변경분: horizon 이전 변경분을 모두 반환한 페이지에 남은 개수만큼 포함하되 커서는 진행하지 않음
+              (다음 요청에서 다시 반환되므로 클라이언트는 id 기준으로 반영)
+    """
+    horizon          = now - timedelta(seconds=settings.SYNC_SAFETY_LAG_SECONDS)
+    output, has_more = {}, False
+    for name, model in SYNC_MODELS.items():
+        objs = model.objects.filter(user_id=user.id)
+        if name in positions:
+            objs = objs.filter(get_cursor_filter(*positions[name], 'updated_at'))
+        
+        settled = list(objs.filter(updated_at__lte=horizon).order_by('updated_at', 'id')[:limit+1])
+        if len(settled) > limit:
+            settled, has_more = settled[:limit], True
+        
+        if settled:
+            positions[name] = (settled[-1].updated_at, settled[-1].id)
+        
+        recent = []
+        if len(settled) < limit:
+            recent = list(objs.filter(updated_at__gt=horizon).order_by('updated_at', 'id')[:limit-len(settled)])
+        
+        output[name] = settled + recent
+    
+    return {
+        'cursor'  : encode_sync_cursor(positions, now),
+        'has_more': has_more,
+        'reset'   : reset,
+        **output
+    }
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AccountBooksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'account_books'
+
+    def ready(self):
+        import account_books.signals
+        import account_books.jobs
@@ -0,0 +1,74 @@
+from typing import Iterable, Optional
+
+from django.db.models           import Q, Sum, Value, BigIntegerField
+from django.db.models.functions import Coalesce
+
+from account_books.models import AccountBook
+from core.utils.pubsub    import broker
+
+
+"""
+description:
+    - 가계부 잔액(예산/총수입/총지출) 변경 이벤트 발행
+    - 기록이 변경되면 트랜잭션 커밋 이후 해당 가계부의 합계를 다시 계산하여 유저 채널로 발행
+"""
+
+USER_CHANNEL = 'account_books:user:{user_id}'
+
+
+def get_user_channel(user_id: int) -> str:
+    return USER_CHANNEL.format(user_id=user_id)
+
+
+def get_book_balances(user_id: int, book_ids: Optional[Iterable[int]] = None) -> list:
+    """
+    가계부별 예산/총수입/총지출을 하나의 GROUP BY 쿼리로 집계
+    """
+    def total(types):
+        return Coalesce(
+            Sum('logs__price', filter=Q(logs__status='in_use', logs__types=types)),
+            Value(0),
+            output_field = BigIntegerField()
+        )
+    
+    books = AccountBook.objects\
+                       .filter(user_id=user_id)\
+                       .exclude(status='deleted')\
+                       .annotate(
+                           total_income      = total('income'),
+                           total_expenditure = total('expenditure')
+                       )\
+                       .values('id', 'name', 'budget', 'total_income', 'total_expenditure')
+    if book_ids is not None:
+        books = books.filter(id__in=book_ids)
+    
+    return [
+        {
+            'book_id'          : book['id'],
+            'name'             : book['name'],
+            'budget'           : str(book['budget']),
+            'total_income'     : str(book['total_income']),
+            'total_expenditure': str(book['total_expenditure']),
+        }
+        for book in books
+    ]
+
+
+def publish_book_balances(user_id: int, book_ids: Iterable[int]) -> None:
+    """
+    description:
+        - 가계부 잔액 변경 이벤트 발행(삭제된 가계부는 deleted 이벤트로 발행)
+        - 구독중인 연결이 없다면 집계 쿼리를 실행하지 않음
+    """
+    channel = get_user_channel(user_id)
+    if not broker.has_subscribers(channel):
+        return
+    
+    book_ids = set(book_ids)
+    balances = get_book_balances(user_id, book_ids)
+    
+    for balance in balances:
+        broker.publish(channel, {'event': 'balance', 'data': balance})
+    
+    for book_id in book_ids - {balance['book_id'] for balance in balances}:
+        broker.publish(channel, {'event': 'deleted', 'data': {'book_id': book_id}})
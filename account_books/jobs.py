@@ -0,0 +1,72 @@
+import csv, io, tempfile
+
+from datetime import date
+
+from django.core.files      import File
+from django.core.management import call_command
+from django.db              import transaction
+
+from account_books.models  import AccountBookLog, AccountBookRecurringLog
+from core.jobs             import register_job, job_file_storage
+from core.utils.recurrence import materialize_recurring_logs
+
+
+"""
+가계부 기록 CSV 내보내기 작업
+    - CSV는 임시 파일에 기록한 뒤 작업 결과 파일 저장소에 저장하고, 작업 결과에는 파일 이름만 저장
+      (파일은 /jobs/{job_id}/file API로 다운로드)
+"""
+@register_job('export_account_book_logs')
+def export_account_book_logs(payload: dict, job) -> dict:
+    logs = AccountBookLog.objects\
+                         .filter(user_id=job.user_id, book_id=payload['book_id'])\
+                         .exclude(status='deleted')\
+                         .order_by('occurred_at', 'id')\
+                         .values_list('occurred_at', 'title', 'types', 'price', 'category__name', 'description')
+    
+    with tempfile.TemporaryFile() as f:
+        output = io.TextIOWrapper(f, encoding='utf-8', newline='')
+        writer = csv.writer(output)
+        writer.writerow(['occurred_at', 'title', 'types', 'price', 'category', 'description'])
+        
+        rows = 0
+        for row in logs.iterator(chunk_size=2000):
+            writer.writerow(row)
+            rows += 1
+        
+        output.flush()
+        f.seek(0)
+        name = job_file_storage.save(f'exports/job-{job.id}.csv', File(f))
+        output.detach()
+    
+    return {
+        'content_type': 'text/csv',
+        'rows'        : rows,
+        'file'        : name
+    }
+
+
+"""
+삭제된 레코드 보관처리 작업
+"""
+@register_job('archive_deleted_records')
+def archive_deleted_records(payload: dict, job) -> dict:
+    output = io.StringIO()
+    call_command('archive_deleted_records', stdout=output, **payload)
+    return {'output': output.getvalue()}
+
+
+"""
+반복 기록의 지난 거래일자 기록 생성 작업(생성 요청에서 바로 생성하기에는 기록이 많은 경우)
+"""
+@register_job('materialize_recurring_logs')
+def materialize_recurring_log(payload: dict, job) -> dict:
+    with transaction.atomic():
+        recurring_logs = list(
+            AccountBookRecurringLog.objects\
+                                   .select_for_update()\
+                                   .filter(id=payload['recurring_log_id'], status='in_use')
+        )
+        created = materialize_recurring_logs(recurring_logs, date.today())
+    
+    return {'created': created}
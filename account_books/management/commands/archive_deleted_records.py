@@ -0,0 +1,120 @@
+import time
+
+from datetime import datetime, timedelta
+
+from django.conf                 import settings
+from django.core.management.base import BaseCommand
+from django.db                   import transaction
+from django.db.models            import Exists, OuterRef
+
+from account_books.models import AccountBook, AccountBookCategory, AccountBookLog
+from core.utils.archive   import archive_records
+
+
+class Command(BaseCommand):
+    
+    """
+    description:
+        - 삭제(status='deleted') 후 보관기간이 지난 레코드를 cold 테이블로 이동
+        - 배치 단위로 트랜잭션을 커밋하므로, 중단 후 재실행하면 남은 레코드부터 이어서 처리
+        - 배치 사이에 sleep을 두어 운영 DB 부하를 조절
+    
+    usage:
+        python manage.py archive_deleted_records --days 90 --batch-size 500 --sleep 0.5
+    """
+    
+    help = '삭제 후 보관기간이 지난 가계부/카테고리/기록을 보관 테이블로 이동합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ARCHIVE_RETENTION_DAYS)
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--sleep', type=float, default=0.5)
+        parser.add_argument('--max-batches', type=int, default=None)
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        self.batch_size  = options['batch_size']
+        self.sleep       = options['sleep']
+        self.max_batches = options['max_batches']
+        self.dry_run     = options['dry_run']
+        self.batches     = 0
+        
+        cutoff = datetime.now() - timedelta(days=options['days'])
+        
+        """
+        보관 순서:
+            - 기록 -> 가계부(가계부의 기록 포함) -> 카테고리
+            - 카테고리는 hot 테이블의 기록이 참조하지 않는 경우에만 보관
+        """
+        logs = AccountBookLog.objects\
+                             .filter(status='deleted', updated_at__lt=cutoff)
+        books = AccountBook.objects\
+                           .filter(status='deleted', updated_at__lt=cutoff)
+        categories = AccountBookCategory.objects\
+                                        .filter(status='deleted', updated_at__lt=cutoff)\
+                                        .filter(~Exists(AccountBookLog.objects.filter(category_id=OuterRef('id'))))
+        
+        total_logs       = self._run(logs, self._archive_logs)
+        total_books      = self._run(books, self._archive_books)
+        total_categories = self._run(categories, self._archive_categories)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'archived - logs: {total_logs}, books: {total_books}, categories: {total_categories}'
+        ))
+
+    def _run(self, queryset, archive_batch) -> int:
+        """
+        id 기준 keyset 방식으로 배치를 순회
+        """
+        total   = 0
+        last_id = 0
+        
+        while self.max_batches is None or self.batches < self.max_batches:
+            ids = list(
+                queryset.filter(id__gt=last_id)\
+                        .order_by('id')\
+                        .values_list('id', flat=True)[:self.batch_size]
+            )
+            if not ids:
+                break
+            
+            last_id = ids[-1]
+            
+            if self.dry_run:
+                total += len(ids)
+            else:
+                with transaction.atomic():
+                    total += archive_batch(ids)
+            
+            self.batches += 1
+            self.stdout.write(f'{queryset.model.__name__}: {total} (last id: {last_id})')
+            
+            if self.sleep:
+                time.sleep(self.sleep)
+        
+        return total
+
+    def _archive_logs(self, ids) -> int:
+        return archive_records(AccountBookLog, ids)
+
+    def _archive_books(self, ids) -> int:
+        log_ids = list(
+            AccountBookLog.objects\
+                          .filter(book_id__in=ids)\
+                          .values_list('id', flat=True)
+        )
+        archive_records(AccountBookLog, log_ids)
+        return archive_records(AccountBook, ids)
+
+    def _archive_categories(self, ids) -> int:
+        """
+        배치 조회 이후 새로 생성된 기록이 카테고리를 참조할 수 있으므로 트랜잭션 안에서 다시 확인
+        """
+        ids = list(
+            AccountBookCategory.objects\
+                               .select_for_update()\
+                               .filter(id__in=ids)\
+                               .filter(~Exists(AccountBookLog.objects.filter(category_id=OuterRef('id'))))\
+                               .values_list('id', flat=True)
+        )
+        return archive_records(AccountBookCategory, ids)
@@ -0,0 +1,98 @@
+import json, random, time
+
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db                   import transaction
+from django.db.models            import Q
+
+from account_books.models import AccountBook, AccountBookCategory, AccountBookLog
+from core.utils.series    import SERIES_INTERVALS, get_log_series
+from users.models         import User
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    
+    """
+    description:
+        - 1년치 밀집 데이터(하루 N건)를 생성한 뒤 구간별 시계열 집계 시간/응답 크기를 측정
+        - 측정이 끝나면 트랜잭션을 롤백하므로 생성한 데이터는 남지 않음
+    
+    usage:
+        python manage.py benchmark_log_series --per-day 50 --repeat 5
+    """
+    
+    help = '가계부 기록 시계열 집계(일/주/월) 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=365)
+        parser.add_argument('--per-day', type=int, default=50)
+        parser.add_argument('--categories', type=int, default=10)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._benchmark(**options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def _benchmark(self, days, per_day, categories, repeat, **options):
+        user = User.objects.create_user(
+            email    = 'benchmark-series@example.com',
+            nickname = 'benchmark-series',
+            password = None
+        )
+        book = AccountBook.objects.create(user=user, name='benchmark', budget=1000000)
+        category_objs = AccountBookCategory.objects.bulk_create([
+            AccountBookCategory(user=user, name=f'category-{i}') for i in range(categories)
+        ])
+        
+        date_to   = date.today()
+        date_from = date_to - timedelta(days=days-1)
+        
+        logs = [
+            AccountBookLog(
+                user        = user,
+                book        = book,
+                category    = random.choice(category_objs),
+                title       = 'benchmark',
+                price       = random.randint(1000, 100000),
+                description = 'benchmark',
+                types       = random.choice(('income', 'expenditure')),
+                occurred_at = date_from + timedelta(days=day)
+            )
+            for day in range(days) for _ in range(per_day)
+        ]
+        started = time.perf_counter()
+        AccountBookLog.objects.bulk_create(logs, batch_size=5000)
+        self.stdout.write(f'inserted {len(logs)} logs in {time.perf_counter()-started:.2f}s')
+        
+        q = Q(user_id=user.id, status='in_use', book_id=book.id)
+        
+        for interval in SERIES_INTERVALS:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                data    = get_log_series(q, interval, date_from, date_to)
+                timings.append((time.perf_counter() - started) * 1000)
+            
+            """
+            배열 형식과 포인트별 객체 형식의 응답 크기 비교
+            """
+            compact = len(json.dumps(data))
+            points  = len(json.dumps([
+                {'bucket': bucket, 'income': income, 'expenditure': expenditure}
+                for bucket, income, expenditure in zip(data['buckets'], data['income'], data['expenditure'])
+            ]))
+            
+            self.stdout.write(
+                f'{interval:>5}: buckets={len(data["buckets"]):>4} '
+                f'min={min(timings):.1f}ms avg={sum(timings)/len(timings):.1f}ms '
+                f'payload={compact}B (per-point objects: {points}B)'
+            )
@@ -0,0 +1,121 @@
+import random, statistics, time
+
+from collections import defaultdict
+from datetime    import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db                   import transaction
+
+from account_books.models import AccountBook, AccountBookCategory, AccountBookLog
+from core.utils.analytics import STATS_DEFAULT_WINDOW, load_ledger, get_log_stats
+from users.models         import User
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+
+    """
+    description:
+        - 1년치 밀집 데이터(하루 N건)를 생성한 뒤 카테고리별 통계(중앙값/백분위수/이동평균) 산출 시간 비교
+            - orm  : ORM 객체를 조회하여 파이썬 반복문으로 산출
+            - load : 기록을 배열(ledger)로 적재(캐시 miss 시 비용)
+            - numpy: 적재된 배열로 산출(캐시 hit 시 비용)
+        - 측정이 끝나면 트랜잭션을 롤백하므로 생성한 데이터는 남지 않음
+    
+    usage:
+        python manage.py benchmark_log_stats --per-day 50 --repeat 5
+    """
+    
+    help = '가계부 기록 카테고리별 통계(ORM 반복문/NumPy 배열) 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=365)
+        parser.add_argument('--per-day', type=int, default=50)
+        parser.add_argument('--categories', type=int, default=10)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._benchmark(**options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def _benchmark(self, days, per_day, categories, repeat, **options):
+        user = User.objects.create_user(
+            email    = 'benchmark-stats@example.com',
+            nickname = 'benchmark-stats',
+            password = None
+        )
+        book = AccountBook.objects.create(user=user, name='benchmark', budget=1000000)
+        category_objs = AccountBookCategory.objects.bulk_create([
+            AccountBookCategory(user=user, name=f'category-{i}') for i in range(categories)
+        ])
+        
+        date_to   = date.today()
+        date_from = date_to - timedelta(days=days-1)
+        
+        logs = [
+            AccountBookLog(
+                user        = user,
+                book        = book,
+                category    = random.choice(category_objs),
+                title       = 'benchmark',
+                price       = random.randint(1000, 100000),
+                description = 'benchmark',
+                types       = random.choice(('income', 'expenditure')),
+                occurred_at = date_from + timedelta(days=day)
+            )
+            for day in range(days) for _ in range(per_day)
+        ]
+        started = time.perf_counter()
+        AccountBookLog.objects.bulk_create(logs, batch_size=5000)
+        self.stdout.write(f'inserted {len(logs)} logs in {time.perf_counter()-started:.2f}s')
+        
+        ledger = load_ledger(user.id)
+        
+        measures = {
+            'orm'  : lambda: self._orm_stats(user.id, date_from, date_to, STATS_DEFAULT_WINDOW),
+            'load' : lambda: load_ledger(user.id),
+            'numpy': lambda: get_log_stats(ledger, 'expenditure', date_from, date_to, STATS_DEFAULT_WINDOW),
+        }
+        for name, measure in measures.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                measure()
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(f'{name:>5}: min={min(timings):.1f}ms avg={sum(timings)/len(timings):.1f}ms')
+        
+        self.stdout.write(f'ledger size: {ledger.nbytes / 1024:.1f}KB ({len(ledger)} rows)')
+
+    def _orm_stats(self, user_id, date_from, date_to, window) -> dict:
+        """
+        비교 기준: ORM 객체 반복문으로 카테고리별 중앙값/백분위수/마지막 window일 일평균 산출
+        """
+        prices = defaultdict(list)
+        recent = defaultdict(int)
+        logs   = AccountBookLog.objects.filter(
+            user_id          = user_id,
+            status           = 'in_use',
+            types            = 'expenditure',
+            occurred_at__gte = date_from,
+            occurred_at__lte = date_to
+        )
+        for log in logs:
+            prices[log.category_id].append(log.price)
+            if (date_to - log.occurred_at).days < window:
+                recent[log.category_id] += log.price
+        
+        return {
+            category_id: {
+                'median'         : statistics.median(values),
+                'quantiles'      : statistics.quantiles(values, n=20, method='inclusive'),
+                'rolling_average': recent[category_id] / window,
+            }
+            for category_id, values in prices.items()
+        }
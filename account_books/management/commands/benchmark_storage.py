@@ -0,0 +1,172 @@
+import random, time
+
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db                   import connection, transaction
+
+
+class Rollback(Exception):
+    pass
+
+
+"""
+가계부 기록 테이블 컬럼 구성(변경 전: 문자열 상태/타입, numeric 가격 / 변경 후: smallint 상태/타입, bigint 가격)
+"""
+LAYOUTS = {
+    'legacy' : {'status': 'varchar(200)', 'types': 'varchar(200)', 'price': 'numeric(10, 0)'},
+    'compact': {'status': 'smallint', 'types': 'smallint', 'price': 'bigint'},
+}
+
+VALUES = {
+    'legacy' : {'status': {'in_use': 'in_use', 'deleted': 'deleted'}, 'types': {'expenditure': 'expenditure', 'income': 'income'}},
+    'compact': {'status': {'in_use': 1, 'deleted': 2}, 'types': {'expenditure': 1, 'income': 2}},
+}
+
+INSERT_BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+
+    """
+    description:
+        - 가계부 기록 테이블의 상태/타입/가격 컬럼 타입 변경 전후의 테이블/인덱스 크기, 합계(SUM) 집계 시간 비교
+        - 같은 데이터로 두 가지 컬럼 구성의 테이블을 생성하여 측정
+            - 크기: 테이블/인덱스((user_id, price, id), (status)) 크기(PostgreSQL: pg_relation_size, SQLite: dbstat)
+            - 집계: 유저별 사용중인 기록의 타입별 가격 합계(GROUP BY), 전체 가격 합계
+            - 조회: 가격 컬럼을 파이썬 값으로 가져오는 시간(numeric은 Decimal, bigint는 int로 변환)
+        - 측정이 끝나면 트랜잭션을 롤백하므로 생성한 테이블은 남지 않음
+    
+    usage:
+        python manage.py benchmark_storage --rows 200000 --repeat 5
+    """
+    
+    help = '가계부 기록 컬럼 타입(문자열/numeric -> smallint/bigint)별 저장 크기, 집계 속도 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=200000)
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._benchmark(**options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def _benchmark(self, rows, users, repeat, **options):
+        rand = random.Random(rows)
+        data = [
+            (
+                rand.randint(1, users),
+                rand.choice(['in_use'] * 9 + ['deleted']),
+                rand.choice(['expenditure'] * 3 + ['income']),
+                rand.randint(1, 5000) * 100,
+            )
+            for _ in range(rows)
+        ]
+        
+        self.stdout.write(f'{connection.vendor}, {rows:,} rows, {users} users')
+        
+        results = {}
+        with connection.cursor() as cursor:
+            for layout in LAYOUTS:
+                table = self._create_table(cursor, layout, data)
+                results[layout] = {
+                    **self._measure_size(cursor, table),
+                    **self._measure_queries(cursor, table, layout, users, repeat),
+                }
+        
+        self.stdout.write(f'  {"":<22}{"legacy":>14}{"compact":>14}{"change":>10}')
+        for key, unit in (
+            ('table', 'KB'),
+            ('indexes', 'KB'),
+            ('sum_by_user', 'ms'),
+            ('sum_all', 'ms'),
+            ('fetch_price', 'ms'),
+        ):
+            legacy, compact = results['legacy'][key], results['compact'][key]
+            if legacy is None or compact is None:
+                self.stdout.write(f'  {key + " (" + unit + ")":<22}{"-":>14}{"-":>14}')
+                continue
+            change = f'{(compact - legacy) / legacy * 100:+.1f}%' if legacy else '-'
+            self.stdout.write(f'  {key + " (" + unit + ")":<22}{legacy:>14,.1f}{compact:>14,.1f}{change:>10}')
+
+    def _create_table(self, cursor, layout, data) -> str:
+        table   = f'benchmark_storage_{layout}'
+        columns = LAYOUTS[layout]
+        values  = VALUES[layout]
+        
+        cursor.execute(
+            f'CREATE TABLE {table} ('
+            f'id integer PRIMARY KEY, user_id bigint NOT NULL, '
+            f'status {columns["status"]} NOT NULL, types {columns["types"]} NOT NULL, price {columns["price"]} NOT NULL)'
+        )
+        
+        rows = [
+            (id, user_id, values['status'][status], values['types'][types], Decimal(price) if layout == 'legacy' else price)
+            for id, (user_id, status, types, price) in enumerate(data, start=1)
+        ]
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            cursor.executemany(
+                f'INSERT INTO {table} (id, user_id, status, types, price) VALUES (%s, %s, %s, %s, %s)',
+                rows[start:start+INSERT_BATCH_SIZE]
+            )
+        
+        cursor.execute(f'CREATE INDEX {table}_user_price ON {table} (user_id, price, id)')
+        cursor.execute(f'CREATE INDEX {table}_status ON {table} (status)')
+        cursor.execute(f'ANALYZE {table}')
+        return table
+
+    def _measure_size(self, cursor, table) -> dict:
+        """
+        테이블/인덱스 크기(KB), 크기를 조회할 수 없는 DB인 경우 None
+        """
+        indexes = [f'{table}_user_price', f'{table}_status']
+        
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'SELECT pg_relation_size(%s), ' + ' + '.join(['pg_relation_size(%s)'] * len(indexes)),
+                [table, *indexes]
+            )
+            table_size, index_size = cursor.fetchone()
+            return {'table': table_size / 1024, 'indexes': index_size / 1024}
+        
+        if connection.vendor == 'sqlite':
+            try:
+                cursor.execute('SELECT name, SUM(pgsize) FROM dbstat WHERE name IN (%s, %s, %s) GROUP BY name', [table, *indexes])
+            except Exception:
+                return {'table': None, 'indexes': None}
+            sizes = dict(cursor.fetchall())
+            return {'table': sizes.get(table, 0) / 1024, 'indexes': sum(sizes.get(index, 0) for index in indexes) / 1024}
+        
+        return {'table': None, 'indexes': None}
+
+    def _measure_queries(self, cursor, table, layout, users, repeat) -> dict:
+        """
+        쿼리별 최소 실행 시간(ms)
+        """
+        in_use  = VALUES[layout]['status']['in_use']
+        queries = {
+            'sum_by_user': [
+                (f'SELECT types, SUM(price) FROM {table} WHERE user_id = %s AND status = %s GROUP BY types', [user_id, in_use])
+                for user_id in range(1, users + 1)
+            ],
+            'sum_all'    : [(f'SELECT types, SUM(price) FROM {table} WHERE status = %s GROUP BY types', [in_use])],
+            'fetch_price': [(f'SELECT price FROM {table}', [])],
+        }
+        
+        timings = {}
+        for name, statements in queries.items():
+            best = None
+            for _ in range(repeat):
+                started = time.perf_counter()
+                for sql, params in statements:
+                    cursor.execute(sql, params)
+                    cursor.fetchall()
+                elapsed = (time.perf_counter() - started) * 1000
+                best    = elapsed if best is None else min(best, elapsed)
+            timings[name] = best
+        return timings
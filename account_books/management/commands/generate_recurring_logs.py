@@ -0,0 +1,70 @@
+import time
+
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db                   import transaction
+from django.db.models            import F, Q
+
+from account_books.models import AccountBookRecurringLog
+from core.utils.recurrence import materialize_recurring_logs
+
+
+class Command(BaseCommand):
+    
+    """
+    description:
+        - 반복 기록 템플릿 중 거래일자가 도래한 템플릿의 가계부 기록을 배치 단위로 생성
+        - 실행되지 못한 기간(스케줄러 중단 등)의 기록도 함께 생성(backfill)
+        - 다음 거래일자가 종료일을 지난 템플릿(마지막 기록까지 생성 완료)은 조회하지 않음
+        - 템플릿을 select_for_update(skip_locked)로 잠그므로 여러 스케줄러가 동시에 실행되어도 중복 생성 없음
+        - --loop 옵션 사용 시 --interval(초) 간격으로 계속 실행(로컬 스케줄러)
+    
+    usage:
+        python manage.py generate_recurring_logs
+        python manage.py generate_recurring_logs --loop --interval 3600
+    """
+    
+    help = '반복 기록 템플릿으로부터 도래한 가계부 기록을 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--loop', action='store_true')
+        parser.add_argument('--interval', type=int, default=3600)
+
+    def handle(self, *args, **options):
+        while True:
+            total = self._run(options['batch_size'])
+            self.stdout.write(f'generated {total} recurring logs')
+            
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+    def _run(self, batch_size) -> int:
+        today   = date.today()
+        total   = 0
+        last_id = 0
+        
+        while True:
+            with transaction.atomic():
+                recurring_logs = list(
+                    AccountBookRecurringLog.objects\
+                                           .select_for_update(skip_locked=True, of=('self', ))\
+                                           .select_related('book')\
+                                           .filter(
+                                               Q(end_date__isnull=True) | Q(end_date__gte=F('next_run_date')),
+                                               id__gt             = last_id,
+                                               status             = 'in_use',
+                                               book__status       = 'in_use',
+                                               next_run_date__lte = today
+                                           )\
+                                           .order_by('id')[:batch_size]
+                )
+                if not recurring_logs:
+                    break
+                
+                last_id = recurring_logs[-1].id
+                total  += materialize_recurring_logs(recurring_logs, today)
+        
+        return total
@@ -0,0 +1,63 @@
+# Generated by Django 4.1.3 on 2026-10-19 21:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountBookArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('user_id', models.BigIntegerField(db_index=True)),
+                ('name', models.CharField(max_length=200)),
+                ('budget', models.DecimalField(decimal_places=0, max_digits=10)),
+                ('status', models.CharField(max_length=200)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'account_books_archive',
+            },
+        ),
+        migrations.CreateModel(
+            name='AccountBookCategoryArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('user_id', models.BigIntegerField(db_index=True)),
+                ('name', models.CharField(max_length=200)),
+                ('status', models.CharField(max_length=200)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'account_book_categories_archive',
+            },
+        ),
+        migrations.CreateModel(
+            name='AccountBookLogArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('category_id', models.BigIntegerField(null=True)),
+                ('book_id', models.BigIntegerField(db_index=True)),
+                ('title', models.CharField(max_length=200)),
+                ('price', models.DecimalField(decimal_places=0, max_digits=10)),
+                ('description', models.CharField(max_length=255, null=True)),
+                ('types', models.CharField(max_length=200)),
+                ('status', models.CharField(max_length=200)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'account_book_logs_archive',
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('account_books', '0002_archive_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accountbooklog',
+            name='user',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='accountbooklogarchive',
+            name='user_id',
+            field=models.BigIntegerField(null=True),
+        ),
+    ]
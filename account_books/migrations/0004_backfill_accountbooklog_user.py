@@ -0,0 +1,54 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+BATCH_SIZE = 5000
+
+
+def backfill_log_user(apps, schema_editor):
+    """
+    가계부 기록의 user_id를 가계부의 user_id로 채움(id 범위 단위로 나누어 업데이트)
+    """
+    AccountBook           = apps.get_model('account_books', 'AccountBook')
+    AccountBookArchive    = apps.get_model('account_books', 'AccountBookArchive')
+    AccountBookLog        = apps.get_model('account_books', 'AccountBookLog')
+    AccountBookLogArchive = apps.get_model('account_books', 'AccountBookLogArchive')
+
+    book_user = AccountBook.objects\
+                           .filter(id=OuterRef('book_id'))\
+                           .values('user_id')[:1]
+    archived_book_user = AccountBookArchive.objects\
+                                           .filter(id=OuterRef('book_id'))\
+                                           .values('user_id')[:1]
+
+    for model, subqueries in (
+        (AccountBookLog, (book_user, )),
+        (AccountBookLogArchive, (book_user, archived_book_user)),
+    ):
+        last_id = 0
+        while True:
+            ids = list(
+                model.objects\
+                     .filter(id__gt=last_id, user_id__isnull=True)\
+                     .order_by('id')\
+                     .values_list('id', flat=True)[:BATCH_SIZE]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+
+            for subquery in subqueries:
+                model.objects\
+                     .filter(id__in=ids, user_id__isnull=True)\
+                     .update(user_id=Subquery(subquery))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0003_accountbooklog_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_log_user, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('account_books', '0004_backfill_accountbooklog_user'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accountbooklog',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='accountbooklog',
+            index=models.Index(fields=['user', 'created_at'], name='account_book_logs_user_created'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.3 on 2026-10-19 21:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0005_accountbooklog_user_not_null'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accountbooklog',
+            index=models.Index(fields=['user', 'price', 'id'], name='account_book_logs_user_price'),
+        ),
+    ]
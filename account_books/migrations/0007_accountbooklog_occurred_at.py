@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0006_accountbooklog_user_price_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accountbooklog',
+            name='occurred_at',
+            field=models.DateField(null=True),
+        ),
+        migrations.AddField(
+            model_name='accountbooklogarchive',
+            name='occurred_at',
+            field=models.DateField(null=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+from django.db.models.functions import TruncDate
+
+
+BATCH_SIZE = 5000
+
+
+def backfill_occurred_at(apps, schema_editor):
+    """
+    기존 가계부 기록의 거래일자(occurred_at)를 생성일자(created_at)의 날짜로 채움
+    """
+    AccountBookLog        = apps.get_model('account_books', 'AccountBookLog')
+    AccountBookLogArchive = apps.get_model('account_books', 'AccountBookLogArchive')
+
+    for model in (AccountBookLog, AccountBookLogArchive):
+        last_id = 0
+        while True:
+            ids = list(
+                model.objects\
+                     .filter(id__gt=last_id, occurred_at__isnull=True)\
+                     .order_by('id')\
+                     .values_list('id', flat=True)[:BATCH_SIZE]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+
+            model.objects\
+                 .filter(id__in=ids)\
+                 .update(occurred_at=TruncDate('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0007_accountbooklog_occurred_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_occurred_at, migrations.RunPython.noop),
+    ]
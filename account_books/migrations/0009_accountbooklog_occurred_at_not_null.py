@@ -0,0 +1,26 @@
+import datetime
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0008_backfill_accountbooklog_occurred_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accountbooklog',
+            name='occurred_at',
+            field=models.DateField(default=datetime.date.today),
+        ),
+        migrations.AddIndex(
+            model_name='accountbooklog',
+            index=models.Index(fields=['book', 'occurred_at'], name='account_book_logs_book_date'),
+        ),
+        migrations.AddIndex(
+            model_name='accountbooklog',
+            index=models.Index(fields=['user', 'occurred_at'], name='account_book_logs_user_date'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 4.1.3 on 2026-10-19 21:58
+
+import datetime
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('account_books', '0009_accountbooklog_occurred_at_not_null'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountBookRecurringLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('title', models.CharField(max_length=200)),
+                ('price', models.DecimalField(decimal_places=0, max_digits=10)),
+                ('description', models.CharField(blank=True, max_length=255, null=True)),
+                ('types', models.CharField(choices=[('expenditure', 'expenditure'), ('income', 'income')], default='expenditure', max_length=200)),
+                ('rule', models.CharField(choices=[('daily', 'daily'), ('weekly', 'weekly'), ('monthly', 'monthly')], default='monthly', max_length=20)),
+                ('start_date', models.DateField(default=datetime.date.today)),
+                ('end_date', models.DateField(blank=True, null=True)),
+                ('next_run_date', models.DateField(default=datetime.date.today)),
+                ('status', models.CharField(choices=[('in_use', 'AccountBookRecurringLog in use'), ('deleted', 'AccountBookRecurringLog deleted')], default='in_use', max_length=200)),
+            ],
+            options={
+                'db_table': 'account_book_recurring_logs',
+            },
+        ),
+        migrations.AddField(
+            model_name='accountbooklogarchive',
+            name='recurring_id',
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='accountbookrecurringlog',
+            name='book',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recurring_logs', to='account_books.accountbook'),
+        ),
+        migrations.AddField(
+            model_name='accountbookrecurringlog',
+            name='category',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='account_books.accountbookcategory'),
+        ),
+        migrations.AddField(
+            model_name='accountbookrecurringlog',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='accountbooklog',
+            name='recurring',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='logs', to='account_books.accountbookrecurringlog'),
+        ),
+        migrations.AddIndex(
+            model_name='accountbookrecurringlog',
+            index=models.Index(fields=['status', 'next_run_date'], name='recurring_logs_due'),
+        ),
+        migrations.AddConstraint(
+            model_name='accountbooklog',
+            constraint=models.UniqueConstraint(fields=('recurring', 'occurred_at'), name='account_book_logs_recurring_date'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.3 on 2026-10-19 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0010_recurring_logs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accountbook',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='account_books_user_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='accountbookcategory',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='book_categories_user_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='accountbooklog',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='account_book_logs_user_updated'),
+        ),
+    ]
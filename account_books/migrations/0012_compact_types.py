@@ -0,0 +1,62 @@
+from django.db import migrations
+import core.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0011_sync_indexes'),
+    ]
+    
+    operations = [
+        migrations.AddField(
+            model_name='accountbook',
+            name='status_code',
+            field=core.fields.EnumField(null=True, values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbookcategory',
+            name='status_code',
+            field=core.fields.EnumField(null=True, values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbooklog',
+            name='types_code',
+            field=core.fields.EnumField(null=True, values={'expenditure': 1, 'income': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbooklog',
+            name='status_code',
+            field=core.fields.EnumField(null=True, values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbookrecurringlog',
+            name='types_code',
+            field=core.fields.EnumField(null=True, values={'expenditure': 1, 'income': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbookrecurringlog',
+            name='status_code',
+            field=core.fields.EnumField(null=True, values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbookarchive',
+            name='status_code',
+            field=core.fields.EnumField(null=True, values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbookcategoryarchive',
+            name='status_code',
+            field=core.fields.EnumField(null=True, values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbooklogarchive',
+            name='types_code',
+            field=core.fields.EnumField(null=True, values={'expenditure': 1, 'income': 2}),
+        ),
+        migrations.AddField(
+            model_name='accountbooklogarchive',
+            name='status_code',
+            field=core.fields.EnumField(null=True, values={'in_use': 1, 'deleted': 2}),
+        ),
+    ]
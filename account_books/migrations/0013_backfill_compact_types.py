@@ -0,0 +1,75 @@
+from django.db import migrations, models
+from django.db.models import Case, Q, Value, When
+
+
+BATCH_SIZE = 5000
+
+STATUS_VALUES = {'in_use': 1, 'deleted': 2}
+TYPES_VALUES  = {'expenditure': 1, 'income': 2}
+
+"""
+모델 - (문자열 컬럼, 저장값 매핑, 매핑되지 않는 값의 기본값)
+"""
+FIELDS = {
+    'AccountBook'               : [('status', STATUS_VALUES, 'in_use')],
+    'AccountBookCategory'       : [('status', STATUS_VALUES, 'in_use')],
+    'AccountBookLog'            : [('types', TYPES_VALUES, 'expenditure'), ('status', STATUS_VALUES, 'in_use')],
+    'AccountBookRecurringLog'   : [('types', TYPES_VALUES, 'expenditure'), ('status', STATUS_VALUES, 'in_use')],
+    'AccountBookArchive'        : [('status', STATUS_VALUES, 'deleted')],
+    'AccountBookCategoryArchive': [('status', STATUS_VALUES, 'deleted')],
+    'AccountBookLogArchive'     : [('types', TYPES_VALUES, 'expenditure'), ('status', STATUS_VALUES, 'deleted')],
+}
+
+
+def backfill_compact_types(apps, schema_editor, stale_only=False):
+    """
+    description:
+        - 문자열 상태/타입 컬럼의 값을 정수 컬럼(<컬럼>_code)으로 복사(id 범위 단위로 나누어 업데이트)
+        - 기존 API는 대소문자를 구분하지 않고 조회했으므로 대소문자 구분 없이 매핑
+        - 매핑되지 않는 값(입력값 확인 이전에 저장된 값)은 기본값으로 저장
+        - stale_only: 정수 컬럼이 비어있거나 문자열 컬럼과 다른 행만 업데이트
+          (0013 이후 이전 버전 코드가 생성/수정한 행, 0014에서 컬럼 교체 전에 다시 실행)
+    """
+    for model_name, fields in FIELDS.items():
+        model = apps.get_model('account_books', model_name)
+        
+        updates = {
+            f'{field}_code': Case(
+                *[When(**{f'{field}__iexact': value}, then=Value(number)) for value, number in values.items()],
+                default      = Value(values[default]),
+                output_field = models.PositiveSmallIntegerField()
+            )
+            for field, values, default in fields
+        }
+        
+        stale = Q()
+        for code, expression in updates.items():
+            stale |= Q(**{f'{code}__isnull': True}) | ~Q(**{code: expression})
+        
+        last_id = 0
+        while True:
+            ids = list(
+                model.objects\
+                     .filter(id__gt=last_id)\
+                     .order_by('id')\
+                     .values_list('id', flat=True)[:BATCH_SIZE]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            
+            rows = model.objects.filter(id__in=ids)
+            if stale_only:
+                rows = rows.filter(stale)
+            rows.update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0012_compact_types'),
+    ]
+    
+    operations = [
+        migrations.RunPython(backfill_compact_types, migrations.RunPython.noop),
+    ]
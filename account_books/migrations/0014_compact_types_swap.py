@@ -0,0 +1,243 @@
+from importlib import import_module
+
+from django.db        import migrations, models
+from django.db.models import Case, F, Value, When
+import core.fields
+
+
+backfill = import_module('account_books.migrations.0013_backfill_compact_types')
+
+
+def backfill_stale_compact_types(apps, schema_editor):
+    """
+    description:
+        - 0013 이후 이전 버전 코드가 생성/수정한 행(정수 컬럼이 비어있거나 문자열 컬럼과 다른 행)을 컬럼 교체 전에 다시 복사
+        - PostgreSQL: 마이그레이션 트랜잭션이 끝날 때까지 쓰기를 막아(SHARE 잠금) 다시 복사한 뒤 생성/수정된 행이 없도록 함
+    """
+    if schema_editor.connection.vendor == 'postgresql':
+        tables = [
+            schema_editor.quote_name(apps.get_model('account_books', model_name)._meta.db_table)
+            for model_name in backfill.FIELDS
+        ]
+        schema_editor.execute(f'LOCK TABLE {", ".join(tables)} IN SHARE MODE')
+    
+    backfill.backfill_compact_types(apps, schema_editor, stale_only=True)
+
+
+def restore_string_types(apps, schema_editor):
+    """
+    description:
+        - 되돌리기: 컬럼 교체를 되돌린 뒤(문자열 컬럼은 기본값으로 다시 생성됨) 정수 컬럼(<컬럼>_code)의 값을 문자열 컬럼으로 복사
+          (id 범위 단위로 나누어 업데이트)
+    """
+    for model_name, fields in backfill.FIELDS.items():
+        model = apps.get_model('account_books', model_name)
+        
+        updates = {
+            field: Case(
+                *[When(**{f'{field}_code': number}, then=Value(value)) for value, number in values.items()],
+                default      = F(field),
+                output_field = models.CharField()
+            )
+            for field, values, _ in fields
+        }
+        
+        last_id = 0
+        while True:
+            ids = list(
+                model.objects\
+                     .filter(id__gt=last_id)\
+                     .order_by('id')\
+                     .values_list('id', flat=True)[:backfill.BATCH_SIZE]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            
+            model.objects\
+                 .filter(id__in=ids)\
+                 .update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account_books', '0013_backfill_compact_types'),
+    ]
+    
+    operations = [
+        migrations.RunPython(backfill_stale_compact_types, restore_string_types),
+        migrations.RemoveIndex(
+            model_name='accountbookrecurringlog',
+            name='recurring_logs_due',
+        ),
+        migrations.RemoveField(
+            model_name='accountbook',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='accountbook',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RemoveField(
+            model_name='accountbookcategory',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='accountbookcategory',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RemoveField(
+            model_name='accountbooklog',
+            name='types',
+        ),
+        migrations.RenameField(
+            model_name='accountbooklog',
+            old_name='types_code',
+            new_name='types',
+        ),
+        migrations.RemoveField(
+            model_name='accountbooklog',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='accountbooklog',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RemoveField(
+            model_name='accountbookrecurringlog',
+            name='types',
+        ),
+        migrations.RenameField(
+            model_name='accountbookrecurringlog',
+            old_name='types_code',
+            new_name='types',
+        ),
+        migrations.RemoveField(
+            model_name='accountbookrecurringlog',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='accountbookrecurringlog',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RemoveField(
+            model_name='accountbookarchive',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='accountbookarchive',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RemoveField(
+            model_name='accountbookcategoryarchive',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='accountbookcategoryarchive',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RemoveField(
+            model_name='accountbooklogarchive',
+            name='types',
+        ),
+        migrations.RenameField(
+            model_name='accountbooklogarchive',
+            old_name='types_code',
+            new_name='types',
+        ),
+        migrations.RemoveField(
+            model_name='accountbooklogarchive',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='accountbooklogarchive',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.AlterField(
+            model_name='accountbook',
+            name='status',
+            field=core.fields.EnumField(choices=[('in_use', 'AccountBook in use'), ('deleted', 'AccountBook deleted')], default='in_use', values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbookcategory',
+            name='status',
+            field=core.fields.EnumField(choices=[('in_use', 'AccountBookCategory in use'), ('deleted', 'AccountBookCategory deleted')], default='in_use', values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbooklog',
+            name='types',
+            field=core.fields.EnumField(choices=[('expenditure', 'expenditure'), ('income', 'income')], default='expenditure', values={'expenditure': 1, 'income': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbooklog',
+            name='status',
+            field=core.fields.EnumField(choices=[('in_use', 'AccountBookLog in use'), ('deleted', 'AccountBookLog deleted')], default='in_use', values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbookrecurringlog',
+            name='types',
+            field=core.fields.EnumField(choices=[('expenditure', 'expenditure'), ('income', 'income')], default='expenditure', values={'expenditure': 1, 'income': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbookrecurringlog',
+            name='status',
+            field=core.fields.EnumField(choices=[('in_use', 'AccountBookRecurringLog in use'), ('deleted', 'AccountBookRecurringLog deleted')], default='in_use', values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbookarchive',
+            name='status',
+            field=core.fields.EnumField(values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbookcategoryarchive',
+            name='status',
+            field=core.fields.EnumField(values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbooklogarchive',
+            name='types',
+            field=core.fields.EnumField(values={'expenditure': 1, 'income': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbooklogarchive',
+            name='status',
+            field=core.fields.EnumField(values={'in_use': 1, 'deleted': 2}),
+        ),
+        migrations.AlterField(
+            model_name='accountbook',
+            name='budget',
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='accountbooklog',
+            name='price',
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='accountbookrecurringlog',
+            name='price',
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='accountbookarchive',
+            name='budget',
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='accountbooklogarchive',
+            name='price',
+            field=models.BigIntegerField(),
+        ),
+        migrations.AddIndex(
+            model_name='accountbookrecurringlog',
+            index=models.Index(fields=['status', 'next_run_date'], name='recurring_logs_due'),
+        ),
+    ]
@@ -1,8 +1,18 @@
+from datetime    import date
+
 from django.db   import models
 
+from core.fields import EnumField
 from core.models import TimeStampModel
 
 
+"""
+상태/타입 선택값 - 저장값(smallint), 저장값은 변경하지 않음(보관 테이블과 동일한 값 사용)
+"""
+STATUS_VALUES = {'in_use': 1, 'deleted': 2}
+TYPES_VALUES  = {'expenditure': 1, 'income': 2}
+
+
 class AccountBook(TimeStampModel):
     
     STATUS_TYPES = [
@@ -12,14 +22,17 @@ class AccountBook(TimeStampModel):
     
     user   = models.ForeignKey('users.User', on_delete=models.CASCADE)
     name   = models.CharField(max_length=200)
-    budget = models.DecimalField(max_digits=10, decimal_places=0)
-    status = models.CharField(max_length=200, choices=STATUS_TYPES, default='in_use')
-    
+    budget = models.BigIntegerField()
+    status = EnumField(values=STATUS_VALUES, choices=STATUS_TYPES, default='in_use')
+
     def __str__(self):
         return self.name
     
     class Meta:
         db_table = 'account_books'
+        indexes  = [
+            models.Index(fields=['user', 'updated_at', 'id'], name='account_books_user_updated'),
+        ]
         
     
 class AccountBookLog(TimeStampModel):
@@ -34,19 +47,87 @@ class AccountBookLog(TimeStampModel):
         ('deleted', 'AccountBookLog deleted'),
     ]
     
+    user        = models.ForeignKey('users.User', on_delete=models.CASCADE)
     category    = models.ForeignKey('AccountBookCategory', on_delete=models.DO_NOTHING, null=True, blank=True)
     book        = models.ForeignKey('AccountBook', related_name='logs', on_delete=models.CASCADE)
+    recurring   = models.ForeignKey('AccountBookRecurringLog', related_name='logs', on_delete=models.SET_NULL, null=True, blank=True)
     title       = models.CharField(max_length=200)
-    price       = models.DecimalField(max_digits=10, decimal_places=0)
+    price       = models.BigIntegerField()
     description = models.CharField(max_length=255, null=True, blank=True)
-    types       = models.CharField(max_length=200, choices=ACCOUNT_TYPES, default='expenditure')
-    status      = models.CharField(max_length=200, choices=STATUS_TYPES, default='in_use')
+    types       = EnumField(values=TYPES_VALUES, choices=ACCOUNT_TYPES, default='expenditure')
+    status      = EnumField(values=STATUS_VALUES, choices=STATUS_TYPES, default='in_use')
+    occurred_at = models.DateField(default=date.today)
     
     def __str__(self):
         return self.title
     
+    def save(self, *args, **kwargs):
+        """
+        가계부 기록의 유저정보(비정규화 컬럼)를 가계부의 유저정보와 일치시킴
+        (API/일괄 생성은 가계부를 확인한 유저로 저장하므로, 가계부를 조회하지 않도록 이미 가계부 객체를 가지고 있거나
+         유저정보가 없는 경우에만 가계부의 유저정보 사용)
+        """
+        if self.book_id and (not self.user_id or self._meta.get_field('book').is_cached(self)):
+            self.user_id = self.book.user_id
+        super().save(*args, **kwargs)
+    
     class Meta:
         db_table = 'account_book_logs'
+        indexes  = [
+            models.Index(fields=['user', 'created_at'], name='account_book_logs_user_created'),
+            models.Index(fields=['user', 'price', 'id'], name='account_book_logs_user_price'),
+            models.Index(fields=['book', 'occurred_at'], name='account_book_logs_book_date'),
+            models.Index(fields=['user', 'occurred_at'], name='account_book_logs_user_date'),
+            models.Index(fields=['user', 'updated_at', 'id'], name='account_book_logs_user_updated'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['recurring', 'occurred_at'], name='account_book_logs_recurring_date'),
+        ]
+        
+
+class AccountBookRecurringLog(TimeStampModel):
+    
+    """
+    description:
+        - 반복 가계부 기록(월세, 급여, 구독료 등) 템플릿
+        - 스케줄러(generate_recurring_logs)가 반복 주기에 따라 가계부 기록을 생성
+        - next_run_date: 다음에 생성할 기록의 거래일자
+    """
+    
+    ACCOUNT_TYPES = AccountBookLog.ACCOUNT_TYPES
+    
+    RULE_TYPES = [
+        ('daily', 'daily'),
+        ('weekly', 'weekly'),
+        ('monthly', 'monthly'),
+    ]
+    
+    STATUS_TYPES = [
+        ('in_use', 'AccountBookRecurringLog in use'),
+        ('deleted', 'AccountBookRecurringLog deleted'),
+    ]
+    
+    user          = models.ForeignKey('users.User', on_delete=models.CASCADE)
+    category      = models.ForeignKey('AccountBookCategory', on_delete=models.DO_NOTHING, null=True, blank=True)
+    book          = models.ForeignKey('AccountBook', related_name='recurring_logs', on_delete=models.CASCADE)
+    title         = models.CharField(max_length=200)
+    price         = models.BigIntegerField()
+    description   = models.CharField(max_length=255, null=True, blank=True)
+    types         = EnumField(values=TYPES_VALUES, choices=ACCOUNT_TYPES, default='expenditure')
+    rule          = models.CharField(max_length=20, choices=RULE_TYPES, default='monthly')
+    start_date    = models.DateField(default=date.today)
+    end_date      = models.DateField(null=True, blank=True)
+    next_run_date = models.DateField(default=date.today)
+    status        = EnumField(values=STATUS_VALUES, choices=STATUS_TYPES, default='in_use')
+
+    def __str__(self):
+        return self.title
+    
+    class Meta:
+        db_table = 'account_book_recurring_logs'
+        indexes  = [
+            models.Index(fields=['status', 'next_run_date'], name='recurring_logs_due'),
+        ]
         
 
 class AccountBookCategory(TimeStampModel):
@@ -58,10 +139,80 @@ class AccountBookCategory(TimeStampModel):
     
     user   = models.ForeignKey('users.User', on_delete=models.CASCADE)
     name   = models.CharField(max_length=200)
-    status = models.CharField(max_length=200, choices=STATUS_TYPES, default='in_use')
-    
+    status = EnumField(values=STATUS_VALUES, choices=STATUS_TYPES, default='in_use')
+
     def __str__(self):
         return self.name
     
     class Meta:
-        db_table = 'account_book_categories'
\ No newline at end of file
+        db_table = 'account_book_categories'
+        indexes  = [
+            models.Index(fields=['user', 'updated_at', 'id'], name='book_categories_user_updated'),
+        ]
+
+
+class AccountBookArchive(models.Model):
+    
+    """
+    description:
+        - 삭제 후 보관기간이 지난 가계부를 보관하는 cold 테이블
+        - 원본 테이블의 id를 그대로 사용(복구 시 동일한 id로 복원)
+    """
+    
+    id          = models.BigIntegerField(primary_key=True)
+    user_id     = models.BigIntegerField(db_index=True)
+    name        = models.CharField(max_length=200)
+    budget      = models.BigIntegerField()
+    status      = EnumField(values=STATUS_VALUES)
+    created_at  = models.DateTimeField()
+    updated_at  = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'account_books_archive'
+        
+        
+class AccountBookLogArchive(models.Model):
+    
+    """
+    description:
+        - 삭제 후 보관기간이 지난 가계부 기록을 보관하는 cold 테이블
+        - 가계부가 보관처리되는 경우, 해당 가계부의 기록도 함께 보관
+    """
+    
+    id           = models.BigIntegerField(primary_key=True)
+    user_id      = models.BigIntegerField(null=True)
+    category_id  = models.BigIntegerField(null=True)
+    book_id      = models.BigIntegerField(db_index=True)
+    recurring_id = models.BigIntegerField(null=True)
+    title        = models.CharField(max_length=200)
+    price        = models.BigIntegerField()
+    description  = models.CharField(max_length=255, null=True)
+    types        = EnumField(values=TYPES_VALUES)
+    status       = EnumField(values=STATUS_VALUES)
+    occurred_at  = models.DateField(null=True)
+    created_at   = models.DateTimeField()
+    updated_at   = models.DateTimeField()
+    archived_at  = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'account_book_logs_archive'
+        
+        
+class AccountBookCategoryArchive(models.Model):
+    
+    """
+    description:
+        - 삭제 후 보관기간이 지난 가계부 카테고리를 보관하는 cold 테이블
+    """
+    
+    id          = models.BigIntegerField(primary_key=True)
+    user_id     = models.BigIntegerField(db_index=True)
+    name        = models.CharField(max_length=200)
+    status      = EnumField(values=STATUS_VALUES)
+    created_at  = models.DateTimeField()
+    updated_at  = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'account_book_categories_archive'
@@ -1,18 +1,27 @@
-from typing  import Optional, List
-from decimal import Decimal
+from typing   import Optional, List
+from decimal  import Decimal
+from datetime import date, datetime
 
 from ninja import Schema
 
 
+"""
+sparse fieldset(fields=) 조회 시 응답 필드별 필요 컬럼(모델 필드명과 다른 경우만)
+"""
+ACCOUNT_BOOK_OUTPUT_COLUMNS          = {'nickname': ['user__nickname']}
+ACCOUNT_BOOK_CATEGORY_OUTPUT_COLUMNS = {'nickname': ['user__nickname']}
+ACCOUNT_BOOK_LOG_OUTPUT_COLUMNS      = {'book': ['book__name'], 'category': ['category__name', 'category__status']}
+
+
 class AccountBookCreateInput(Schema):
     name  : str
-    budget: Decimal
+    budget: int
     status: Optional[str] = 'in_use'
 
 
 class AccountBookUpdateInput(Schema):
     name  : Optional[str] = None
-    budget: Optional[Decimal] = None
+    budget: Optional[int] = None
 
 
 class AccountBookOutput(Schema):
@@ -29,6 +38,34 @@ class AccountBookOutput(Schema):
         return obj.user.nickname
     
 
+class AccountBookDashboardItemOutput(Schema):
+    id                : int
+    name              : str
+    budget            : Decimal
+    total_income      : Decimal
+    total_expenditure : Decimal
+    remaining_budget  : Decimal
+    budget_utilization: Optional[float] = None
+    
+    @staticmethod
+    def resolve_remaining_budget(obj):
+        return obj.budget - obj.total_expenditure
+    
+    @staticmethod
+    def resolve_budget_utilization(obj):
+        if not obj.budget:
+            return None
+        return round(float(obj.total_expenditure / obj.budget * 100), 2)
+
+
+class AccountBookDashboardOutput(Schema):
+    nickname         : str
+    total_budget     : Decimal
+    total_income     : Decimal
+    total_expenditure: Decimal
+    books            : List[AccountBookDashboardItemOutput]
+    
+
 class AccountBookCategoryCreateInput(Schema):
     name  : str
     status: Optional[str] = 'in_use'
@@ -51,20 +88,39 @@ class AccountBookCategoryOutput(Schema):
         return obj.user.nickname
     
     
+class AccountBookCategoryBreakdownItemOutput(Schema):
+    category_id: Optional[int] = None
+    category   : Optional[str] = None
+    total      : Decimal
+    count      : int
+    share      : float
+    average    : Decimal
+
+
+class AccountBookCategoryBreakdownOutput(Schema):
+    nickname         : str
+    total_income     : Decimal
+    total_expenditure: Decimal
+    income           : List[AccountBookCategoryBreakdownItemOutput]
+    expenditure      : List[AccountBookCategoryBreakdownItemOutput]
+    
+    
 class AccountBookLogCreateInput(Schema):
     title: str
     types: str
-    price: Decimal
+    price: int
     description: str
     category_id: int
     book_id    : int
+    occurred_at: Optional[date] = None
     
 
 class AccountBookLogUpdateInput(Schema):
     title: Optional[str] = None
     types: Optional[str] = None
-    price: Optional[Decimal] = None
+    price: Optional[int] = None
     description: Optional[str] = None    
+    occurred_at: Optional[date] = None
     book_id    : int
     category_id: int
 
@@ -78,6 +134,7 @@ class AccountBookLogCreateUpdateOutput(Schema):
     status     : str
     book       : str
     category   : Optional[str] = None
+    occurred_at: date
     created_at : str
     updated_at : str
     
@@ -111,6 +168,7 @@ class AccountBookLogOutput(Schema):
     status     : str
     book       : str
     category   : Optional[str] = None
+    occurred_at: date
     created_at : str
     updated_at : str
     
@@ -140,4 +198,123 @@ class AccountBookLogListOutput(Schema):
     expected_budget  : Decimal
     total_income     : Optional[Decimal] = None
     total_expenditure: Optional[Decimal] = None
-    logs: Optional[List[AccountBookLogOutput]] = None
\ No newline at end of file
+    logs: Optional[List[AccountBookLogOutput]] = None
+    
+    
+class AccountBookLogSeriesOutput(Schema):
+    interval   : str
+    buckets    : List[str]
+    income     : List[int]
+    expenditure: List[int]
+    
+    
+class AccountBookLogStatsItemOutput(Schema):
+    count          : int
+    total          : int
+    mean           : float
+    median         : float
+    p25            : float
+    p75            : float
+    p90            : float
+    daily_average  : float
+    rolling_average: float
+    velocity       : float
+    
+    
+class AccountBookLogStatsCategoryOutput(AccountBookLogStatsItemOutput):
+    category_id: Optional[int] = None
+    category   : Optional[str] = None
+    
+    
+class AccountBookLogStatsOutput(Schema):
+    types     : str
+    date_from : date
+    date_to   : date
+    window    : int
+    days      : List[str]
+    rolling   : List[float]
+    overall   : AccountBookLogStatsItemOutput
+    categories: List[AccountBookLogStatsCategoryOutput]
+    
+    
+class AccountBookLogFeedOutput(Schema):
+    nickname   : str
+    next_cursor: Optional[str] = None
+    logs       : List[AccountBookLogOutput]
+    
+
+class AccountBookRecurringLogCreateInput(Schema):
+    title: str
+    types: str
+    price: int
+    description: Optional[str] = None
+    category_id: int
+    book_id    : int
+    rule       : str = 'monthly'
+    start_date : Optional[date] = None
+    end_date   : Optional[date] = None
+    
+
+class AccountBookRecurringLogOutput(Schema):
+    id   : int
+    title: str
+    types: str
+    price: Decimal
+    description  : Optional[str] = None
+    book         : str
+    category     : Optional[str] = None
+    rule         : str
+    start_date   : date
+    end_date     : Optional[date] = None
+    next_run_date: date
+    status       : str
+    
+    @staticmethod
+    def resolve_book(obj):
+        return obj.book.name
+    
+    @staticmethod
+    def resolve_category(obj):
+        if not obj.category or obj.category.status == 'deleted':
+            return None
+        return obj.category.name
+
+
+class AccountBookSyncOutput(Schema):
+    id        : int
+    name      : str
+    budget    : Decimal
+    status    : str
+    created_at: datetime
+    updated_at: datetime
+
+
+class AccountBookCategorySyncOutput(Schema):
+    id        : int
+    name      : str
+    status    : str
+    created_at: datetime
+    updated_at: datetime
+
+
+class AccountBookLogSyncOutput(Schema):
+    id         : int
+    book_id    : int
+    category_id: Optional[int] = None
+    title      : str
+    types      : str
+    price      : Decimal
+    description: Optional[str] = None
+    status     : str
+    occurred_at: date
+    created_at : datetime
+    updated_at : datetime
+
+
+class AccountBookSyncListOutput(Schema):
+    cursor    : str
+    has_more  : bool
+    reset     : bool
+    books     : List[AccountBookSyncOutput]
+    categories: List[AccountBookCategorySyncOutput]
+    logs      : List[AccountBookLogSyncOutput]
\ No newline at end of file
@@ -0,0 +1,36 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch          import receiver
+from django.db                import transaction
+
+from account_books.models import AccountBook, AccountBookCategory, AccountBookLog
+from account_books.events import publish_book_balances
+from core.utils.cache     import bump_user_cache_version
+
+
+"""
+가계부/카테고리/기록 변경 시 트랜잭션 커밋 이후 유저의 집계 캐시 무효화
+(커밋 전에 버전을 올리면 동시에 조회한 요청이 커밋 전 데이터를 새 버전으로 캐시할 수 있음)
+"""
+@receiver(post_save, sender=AccountBook)
+@receiver(post_save, sender=AccountBookCategory)
+@receiver(post_save, sender=AccountBookLog)
+@receiver(post_delete, sender=AccountBook)
+@receiver(post_delete, sender=AccountBookCategory)
+@receiver(post_delete, sender=AccountBookLog)
+def invalidate_user_cache(sender, instance, **kwargs):
+    transaction.on_commit(lambda: bump_user_cache_version(instance.user_id))
+
+
+"""
+가계부/기록 변경 시 트랜잭션 커밋 이후 가계부 잔액 변경 이벤트 발행(SSE 스트림)
+"""
+@receiver(post_save, sender=AccountBook)
+@receiver(post_delete, sender=AccountBook)
+def publish_book_change(sender, instance, **kwargs):
+    transaction.on_commit(lambda: publish_book_balances(instance.user_id, [instance.id]))
+
+
+@receiver(post_save, sender=AccountBookLog)
+@receiver(post_delete, sender=AccountBookLog)
+def publish_log_change(sender, instance, **kwargs):
+    transaction.on_commit(lambda: publish_book_balances(instance.user_id, [instance.book_id]))
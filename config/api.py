@@ -1,14 +1,26 @@
 from ninja import NinjaAPI
 
+from django.conf import settings
+
 from users.api                    import router as users_router
+from core.api                     import router as jobs_router, batch_router
 from account_books.api.books      import router as account_books_router
 from account_books.api.categories import router as account_book_categories_router
 from account_books.api.logs       import router as account_book_logs_router
+from account_books.api.recurring  import router as account_book_recurring_logs_router
+from account_books.api.sync       import router as account_book_sync_router
 
 
-api = NinjaAPI()
+api = NinjaAPI(
+    docs_url    = '/docs' if settings.API_DOCS_ENABLED else None,
+    openapi_url = '/openapi.json' if settings.API_DOCS_ENABLED else None
+)
 
 api.add_router('/users', users_router)
 api.add_router('/account-books', account_books_router)
 api.add_router('/account-books/categories', account_book_categories_router)
-api.add_router('/account-books/logs', account_book_logs_router)
\ No newline at end of file
+api.add_router('/account-books/logs', account_book_logs_router)
+api.add_router('/account-books/recurring-logs', account_book_recurring_logs_router)
+api.add_router('/account-books/sync', account_book_sync_router)
+api.add_router('/jobs', jobs_router)
+api.add_router('/batch', batch_router)
\ No newline at end of file
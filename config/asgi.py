@@ -5,12 +5,147 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
+
+usage(SSE 스트림, 비동기 회원가입/로그인 전용 프로세스):
+    - 개발: uvicorn config.asgi:application(config.wsgi와 같이 기본값은 개발 설정)
+    - 운영: GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker gunicorn -c gunicorn.conf.py config.asgi
+      (gunicorn.conf.py에서 운영 설정(config.settings_production) 지정)
 """
 
-import os
+import asyncio, json, os
+
+from urllib.parse import parse_qs
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from asgiref.sync import sync_to_async
+from django.conf  import settings
+
+from account_books.events import get_book_balances, get_user_channel
+from core.utils.auth      import get_user_id_from_token
+from core.utils.pubsub    import broker
+
+
+"""
+가계부 잔액 변경 SSE 스트림 경로
+"""
+STREAM_PATH = '/api/account-books/stream'
+
+
+def _get_header(scope: dict, name: bytes) -> str:
+    for key, value in scope['headers']:
+        if key == name:
+            return value.decode('latin-1')
+    return ''
+
+
+def _get_token(scope: dict) -> str:
+    """
+    Authorization 헤더 또는 token 쿼리 파라미터(EventSource는 헤더를 지정할 수 없음)에서 JWT 토큰 추출
+    """
+    header = _get_header(scope, b'authorization')
+    if header.startswith('Bearer '):
+        return header[len('Bearer '):]
+    
+    query = parse_qs(scope.get('query_string', b'').decode())
+    return query.get('token', [''])[0]
+
+
+def _get_user_id(scope: dict):
+    token = _get_token(scope)
+    return get_user_id_from_token(token) if token else None
+
+
+def _format_event(event: str, data: dict) -> bytes:
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'.encode()
+
+
+async def _wait_disconnect(receive) -> None:
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return
+
+
+async def book_balance_stream(scope: dict, receive, send) -> None:
+    """
+    description:
+        - 유저의 가계부 잔액(예산/총수입/총지출) 변경을 Server-Sent Events로 전달
+        - 연결 직후 현재 잔액을 전달하고, 이후 기록이 변경될 때마다 변경된 가계부의 잔액을 전달
+        - 연결마다 스레드를 사용하지 않고 이벤트 루프에서 대기하므로 워커당 다수의 유휴 연결을 유지할 수 있음
+        - 프록시의 유휴 연결 종료를 막기 위해 일정 시간마다 keepalive 주석을 전달
+    """
+    user_id = _get_user_id(scope)
+    if not user_id:
+        await send({
+            'type'   : 'http.response.start',
+            'status' : 401,
+            'headers': [(b'content-type', b'application/json')]
+        })
+        await send({
+            'type': 'http.response.body',
+            'body': json.dumps({'detail': 'Unauthorized'}).encode()
+        })
+        return
+    
+    headers = [
+        (b'content-type', b'text/event-stream'),
+        (b'cache-control', b'no-cache'),
+        (b'x-accel-buffering', b'no'),
+    ]
+    origin = _get_header(scope, b'origin')
+    if origin:
+        headers += [
+            (b'access-control-allow-origin', origin.encode('latin-1')),
+            (b'access-control-allow-credentials', b'true'),
+        ]
+    
+    """
+    현재 잔액 조회 전에 구독하여 조회 도중 발생한 변경도 놓치지 않도록 함
+    """
+    channel    = get_user_channel(user_id)
+    queue      = broker.subscribe(channel, maxsize=settings.SSE_QUEUE_SIZE)
+    disconnect = asyncio.ensure_future(_wait_disconnect(receive))
+    
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': headers})
+        
+        for balance in await sync_to_async(get_book_balances)(user_id):
+            await send({'type': 'http.response.body', 'body': _format_event('balance', balance), 'more_body': True})
+        
+        while True:
+            message = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait(
+                {message, disconnect},
+                timeout     = settings.SSE_KEEPALIVE_SECONDS,
+                return_when = asyncio.FIRST_COMPLETED
+            )
+            
+            if disconnect in done:
+                message.cancel()
+                break
+            
+            if message in done:
+                body = _format_event(message.result()['event'], message.result()['data'])
+            else:
+                message.cancel()
+                body = b': keepalive\n\n'
+            
+            await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+    finally:
+        disconnect.cancel()
+        broker.unsubscribe(channel, queue)
+
+
+async def application(scope: dict, receive, send) -> None:
+    """
+    SSE 스트림 경로는 직접 처리하고, 그 외의 요청은 Django로 전달
+    """
+    if scope['type'] == 'http' and scope['path'] == STREAM_PATH and scope['method'] == 'GET':
+        return await book_balance_stream(scope, receive, send)
+    
+    return await django_application(scope, receive, send)
@@ -68,6 +68,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.CompressionMiddleware',
+    'core.middleware.ProfilerMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     # 'django.middleware.csrf.CsrfViewMiddleware',
@@ -75,9 +78,55 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'core.middleware.AdmissionControlMiddleware',
+    'core.middleware.IdempotencyMiddleware',
 ]
 
 
+## ADMISSION CONTROL ##
+# 유저(비로그인은 IP)별 초당 요청 수/최대 연속 요청 수(THROTTLE_BURST / THROTTLE_RATE초 고정 윈도우), 0이면 제한 없음
+THROTTLE_RATE  = float(os.environ.get('THROTTLE_RATE', 10))
+THROTTLE_BURST = int(os.environ.get('THROTTLE_BURST', 30))
+
+# 노드(호스트)별 동시 처리 요청 수(모든 워커 프로세스 합계, 0이면 제한 없음)/카운터를 새로 시작하는 주기(초)
+# (sync 워커는 프로세스마다 한번에 1개의 요청만 처리하므로 워커 수보다 작게 설정해야 제한이 동작함)
+MAX_IN_FLIGHT_REQUESTS   = int(os.environ.get('MAX_IN_FLIGHT_REQUESTS', 64))
+IN_FLIGHT_WINDOW_SECONDS = int(os.environ.get('IN_FLIGHT_WINDOW_SECONDS', 60))
+
+# 리스트 API 최대 조회 개수(limit)
+API_MAX_LIST_LIMIT = int(os.environ.get('API_MAX_LIST_LIMIT', 100))
+
+
+## PROFILER ##
+# 요청 단위 프로파일링 사용 여부(비활성화 시 미들웨어 미로드), X-Profile 헤더 인증값(관리자 유저는 인증값 없이 사용 가능)
+PROFILER_ENABLED = os.environ.get('PROFILER_ENABLED', '').lower() in ('1', 'true', 'yes')
+PROFILER_SECRET  = os.environ.get('PROFILER_SECRET', '')
+
+# 프로파일 저장 경로/분당 최대 프로파일링 횟수(공유 캐시 사용 시 워커 합산)/inline 응답의 출력 함수 개수
+PROFILER_DIR            = os.environ.get('PROFILER_DIR', os.path.join(BASE_DIR, 'profiles'))
+PROFILER_MAX_PER_MINUTE = int(os.environ.get('PROFILER_MAX_PER_MINUTE', 10))
+PROFILER_INLINE_LINES   = int(os.environ.get('PROFILER_INLINE_LINES', 40))
+
+
+## METRICS ##
+# /metrics 메트릭 수집 사용 여부, /metrics 요청 인증 토큰(Authorization: Bearer <token>, 비어있으면 인증 없음, 운영 환경에서는 필수)
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+METRICS_TOKEN   = os.environ.get('METRICS_TOKEN', '')
+
+# 멀티 프로세스 배포 시 프로세스별 메트릭 snapshot 저장 경로(비어있으면 현재 프로세스의 메트릭만 노출)
+# snapshot 저장 주기(초)/갱신되지 않은 snapshot을 종료된 프로세스로 보고 제외하는 시간(초)
+METRICS_DIR                  = os.environ.get('METRICS_DIR', '')
+METRICS_FLUSH_SECONDS        = float(os.environ.get('METRICS_FLUSH_SECONDS', 5))
+METRICS_SNAPSHOT_TTL_SECONDS = int(os.environ.get('METRICS_SNAPSHOT_TTL_SECONDS', 60 * 10))
+
+
+## IDEMPOTENCY ##
+# Idempotency-Key로 저장한 응답의 유지시간(초)
+IDEMPOTENCY_KEY_TTL_SECONDS  = int(os.environ.get('IDEMPOTENCY_KEY_TTL_SECONDS', 60 * 60 * 24))
+# 처리중 상태의 키를 버려진 것으로 판단하는 시간(초)
+IDEMPOTENCY_KEY_LOCK_SECONDS = int(os.environ.get('IDEMPOTENCY_KEY_LOCK_SECONDS', 60))
+
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -115,6 +164,85 @@ DATABASES = {
 }
 
 
+## CACHE ##
+# 기본값(LocMemCache)은 프로세스별 캐시이므로 단일 프로세스(개발 서버)에서만 사용
+# 유저별 캐시 버전(집계/통계 캐시 무효화), 요청 제한/동시 처리 요청 수, 분당 프로파일링 횟수가 모두 이 캐시에 저장되므로
+# 여러 워커 프로세스를 사용하는 경우 공유 캐시로 CACHE_BACKEND/CACHE_LOCATION 설정(운영 설정은 Redis 필수)
+# (ex. django.core.cache.backends.redis.RedisCache, redis://127.0.0.1:6379/0)
+CACHES = {
+    'default': {
+        'BACKEND' : os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+    }
+}
+
+# 카테고리별 집계 결과 캐시 유지시간(초)
+CATEGORY_BREAKDOWN_CACHE_SECONDS = int(os.environ.get('CATEGORY_BREAKDOWN_CACHE_SECONDS', 300))
+
+# 통계 조회용 유저별 가계부 기록 배열(ledger) 캐시 유지시간(초)
+LEDGER_CACHE_SECONDS = int(os.environ.get('LEDGER_CACHE_SECONDS', 300))
+
+
+## RECURRING LOGS ##
+# 반복 기록 시작일의 최대 과거 일수/생성 요청에서 바로 생성하는 지난 기록의 최대 개수(초과 시 작업 큐에서 생성)
+RECURRING_MAX_BACKFILL_DAYS   = int(os.environ.get('RECURRING_MAX_BACKFILL_DAYS', 366))
+RECURRING_SYNC_BACKFILL_LIMIT = int(os.environ.get('RECURRING_SYNC_BACKFILL_LIMIT', 100))
+
+
+## JOBS ##
+# 작업 최대 시도 횟수/재시도 간격(초)/실행 제한시간(초, 초과 시 다시 큐에 추가)
+JOB_MAX_ATTEMPTS             = int(os.environ.get('JOB_MAX_ATTEMPTS', 3))
+JOB_RETRY_BASE_DELAY_SECONDS = int(os.environ.get('JOB_RETRY_BASE_DELAY_SECONDS', 10))
+JOB_RETRY_MAX_DELAY_SECONDS  = int(os.environ.get('JOB_RETRY_MAX_DELAY_SECONDS', 60 * 30))
+JOB_TIMEOUT_SECONDS          = int(os.environ.get('JOB_TIMEOUT_SECONDS', 60 * 30))
+
+# 작업 결과 파일(CSV 내보내기 등) 저장 경로(여러 서버에서 실행하는 경우 API 서버와 작업 워커가 공유하는 경로)
+JOB_FILES_DIR = os.environ.get('JOB_FILES_DIR', os.path.join(BASE_DIR, 'job_files'))
+
+
+## COMPRESSION ##
+# 응답 압축 인코딩(서버 선호 순서, br/zstd는 brotli/zstandard 패키지가 설치된 경우에만 사용)
+COMPRESSION_ENCODINGS = [
+    encoding.strip() for encoding in os.environ.get('COMPRESSION_ENCODINGS', 'zstd,br,gzip').split(',') if encoding.strip()
+]
+
+# 압축할 최소 응답 크기(bytes)/압축 대상 content type
+COMPRESSION_MIN_SIZE      = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+COMPRESSION_CONTENT_TYPES = [
+    content_type.strip() for content_type in os.environ.get(
+        'COMPRESSION_CONTENT_TYPES', 
+        'application/json,text/csv,text/plain,text/html'
+    ).split(',') if content_type.strip()
+]
+
+# 인코딩별 압축 레벨(gzip: 1~9, br: 0~11, zstd: 1~22)
+COMPRESSION_LEVELS = {
+    'gzip': int(os.environ.get('COMPRESSION_GZIP_LEVEL', 6)),
+    'br'  : int(os.environ.get('COMPRESSION_BROTLI_LEVEL', 5)),
+    'zstd': int(os.environ.get('COMPRESSION_ZSTD_LEVEL', 3)),
+}
+
+
+## BATCH ##
+# 일괄 처리 API의 최대 하위 요청 개수
+BATCH_MAX_OPERATIONS = int(os.environ.get('BATCH_MAX_OPERATIONS', 50))
+
+
+## PUBSUB / SSE ##
+# local: 프로세스 내 전달, file: 공유 spool 파일을 통한 프로세스 간 전달(여러 워커 프로세스 사용 시)
+PUBSUB_BACKEND      = os.environ.get('PUBSUB_BACKEND', 'local')
+PUBSUB_SPOOL_PATH   = os.environ.get('PUBSUB_SPOOL_PATH', os.path.join(BASE_DIR, 'pubsub.spool'))
+PUBSUB_POLL_SECONDS = float(os.environ.get('PUBSUB_POLL_SECONDS', 0.5))
+
+# file 백엔드: spool 파일 교체 크기(바이트)/구독자 표시 유지 시간(초, 구독중인 프로세스가 1/3 주기로 갱신)
+PUBSUB_SPOOL_MAX_BYTES        = int(os.environ.get('PUBSUB_SPOOL_MAX_BYTES', 10 * 1024 * 1024))
+PUBSUB_SUBSCRIBER_TTL_SECONDS = int(os.environ.get('PUBSUB_SUBSCRIBER_TTL_SECONDS', 30))
+
+# SSE keepalive 주기(초)/연결별 대기 메시지 최대 개수
+SSE_KEEPALIVE_SECONDS = int(os.environ.get('SSE_KEEPALIVE_SECONDS', 15))
+SSE_QUEUE_SIZE        = int(os.environ.get('SSE_QUEUE_SIZE', 100))
+
+
 ## CORS ##
 CORS_ORIGIN_ALLOW_ALL  = True
 CORS_ALLOW_CREDENTIALS = True
@@ -134,6 +262,7 @@ CORS_ALLOW_HEADERS = (
     'authorization',
     'content-type',
     'dnt',
+    'idempotency-key',
     'origin',
     'user-agent',
     'x-csrftoken',
@@ -160,6 +289,25 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+## PASSWORD HASHING ##
+# 첫번째 해셔로 새 패스워드를 해싱하고, 나머지 해셔는 기존 패스워드 확인에 사용
+PASSWORD_HASHERS = list(dict.fromkeys([
+    os.environ.get('PASSWORD_HASHER', 'core.hashers.ConfigurablePBKDF2PasswordHasher'),
+    'core.hashers.ConfigurablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]))
+
+# PBKDF2 반복 횟수(0이면 Django 기본값), 변경 시 로그인하면서 재해싱
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', 0))
+
+# 패스워드 해싱 풀(thread/process) 및 워커 수
+PASSWORD_HASH_EXECUTOR = os.environ.get('PASSWORD_HASH_EXECUTOR', 'thread')
+PASSWORD_HASH_WORKERS  = int(os.environ.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.1/topics/i18n/
 
@@ -186,6 +334,19 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'users.User'
 
+## API DOCS ##
+# Swagger 문서(/api/docs), OpenAPI 스키마(/api/openapi.json) 제공 여부
+API_DOCS_ENABLED = True
+
+## SYNC ##
+# 변경분 동기화 커서를 발급하지 않는 최근 구간(초, 가장 긴 쓰기 트랜잭션보다 길게 설정)
+# (수정일자는 커밋 시각이 아닌 저장 시각이므로 이 구간의 변경분은 응답에 포함하되 커서는 이 구간 이전까지만 진행)
+SYNC_SAFETY_LAG_SECONDS = int(os.environ.get('SYNC_SAFETY_LAG_SECONDS', 300))
+
+## ARCHIVE ##
+# 삭제(status='deleted') 후 보관 테이블로 이동하기까지의 기간(일)
+ARCHIVE_RETENTION_DAYS = int(os.environ.get('ARCHIVE_RETENTION_DAYS', 90))
+
 ## SWAGGER ##
 SWAGGER_SETTINGS = {
    'SECURITY_DEFINITIONS': {
@@ -0,0 +1,64 @@
+"""
+운영(API 서버) 전용 설정
+
+/api/ 요청 처리에 필요한 앱/미들웨어만 로드하여 워커 시작 시간과 요청당 처리 비용을 줄임
+    - admin, sessions, messages, staticfiles, django_extensions 미사용
+    - 세션/인증/메시지/clickjacking/common 미들웨어 미사용(JWT 인증, JSON 응답만 사용)
+    - admin url이 없는 API 전용 url 설정 사용, Swagger 문서 미제공
+
+    - 워커 프로세스 간 공유 캐시(Redis) 필수(CACHE_LOCATION)
+    - 메트릭 수집 사용 시 /metrics 인증 토큰 필수(METRICS_TOKEN)
+
+usage:
+    DJANGO_SETTINGS_MODULE=config.settings_production gunicorn config.wsgi
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+
+from config.settings import *
+
+
+DEBUG = False
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'corsheaders',
+] + PROJECT_APPS
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.CompressionMiddleware',
+    'core.middleware.ProfilerMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'core.middleware.AdmissionControlMiddleware',
+    'core.middleware.IdempotencyMiddleware',
+]
+
+ROOT_URLCONF = 'config.urls_api'
+
+TEMPLATES = []
+
+USE_I18N = False
+
+API_DOCS_ENABLED = False
+
+# 여러 워커 프로세스가 유저별 캐시 버전/요청 제한/동시 처리 요청 수/분당 프로파일링 횟수를 공유해야 하므로
+# 프로세스별 캐시(LocMemCache)는 사용할 수 없음(다른 워커의 변경이 캐시 무효화/요청 제한에 반영되지 않음)
+CACHES = {
+    'default': {
+        'BACKEND' : os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.redis.RedisCache'),
+        'LOCATION': get_env_variable('CACHE_LOCATION'),
+    }
+}
+
+# API(WSGI)에서 발생한 잔액 변경 이벤트를 SSE 스트림(ASGI) 프로세스로 전달
+PUBSUB_BACKEND = os.environ.get('PUBSUB_BACKEND', 'file')
+
+if CACHES['default']['BACKEND'] in ('django.core.cache.backends.locmem.LocMemCache', 'django.core.cache.backends.dummy.DummyCache'):
+    raise ImproperlyConfigured('Set CACHE_BACKEND to a cache shared between worker processes')
+
+# /metrics는 API와 같은 포트로 노출되므로 인증 없이 공개하지 않음
+if METRICS_ENABLED and not METRICS_TOKEN:
+    raise ImproperlyConfigured('Set METRICS_TOKEN or disable METRICS_ENABLED')
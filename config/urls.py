@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.urls    import path
 
 from config.api     import api
+from core.views     import metrics
 
 
 """
@@ -10,4 +11,5 @@ Django app url patterns
 urlpatterns = [
     path("api/", api.urls),
     path('admin/', admin.site.urls),
-]
\ No newline at end of file
+    path('metrics', metrics, name='metrics'),
+]
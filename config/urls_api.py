@@ -0,0 +1,13 @@
+from django.urls import path
+
+from config.api  import api
+from core.views  import metrics
+
+
+"""
+API 서버 url patterns(운영 설정에서 사용, admin 미포함)
+"""
+urlpatterns = [
+    path("api/", api.urls),
+    path('metrics', metrics, name='metrics'),
+]
@@ -0,0 +1,89 @@
+"""
+워커 warm-up
+
+처음 요청에서 지연 초기화되는 항목(url resolver, API 스키마 모델, JWT/암호화 모듈 등)을 미리 초기화
+    - warm_up       : preload 앱 서버의 마스터 프로세스에서 fork 이전에 한번 실행(워커들이 copy-on-write로 공유)
+    - warm_up_worker: fork 이후 워커마다 실행(DB 연결 등 프로세스 간 공유할 수 없는 자원)
+
+usage:
+    gunicorn -c gunicorn.conf.py config.wsgi
+"""
+
+import gc, time
+
+from typing import Dict
+
+from django.conf import settings
+from django.db   import connections
+from django.urls import get_resolver
+
+
+def _warm_up_urls() -> None:
+    """
+    url 설정 로드(모든 router import) 및 url 패턴 정규식 컴파일
+    """
+    get_resolver()._populate()
+
+
+def _warm_up_schemas() -> None:
+    """
+    API 입력/응답 스키마(pydantic 모델)와 OpenAPI 스키마 생성
+    """
+    from config.api import api
+    api.get_openapi_schema()
+
+
+def _warm_up_auth() -> None:
+    """
+    JWT 인코딩/디코딩, 패스워드 해싱 모듈 로드(해싱 자체는 느린 연산이므로 실행하지 않음)
+    """
+    import jwt
+    from django.contrib.auth.hashers import get_hashers
+    
+    token = jwt.encode({'user_id': 0}, settings.SECRET_KEY, algorithm='HS256')
+    jwt.decode(token, settings.SECRET_KEY, algorithms='HS256')
+    
+    get_hashers()
+
+
+WARM_UP_STEPS = {
+    'urls'   : _warm_up_urls,
+    'schemas': _warm_up_schemas,
+    'auth'   : _warm_up_auth,
+}
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    description:
+        - fork 이전(마스터 프로세스) warm-up, 단계별 소요 시간(초) 반환
+        - fork 이전에 열린 DB 연결은 워커 간에 공유되면 안되므로 모두 닫음
+        - 초기화된 객체를 gc.freeze()로 영구 세대로 옮겨 워커의 GC가 공유 메모리 페이지를 복사하지 않도록 함
+    """
+    timings = {}
+    for name, step in WARM_UP_STEPS.items():
+        started       = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - started
+    
+    connections.close_all()
+    
+    gc.collect()
+    gc.freeze()
+    
+    return timings
+
+
+def warm_up_worker() -> None:
+    """
+    description:
+        - fork 이후(워커 프로세스) warm-up
+        - DB 연결을 미리 생성(CONN_MAX_AGE 동안 요청 간 재사용되는 영구 연결)
+        - 패스워드 해싱 풀 생성
+    """
+    from core.utils.hashing import get_executor
+    
+    for alias in connections:
+        connections[alias].ensure_connection()
+    
+    get_executor()
@@ -0,0 +1,213 @@
+from ninja import Router
+
+from django.conf import settings
+from django.db   import transaction
+from django.http import HttpRequest, JsonResponse, FileResponse
+
+from core.jobs        import job_file_storage
+from core.models      import Job
+from core.schema      import ErrorMessage, JobOutput, JobResultOutput, BatchInput, BatchOutput
+from core.utils.auth  import AuthBearer
+from core.utils.batch    import BATCH_METHODS, build_sub_request, dispatch_sub_request, get_response_body
+from core.utils.throttle import get_throttle_identity, take_tokens
+
+
+router       = Router()
+batch_router = Router()
+
+
+"""
+작업 상태 조회 API
+"""
+@router.get(
+    '/{int:job_id}',
+    tags     = ['6. 작업'],
+    summary  = '작업 상태 조회',
+    response = {200: JobOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_job(
+    request: HttpRequest,
+    job_id : int
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    본인의 작업인지 확인
+    """
+    try:
+        job = Job.objects.defer('result').get(id=job_id, user=user)
+    except Job.DoesNotExist:
+        return JsonResponse({'detail': f'작업 {job_id}(id)는 존재하지 않습니다.'}, status=400)
+    
+    return job
+
+
+"""
+작업 결과 조회 API
+"""
+@router.get(
+    '/{int:job_id}/result',
+    tags     = ['6. 작업'],
+    summary  = '작업 결과 조회',
+    response = {200: JobResultOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_job_result(
+    request: HttpRequest,
+    job_id : int
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    본인의 작업인지 확인
+    """
+    try:
+        job = Job.objects.only('id', 'status', 'result').get(id=job_id, user=user)
+    except Job.DoesNotExist:
+        return JsonResponse({'detail': f'작업 {job_id}(id)는 존재하지 않습니다.'}, status=400)
+    
+    if job.status != 'succeeded':
+        return JsonResponse({'detail': f'작업 {job_id}(id)가 완료되지 않았습니다.(상태: {job.status})'}, status=400)
+    
+    return job
+
+
+"""
+작업 결과 파일 다운로드 API
+    - 결과 파일이 있는 작업(CSV 내보내기 등)의 파일을 스트리밍으로 반환
+"""
+@router.get(
+    '/{int:job_id}/file',
+    tags     = ['6. 작업'],
+    summary  = '작업 결과 파일 다운로드',
+    response = {400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def get_job_file(
+    request: HttpRequest,
+    job_id : int
+    ) -> FileResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출
+    """
+    user = request.auth
+    
+    """
+    본인의 작업인지, 결과 파일이 있는지 확인
+    """
+    try:
+        job = Job.objects.only('id', 'status', 'result').get(id=job_id, user=user)
+    except Job.DoesNotExist:
+        return JsonResponse({'detail': f'작업 {job_id}(id)는 존재하지 않습니다.'}, status=400)
+    
+    if job.status != 'succeeded':
+        return JsonResponse({'detail': f'작업 {job_id}(id)가 완료되지 않았습니다.(상태: {job.status})'}, status=400)
+    
+    name = (job.result or {}).get('file')
+    if not name or not job_file_storage.exists(name):
+        return JsonResponse({'detail': f'작업 {job_id}(id)의 결과 파일이 없습니다.'}, status=400)
+    
+    return FileResponse(
+        job_file_storage.open(name, 'rb'),
+        as_attachment = True,
+        filename      = name.rsplit('/', 1)[-1],
+        content_type  = job.result.get('content_type')
+    )
+
+
+
+"""
+일괄 처리 API
+"""
+@batch_router.post(
+    '',
+    tags     = ['8. 일괄 처리'],
+    summary  = '여러 API 요청을 하나의 트랜잭션으로 일괄 처리',
+    response = {200: BatchOutput, 400: ErrorMessage},
+    auth     = AuthBearer()
+)
+def run_batch(
+    request: HttpRequest,
+    data   : BatchInput
+    ) -> JsonResponse:
+    
+    """
+    JWT 토큰에서 유저정보 추출(하위 요청은 다시 인증하지 않음)
+    """
+    user = request.auth
+    
+    """
+    하위 요청 확인
+    """
+    if not data.operations:
+        return JsonResponse({'detail': '하위 요청을 입력하세요.'}, status=400)
+    
+    max_operations = settings.BATCH_MAX_OPERATIONS
+    if settings.THROTTLE_RATE:
+        max_operations = min(max_operations, settings.THROTTLE_BURST)
+    
+    if len(data.operations) > max_operations:
+        return JsonResponse({'detail': f'하위 요청은 최대 {max_operations}개까지 가능합니다.'}, status=400)
+    
+    for i, operation in enumerate(data.operations):
+        if operation.method.upper() not in BATCH_METHODS:
+            return JsonResponse({'detail': f'{i}번 요청: 지원하지 않는 메서드입니다.({operation.method})'}, status=400)
+        if not operation.path.startswith('/api/') or operation.path.startswith(request.path):
+            return JsonResponse({'detail': f'{i}번 요청: 올바르지 않은 경로입니다.({operation.path})'}, status=400)
+    
+    """
+    요청 제한: 하위 요청마다 토큰 1개(일괄 처리 요청에서 차감한 1개 포함), 부족하면 실행하지 않고 429 반환
+    """
+    retry_after = take_tokens(get_throttle_identity(request), len(data.operations) - 1)
+    if retry_after:
+        response = JsonResponse({'detail': '요청 한도를 초과했습니다. 잠시 후 다시 시도하세요.'}, status=429)
+        response['Retry-After'] = str(retry_after)
+        return response
+    
+    """
+    하위 요청을 순서대로 하나의 트랜잭션에서 실행:
+        - 하위 요청마다 savepoint를 생성하여 실패(4xx/5xx)한 요청의 변경사항만 되돌림
+        - all_or_nothing인 경우 하나라도 실패하면 전체를 되돌리고 남은 요청은 실행하지 않음(424)
+    """
+    results, committed = [], True
+    
+    with transaction.atomic():
+        for operation in data.operations:
+            if not committed:
+                results.append({'status': 424, 'body': {'detail': '이전 요청이 실패하여 실행하지 않았습니다.'}})
+                continue
+            
+            sub_request = build_sub_request(
+                request,
+                user,
+                operation.method.upper(),
+                operation.path,
+                operation.body,
+                operation.idempotency_key
+            )
+            
+            try:
+                with transaction.atomic():
+                    response = dispatch_sub_request(sub_request)
+                    if response.status_code >= 400:
+                        transaction.set_rollback(True)
+            except Exception:
+                response = JsonResponse({'detail': '요청을 처리하지 못했습니다.'}, status=500)
+            
+            results.append({'status': response.status_code, 'body': get_response_body(response)})
+            
+            if response.status_code >= 400 and data.all_or_nothing:
+                committed = False
+                transaction.set_rollback(True)
+    
+    return {'committed': committed, 'results': results}
\ No newline at end of file
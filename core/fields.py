@@ -0,0 +1,59 @@
+from typing import Dict, Optional
+
+from django.core.exceptions import ValidationError
+from django.db              import models
+
+
+class EnumField(models.PositiveSmallIntegerField):
+
+    """
+    description:
+        - 문자열 선택값을 2 bytes 정수(smallint)로 저장하는 필드
+        - values: 선택값 - 저장값(정수) 매핑, 저장값은 고정(선택값 추가 시 새로운 정수 사용, 기존 정수 재사용 금지)
+        - 코드/API에서는 기존과 같이 문자열로 사용(조회 시 문자열로 변환, 저장/필터링 시 정수로 변환)
+            - ex. filter(status='deleted'), obj.status == 'in_use'
+        - 정의되지 않은 선택값으로 저장/필터링하는 경우 ValueError(저장 전 get_enum_value로 확인)
+    """
+
+    def __init__(self, *args, values: Dict[str, int] = None, **kwargs):
+        self.values = dict(values or {})
+        self.labels = {number: value for value, number in self.values.items()}
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['values'] = self.values
+        return name, path, args, kwargs
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self.labels[value]
+
+    def to_python(self, value):
+        if value is None or value in self.values:
+            return value
+        if isinstance(value, int) and value in self.labels:
+            return self.labels[value]
+        raise ValidationError(f'{value}은/는 올바른 선택값이 아닙니다.', code='invalid_choice')
+
+    def get_prep_value(self, value):
+        if value is None or isinstance(value, int):
+            return value
+        value = str(value)
+        if value not in self.values:
+            raise ValueError(f'{self.name}: {value}은/는 올바른 선택값이 아닙니다.')
+        return self.values[value]
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+
+def get_enum_value(model, field_name: str, value: Optional[str]) -> Optional[str]:
+    """
+    입력값(대소문자 구분 없음)을 EnumField의 선택값으로 변환(정의되지 않은 값이면 None)
+    """
+    if value is None:
+        return None
+    value = value.strip().lower()
+    return value if value in model._meta.get_field(field_name).values else None
@@ -0,0 +1,13 @@
+from django.conf                 import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    
+    """
+    description:
+        - 반복 횟수(iterations)를 설정값(PASSWORD_HASH_ITERATIONS)으로 조정할 수 있는 PBKDF2 해셔
+        - 반복 횟수가 변경되면 로그인 시 must_update()로 감지하여 새 파라미터로 재해싱
+    """
+    
+    iterations = settings.PASSWORD_HASH_ITERATIONS or PBKDF2PasswordHasher.iterations
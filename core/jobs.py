@@ -0,0 +1,149 @@
+import random, traceback
+
+from datetime import datetime, timedelta
+from typing   import Callable, Optional
+
+from django.conf                import settings
+from django.core.files.storage import FileSystemStorage
+from django.db                 import transaction
+from django.db.models          import F
+
+from core.models  import Job
+from users.models import User
+
+
+"""
+description:
+    - DB 기반 작업 큐(별도의 브로커 없음)
+    - register_job으로 작업 이름과 실행 함수를 등록하고, enqueue_job으로 작업을 큐에 추가
+    - 작업 실행 함수: handler(payload: dict, job: Job) -> JSON으로 저장 가능한 결과
+    - 큰 결과(파일)는 job_file_storage에 저장하고 결과에는 파일 이름만 저장
+"""
+
+JOB_HANDLERS = {}
+
+job_file_storage = FileSystemStorage(location=settings.JOB_FILES_DIR)
+
+STALE_JOB_ERROR = '작업 실행 제한시간을 초과했습니다.(워커 종료 또는 응답 없음)'
+
+
+def register_job(name: str) -> Callable:
+    def decorator(handler: Callable) -> Callable:
+        JOB_HANDLERS[name] = handler
+        return handler
+    return decorator
+
+
+def enqueue_job(
+    name        : str,
+    payload     : Optional[dict] = None,
+    user        : Optional[User] = None,
+    run_at      : Optional[datetime] = None,
+    max_attempts: Optional[int] = None
+    ) -> Job:
+    
+    if name not in JOB_HANDLERS:
+        raise ValueError(f'Unknown job: {name}')
+    
+    return Job.objects.create(
+        name         = name,
+        payload      = payload or {},
+        user         = user,
+        run_at       = run_at or datetime.now(),
+        max_attempts = max_attempts or settings.JOB_MAX_ATTEMPTS
+    )
+
+
+def claim_job(worker_id: str) -> Optional[Job]:
+    """
+    실행 가능한 작업 하나를 선점(다른 워커가 잠근 작업은 건너뜀)
+    """
+    now = datetime.now()
+    
+    with transaction.atomic():
+        job = Job.objects\
+                 .select_for_update(skip_locked=True)\
+                 .filter(status='queued', run_at__lte=now)\
+                 .order_by('run_at', 'id')\
+                 .first()
+        if not job:
+            return None
+        
+        job.status     = 'running'
+        job.attempts  += 1
+        job.locked_at  = now
+        job.locked_by  = worker_id
+        job.save(update_fields=['status', 'attempts', 'locked_at', 'locked_by', 'updated_at'])
+    
+    return job
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    """
+    지수 backoff(+jitter): base * 2^(시도 횟수-1), 최대 JOB_RETRY_MAX_DELAY_SECONDS
+    """
+    delay = min(
+        settings.JOB_RETRY_BASE_DELAY_SECONDS * 2 ** (attempts - 1),
+        settings.JOB_RETRY_MAX_DELAY_SECONDS
+    )
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def run_job(job: Job) -> Job:
+    """
+    작업 실행 및 결과 저장(실패 시 재시도 예약 또는 실패 처리)
+    """
+    try:
+        handler = JOB_HANDLERS[job.name]
+        result  = handler(job.payload, job)
+    except Exception:
+        job.error = traceback.format_exc()
+        
+        if job.attempts < job.max_attempts:
+            job.status = 'queued'
+            job.run_at = datetime.now() + get_retry_delay(job.attempts)
+        else:
+            job.status      = 'failed'
+            job.finished_at = datetime.now()
+    else:
+        job.status      = 'succeeded'
+        job.result      = result
+        job.error       = None
+        job.finished_at = datetime.now()
+    
+    job.locked_at = None
+    job.locked_by = None
+    job.save()
+    
+    return job
+
+
+def requeue_stale_jobs() -> int:
+    """
+    description:
+        - 실행 중 워커가 종료(또는 실행 제한시간 초과)되어 running 상태로 남은 작업 처리
+        - 작업 선점 시 시도 횟수가 증가하므로 남은 작업은 이미 한번의 시도로 집계됨
+            - 최대 시도 횟수에 도달한 작업: 실패 처리(워커를 종료시키는 작업이 계속 재시도되지 않도록 함)
+            - 그 외: 재시도 간격 이후 다시 큐에 추가
+        - 다시 큐에 추가한 작업 수 반환
+    """
+    now   = datetime.now()
+    stale = Job.objects.filter(status='running', locked_at__lt=now - timedelta(seconds=settings.JOB_TIMEOUT_SECONDS))
+    
+    stale.filter(attempts__gte=F('max_attempts'))\
+         .update(
+             status      = 'failed',
+             error       = STALE_JOB_ERROR,
+             finished_at = now,
+             locked_at   = None,
+             locked_by   = None
+         )
+    
+    return stale.filter(attempts__lt=F('max_attempts'))\
+                .update(
+                    status    = 'queued',
+                    error     = STALE_JOB_ERROR,
+                    locked_at = None,
+                    locked_by = None,
+                    run_at    = now + get_retry_delay(1)
+                )
@@ -0,0 +1,88 @@
+import json, random, time
+
+from datetime import date, datetime, timedelta
+
+from django.conf                 import settings
+from django.core.management.base import BaseCommand
+
+from core.utils.compression import COMPRESSORS, compress_bytes
+
+
+class Command(BaseCommand):
+
+    """
+    description:
+        - 가계부 기록 리스트 형태의 JSON 응답에 대한 인코딩/압축 레벨별 압축률, CPU 시간 측정
+        - 응답 크기(기록 개수)별로 원본 크기, 압축 크기, 절감 비율, 응답 1건당 압축 CPU 시간(ms) 출력
+        - brotli/zstandard 패키지가 설치되지 않은 경우 해당 인코딩은 제외
+    
+    usage:
+        python manage.py benchmark_compression --logs 10 100 1000 --repeat 20
+    """
+    
+    help = '응답 압축(gzip/br/zstd) 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logs', type=int, nargs='+', default=[10, 100, 1000])
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        levels = {
+            'gzip': [1, 6, 9],
+            'br'  : [1, 5, 11],
+            'zstd': [1, 3, 19],
+        }
+        
+        for count in options['logs']:
+            payload = self._make_payload(count)
+            self.stdout.write(f'\n{count} logs: {len(payload):,} bytes')
+            
+            for encoding in COMPRESSORS:
+                for level in levels[encoding]:
+                    compressed, cpu = self._measure(encoding, level, payload, options['repeat'])
+                    default = ' (default)' if level == settings.COMPRESSION_LEVELS[encoding] else ''
+                    self.stdout.write(
+                        f'  {encoding:>4} level {level:>2}: {compressed:>9,} bytes, '
+                        f'saved {(1 - compressed / len(payload)) * 100:5.1f}%, '
+                        f'{cpu * 1000:8.3f}ms/response{default}'
+                    )
+
+    def _measure(self, encoding, level, payload, repeat):
+        started = time.process_time()
+        for _ in range(repeat):
+            compressed = compress_bytes(encoding, payload, level)
+        return len(compressed), (time.process_time() - started) / repeat
+
+    def _make_payload(self, count) -> bytes:
+        """
+        가계부 기록 리스트 API 응답(AccountBookLogListOutput)과 같은 형태의 JSON 생성
+        """
+        rand  = random.Random(count)
+        now   = datetime(2022, 11, 1, 9, 0)
+        words = ['점심', '저녁', '커피', '교통비', '월급', '관리비', '통신비', '쇼핑', '병원', '간식']
+        logs  = []
+        
+        for id in range(count, 0, -1):
+            created_at = now - timedelta(minutes=rand.randint(0, 60 * 24 * 90))
+            logs.append({
+                'id'         : id,
+                'title'      : f'{rand.choice(words)} {rand.choice(words)}',
+                'types'      : rand.choice(['income', 'expenditure', 'expenditure', 'expenditure']),
+                'price'      : str(rand.randint(1, 500) * 100),
+                'description': ' '.join(rand.choice(words) for _ in range(rand.randint(0, 12))),
+                'status'     : 'in_use',
+                'book'       : '생활비',
+                'category'   : rand.choice(['식비', '교통', '주거', '급여', None]),
+                'occurred_at': (date(2022, 11, 1) - timedelta(days=rand.randint(0, 90))).isoformat(),
+                'created_at' : created_at.strftime('%Y-%m-%d %H:%M'),
+                'updated_at' : created_at.strftime('%Y-%m-%d %H:%M'),
+            })
+        
+        data = {
+            'nickname'         : 'benchmark',
+            'expected_budget'  : '1000000',
+            'total_income'     : '3500000',
+            'total_expenditure': '1250000',
+            'logs'             : logs
+        }
+        return json.dumps(data).encode()
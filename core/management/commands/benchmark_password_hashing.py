@@ -0,0 +1,73 @@
+import asyncio, time
+
+from django.conf                 import settings
+from django.contrib.auth.hashers import check_password, make_password, get_hasher
+from django.core.management.base import BaseCommand
+
+from core.utils.hashing import acheck_password
+
+
+class Command(BaseCommand):
+    
+    """
+    description:
+        - 워커 1개 기준 초당 로그인(패스워드 확인) 처리량 측정
+        - sync: 이벤트 루프에서 직접 해싱(해싱 동안 다른 요청 처리 불가)
+        - offload: 해싱 풀에서 해싱(PASSWORD_HASH_WORKERS 만큼 동시 처리)
+        - 측정 중 이벤트 루프 지연(max loop lag)을 함께 측정하여 워커가 막히는 시간 확인
+    
+    usage:
+        python manage.py benchmark_password_hashing --logins 64
+    """
+    
+    help = '패스워드 해싱(로그인) 처리량 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=64)
+
+    def handle(self, *args, **options):
+        logins  = options['logins']
+        encoded = make_password('Benchmark1!')
+        hasher  = get_hasher('default')
+        
+        self.stdout.write(
+            f'hasher: {hasher.algorithm} (iterations: {getattr(hasher, "iterations", "-")}), '
+            f'executor: {settings.PASSWORD_HASH_EXECUTOR} x {settings.PASSWORD_HASH_WORKERS}'
+        )
+        
+        for name, run in (('sync', self._sync), ('offload', self._offload)):
+            elapsed, lag = asyncio.run(self._measure(run, encoded, logins))
+            self.stdout.write(
+                f'{name:>7}: {logins / elapsed:.1f} logins/s, max loop lag {lag * 1000:.1f}ms'
+            )
+
+    async def _measure(self, run, encoded, logins):
+        lag     = 0
+        stopped = asyncio.Event()
+        
+        async def ticker():
+            nonlocal lag
+            while not stopped.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.005)
+                lag = max(lag, time.perf_counter() - started - 0.005)
+        
+        task    = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        started = time.perf_counter()
+        await run(encoded, logins)
+        elapsed = time.perf_counter() - started
+        stopped.set()
+        await task
+        
+        return elapsed, lag
+
+    async def _sync(self, encoded, logins):
+        for _ in range(logins):
+            check_password('Benchmark1!', encoded)
+            await asyncio.sleep(0)
+
+    async def _offload(self, encoded, logins):
+        await asyncio.gather(*[
+            acheck_password('Benchmark1!', encoded) for _ in range(logins)
+        ])
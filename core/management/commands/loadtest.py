@@ -0,0 +1,155 @@
+import json
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.utils.loadtest import USER_PROFILES, PERCENTILES, prepare_account, run_load, build_report
+
+
+class Command(BaseCommand):
+
+    """
+    description:
+        - 실행중인 서버(로컬 서버 + DB)에 실제 유저 흐름으로 부하를 주고 처리량/응답 시간/에러율 측정
+        - 유저 흐름: 로그인 -> 가계부 리스트 조회 -> 기록 리스트/검색/정렬 조회, 기록 생성/수정/삭제(유저 유형별 가중치)
+        - 테스트 계정(loadtest{n}@example.com)과 계정별 가계부/카테고리/기록은 처음 실행 시 API로 생성하고 이후 재사용
+        - --output으로 리포트(JSON)를 저장하고 --compare로 이전 리포트(ex. 이전 커밋의 결과)와 비교
+        - 서버의 유저별 요청 제한(THROTTLE_RATE)에 걸리면 429가 에러로 집계되므로 측정 시 서버를 THROTTLE_RATE=0으로 실행
+        - 부하 생성기도 CPU를 사용하므로 서버와 같은 장비에서 실행하는 경우 결과 해석에 주의
+    
+    usage:
+        python manage.py loadtest --base-url http://127.0.0.1:8000 --users 50 --duration 60 --ramp-up 10 \
+            --mix reader=7,writer=3 --think-time 0.5-2 --output loadtest.json --compare loadtest-main.json
+    """
+    
+    help = '실제 유저 흐름 기반 부하 테스트'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--users', type=int, default=20, help='동시 가상 유저 수')
+        parser.add_argument('--accounts', type=int, help='사용할 테스트 계정 수(기본값: --users)')
+        parser.add_argument('--duration', type=float, default=60, help='ramp-up 이후 실행 시간(초)')
+        parser.add_argument('--ramp-up', type=float, default=10, help='가상 유저를 모두 시작하기까지의 시간(초)')
+        parser.add_argument('--mix', default='reader=7,writer=3', help='유저 유형 비율(유형=비율,...)')
+        parser.add_argument('--think-time', default='0.5-2', help='행동 사이 대기 시간(초, 최소-최대), 0이면 대기 없음')
+        parser.add_argument('--seed-logs', type=int, default=50, help='새로 만든 테스트 가계부에 생성할 기록 수')
+        parser.add_argument('--timeout', type=float, default=10)
+        parser.add_argument('--seed', type=int, default=0, help='행동 선택 난수 시드')
+        parser.add_argument('--output', help='리포트(JSON) 저장 경로')
+        parser.add_argument('--compare', help='비교할 이전 리포트(JSON) 경로')
+
+    def handle(self, *args, **options):
+        mix        = self._parse_mix(options['mix'])
+        think_time = self._parse_think_time(options['think_time'])
+        users      = options['users']
+        accounts   = options['accounts'] or users
+        
+        self.stdout.write(f'preparing {accounts} accounts on {options["base_url"]}...')
+        with ThreadPoolExecutor(max_workers=min(accounts, 8)) as executor:
+            prepared = list(executor.map(
+                lambda index: prepare_account(options['base_url'], index, options['seed_logs'], options['timeout']),
+                range(accounts)
+            ))
+        
+        self.stdout.write(
+            f'running {users} users ({options["mix"]}), ramp-up {options["ramp_up"]}s, '
+            f'duration {options["duration"]}s, think time {options["think_time"]}s...'
+        )
+        recorder = run_load(
+            base_url   = options['base_url'],
+            accounts   = prepared,
+            users      = users,
+            mix        = mix,
+            duration   = options['duration'],
+            ramp_up    = options['ramp_up'],
+            think_time = think_time,
+            timeout    = options['timeout'],
+            seed       = options['seed']
+        )
+        report = build_report(
+            recorder,
+            base_url   = options['base_url'],
+            users      = users,
+            accounts   = accounts,
+            mix        = mix,
+            duration   = options['duration'],
+            ramp_up    = options['ramp_up'],
+            think_time = list(think_time),
+            seed       = options['seed']
+        )
+        
+        self._print_report(report)
+        
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f'\nreport saved: {options["output"]}')
+        
+        if options['compare']:
+            with open(options['compare']) as f:
+                self._print_comparison(json.load(f), report)
+
+    def _parse_mix(self, value):
+        mix = {}
+        for item in value.split(','):
+            profile, _, ratio = item.partition('=')
+            profile = profile.strip()
+            if profile not in USER_PROFILES:
+                raise CommandError(f'{profile}은/는 올바른 유저 유형이 아닙니다.({", ".join(USER_PROFILES)})')
+            try:
+                mix[profile] = int(ratio or 1)
+            except ValueError:
+                raise CommandError(f'{item}은/는 올바른 유저 유형 비율이 아닙니다.')
+        if not any(mix.values()):
+            raise CommandError('유저 유형 비율은 1 이상이어야 합니다.')
+        return mix
+
+    def _parse_think_time(self, value):
+        try:
+            low, _, high = value.partition('-')
+            low  = float(low)
+            high = float(high) if high else low
+        except ValueError:
+            raise CommandError(f'{value}은/는 올바른 think time이 아닙니다.(ex. 0.5-2)')
+        if low < 0 or high < low:
+            raise CommandError(f'{value}은/는 올바른 think time이 아닙니다.(ex. 0.5-2)')
+        return low, high
+
+    def _print_report(self, report):
+        columns = ['requests', 'rps', 'error_rate'] + [f'p{percent}_ms' for percent in PERCENTILES] + ['max_ms']
+        
+        self.stdout.write(
+            f'\nrevision {report["meta"]["revision"] or "-"}, started at {report["meta"]["started_at"]}'
+            f', excluding {report["ramp_up_requests"]} ramp-up requests'
+        )
+        self.stdout.write(f'  {"endpoint":<16}' + ''.join(f'{column:>12}' for column in columns) + '  statuses')
+        for name, summary in [*report['endpoints'].items(), ('total', report['total'])]:
+            self.stdout.write(
+                f'  {name:<16}' + ''.join(f'{summary[column]:>12}' for column in columns)
+                + '  ' + ', '.join(f'{status}: {count}' for status, count in summary['statuses'].items())
+            )
+
+    def _print_comparison(self, base, report):
+        """
+        이전 리포트 대비 처리량(rps), p95 응답 시간, 에러율 변화
+        """
+        self.stdout.write(f'\ncompare: {base["meta"].get("revision") or "-"} -> {report["meta"]["revision"] or "-"}')
+        for key in ('users', 'mix', 'think_time', 'duration', 'ramp_up'):
+            if base['meta'].get(key) != report['meta'].get(key):
+                self.stdout.write(f'  warning: {key} differs ({base["meta"].get(key)} -> {report["meta"].get(key)})')
+
+        def change(before, after):
+            return f'{(after - before) / before * 100:+7.1f}%' if before else '      -'
+        
+        self.stdout.write(f'  {"endpoint":<16}{"rps":>26}{"p95_ms":>28}{"error_rate":>24}')
+        names = [name for name in report['endpoints'] if name in base['endpoints']] + ['total']
+        for name in names:
+            before = base['total'] if name == 'total' else base['endpoints'][name]
+            after  = report['total'] if name == 'total' else report['endpoints'][name]
+            self.stdout.write(
+                f'  {name:<16}'
+                f'{before["rps"]:>9} -> {after["rps"]:>7} {change(before["rps"], after["rps"])}'
+                f'{before["p95_ms"]:>11} -> {after["p95_ms"]:>7} {change(before["p95_ms"], after["p95_ms"])}'
+                f'{before["error_rate"]:>12} -> {after["error_rate"]:>7}'
+            )
@@ -0,0 +1,149 @@
+import json, os, subprocess, sys
+
+from collections import defaultdict
+
+from django.conf                 import settings
+from django.core.management.base import BaseCommand
+
+
+"""
+새 프로세스에서 실행하는 측정 스크립트
+    - 프로세스 시작부터 WSGI 애플리케이션 로드, 첫 요청 응답, 두번째 요청 응답까지의 시간 측정
+    - 요청은 인증이 필요한 API에 토큰 없이 보내므로(401) DB 연결 없이 url/미들웨어/API 로드 비용만 측정
+    - MEASURE_WARMUP 환경변수가 있으면 애플리케이션 로드 후 warm-up(fork 이전 단계)을 실행한 뒤 요청
+"""
+PROBE_SCRIPT = '''
+import io, json, os, sys, time
+started = time.perf_counter()
+
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+loaded = time.perf_counter()
+
+if os.environ.get('MEASURE_WARMUP'):
+    from config.warmup import warm_up
+    warm_up()
+warmed = time.perf_counter()
+
+from django.conf import settings
+host = next((host for host in settings.ALLOWED_HOSTS if host and host != '*'), 'localhost').lstrip('.')
+
+def request():
+    environ = {
+        'REQUEST_METHOD' : 'GET',
+        'PATH_INFO'      : sys.argv[1],
+        'QUERY_STRING'   : '',
+        'SERVER_NAME'    : host,
+        'SERVER_PORT'    : '80',
+        'HTTP_HOST'      : host,
+        'wsgi.input'     : io.BytesIO(),
+        'wsgi.errors'    : sys.stderr,
+        'wsgi.url_scheme': 'http',
+    }
+    status = []
+    b''.join(application(environ, lambda s, h, e=None: status.append(s)))
+    return status[0]
+
+status = request()
+first  = time.perf_counter()
+request()
+second = time.perf_counter()
+
+print(json.dumps({
+    'status'       : status,
+    'modules'      : len(sys.modules),
+    'load'         : loaded - started,
+    'warmup'       : warmed - loaded,
+    'first_request': first - warmed,
+    'ready'        : first - started,
+    'warm_request' : second - first,
+}))
+'''
+
+
+class Command(BaseCommand):
+
+    """
+    description:
+        - 워커 콜드 스타트 지연 측정(오토스케일링 시 새 워커가 첫 요청을 처리하기까지의 시간)
+        - 현재 설정(--settings)으로 새 파이썬 프로세스를 실행하여 측정
+        - import time: python -X importtime 결과를 최상위 패키지별로 합산하여 상위 N개 출력
+        - time to first request: 프로세스 시작 -> WSGI 애플리케이션 로드 -> 첫 요청 응답까지의 시간
+        - --warmup: config.warmup.warm_up() 적용 전후의 첫 요청 응답 시간 비교
+    
+    usage:
+        python manage.py measure_startup --settings config.settings_production --repeat 5 --warmup
+    """
+    
+    help = '워커 시작 시간(모듈별 import 시간, 첫 요청까지의 시간) 측정'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/account-books')
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--top', type=int, default=15)
+        parser.add_argument('--warmup', action='store_true', help='warm-up 적용 전후 첫 요청까지의 시간 비교')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'settings: {settings.SETTINGS_MODULE}')
+        
+        self._report_import_time(options['path'], options['top'])
+        self._report_first_request(options['path'], options['repeat'], options['warmup'])
+
+    def _run(self, path, *flags, warmup=False):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        if warmup:
+            env['MEASURE_WARMUP'] = '1'
+        return subprocess.run(
+            [sys.executable, *flags, '-c', PROBE_SCRIPT, path],
+            cwd            = settings.BASE_DIR,
+            env            = env,
+            capture_output = True,
+            text           = True,
+            check          = True
+        )
+
+    def _report_import_time(self, path, top):
+        """
+        -X importtime 출력(self us | cumulative us | module)의 self 시간을 최상위 패키지별로 합산
+        """
+        result  = self._run(path, '-X', 'importtime')
+        totals  = defaultdict(int)
+        modules = defaultdict(int)
+        
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, _, name = [column.strip() for column in line[len('import time:'):].split('|')]
+            package = name.split('.')[0]
+            totals[package]  += int(self_us)
+            modules[package] += 1
+        
+        self.stdout.write(f'\nimport time (total {sum(totals.values()) / 1000:.1f}ms, {sum(modules.values())} modules)')
+        for package, us in sorted(totals.items(), key=lambda item: -item[1])[:top]:
+            self.stdout.write(f'  {package:<24} {us / 1000:8.1f}ms  ({modules[package]} modules)')
+
+    def _report_first_request(self, path, repeat, warmup):
+        """
+        warm-up 없이/warm-up 후(--warmup) 첫 요청까지의 시간 비교
+        """
+        modes = {'cold': False, 'warm-up': True} if warmup else {'cold': False}
+        runs  = {
+            mode: [json.loads(self._run(path, warmup=enabled).stdout.strip().splitlines()[-1]) for _ in range(repeat)]
+            for mode, enabled in modes.items()
+        }
+
+        def median(mode, key):
+            values = sorted(run[key] for run in runs[mode])
+            return values[len(values) // 2] * 1000
+        
+        self.stdout.write(f'\ntime to first request (median of {repeat}, GET {path} -> {runs["cold"][0]["status"]})')
+        self.stdout.write(f'  {"":<18}' + ''.join(f'{mode:>10}' for mode in modes))
+        for label, key in (
+            ('application load', 'load'),
+            ('warm-up', 'warmup'),
+            ('first request', 'first_request'),
+            ('ready (total)', 'ready'),
+            ('warm request', 'warm_request'),
+        ):
+            self.stdout.write(f'  {label:<18}' + ''.join(f'{median(mode, key):8.1f}ms' for mode in modes))
+        self.stdout.write(f'  {"loaded modules":<18}' + ''.join(f'{runs[mode][0]["modules"]:>10}' for mode in modes))
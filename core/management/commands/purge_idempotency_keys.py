@@ -0,0 +1,42 @@
+import time
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from core.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    
+    """
+    description:
+        - 만료된 Idempotency-Key 저장 응답을 배치 단위로 삭제
+    
+    usage:
+        python manage.py purge_idempotency_keys --batch-size 1000
+    """
+    
+    help = '만료된 Idempotency-Key를 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--sleep', type=float, default=0.1)
+
+    def handle(self, *args, **options):
+        now   = datetime.now()
+        total = 0
+        
+        while True:
+            ids = list(
+                IdempotencyKey.objects\
+                              .filter(expires_at__lt=now)\
+                              .values_list('id', flat=True)[:options['batch_size']]
+            )
+            if not ids:
+                break
+            
+            total += IdempotencyKey.objects.filter(id__in=ids).delete()[0]
+            time.sleep(options['sleep'])
+        
+        self.stdout.write(self.style.SUCCESS(f'purged {total} idempotency keys'))
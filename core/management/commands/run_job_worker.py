@@ -0,0 +1,72 @@
+import os, socket, threading, time
+
+from django.core.management.base import BaseCommand
+from django.db                   import close_old_connections, connection
+
+from core.jobs import claim_job, run_job, requeue_stale_jobs
+
+
+class Command(BaseCommand):
+    
+    """
+    description:
+        - DB 작업 큐 워커(--concurrency 개수만큼 스레드로 작업 실행)
+        - 각 스레드는 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 하나씩 선점하여 실행
+        - 실행할 작업이 없으면 --poll-interval(초) 동안 대기
+        - --once 옵션 사용 시 큐가 빌 때까지만 실행
+    
+    usage:
+        python manage.py run_job_worker --concurrency 4
+    """
+    
+    help = 'DB 작업 큐 워커를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=1)
+        parser.add_argument('--poll-interval', type=float, default=1.0)
+        parser.add_argument('--once', action='store_true')
+
+    def handle(self, *args, **options):
+        self.stopped = threading.Event()
+        self.once    = options['once']
+        self.poll    = options['poll_interval']
+        
+        requeue_stale_jobs()
+        
+        threads = [
+            threading.Thread(
+                target = self._work,
+                args   = (f'{socket.gethostname()}:{os.getpid()}:{index}', ),
+                daemon = True
+            )
+            for index in range(options['concurrency'])
+        ]
+        for thread in threads:
+            thread.start()
+        
+        try:
+            while any(thread.is_alive() for thread in threads):
+                time.sleep(self.poll)
+                if not self.once:
+                    requeue_stale_jobs()
+        except KeyboardInterrupt:
+            self.stopped.set()
+            for thread in threads:
+                thread.join()
+
+    def _work(self, worker_id: str):
+        try:
+            while not self.stopped.is_set():
+                close_old_connections()
+                
+                job = claim_job(worker_id)
+                if not job:
+                    if self.once:
+                        break
+                    self.stopped.wait(self.poll)
+                    continue
+                
+                job = run_job(job)
+                self.stdout.write(f'[{worker_id}] job {job.id}({job.name}): {job.status}')
+        finally:
+            connection.close()
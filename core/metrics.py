@@ -0,0 +1,174 @@
+import bisect, glob, json, os, threading, time
+
+from collections import defaultdict
+from typing      import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+
+
+"""
+description:
+    - Prometheus 텍스트 형식 메트릭 수집/노출
+    - 프로세스별 메모리 registry에 수집(요청 처리 중에는 lock 안에서 dict 갱신만 수행)
+    - 멀티 프로세스 배포: METRICS_DIR이 설정된 경우 프로세스마다 일정 주기로 registry snapshot을 파일로 저장하고,
+      /metrics 요청을 받은 프로세스가 모든 snapshot을 합산하여 응답
+      (METRICS_SNAPSHOT_TTL_SECONDS 동안 갱신되지 않은 snapshot은 종료된 프로세스로 보고 제외)
+"""
+
+LATENCY_BUCKETS  = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+DB_QUERY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+
+"""
+메트릭 이름 - (타입, 설명, histogram 버킷)
+"""
+METRICS = {
+    'http_requests_total'          : ('counter', 'HTTP 요청 수', None),
+    'http_request_duration_seconds': ('histogram', 'HTTP 요청 처리 시간', LATENCY_BUCKETS),
+    'db_queries_total'             : ('counter', 'DB 쿼리 수', None),
+    'db_query_duration_seconds'    : ('histogram', '요청별 DB 쿼리 실행 시간 합계', DB_QUERY_BUCKETS),
+    'db_connections_opened_total'  : ('counter', '생성된 DB 연결 수', None),
+    'db_connections_open'          : ('gauge', '열려있는 DB 연결 수', None),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Registry:
+    def __init__(self):
+        self.lock       = threading.Lock()
+        self.values     : Dict[Tuple[str, Labels], float] = defaultdict(float)
+        self.histograms : Dict[Tuple[str, Labels], List[float]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.values[key] += value
+
+    def set(self, name: str, value: float, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.values[key] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """
+        histogram 관측값 추가: [버킷별 개수..., 합계, 개수]
+        """
+        buckets = METRICS[name][2]
+        key     = (name, tuple(sorted(labels.items())))
+        index   = bisect.bisect_left(buckets, value)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0] * (len(buckets) + 2)
+            if index < len(buckets):
+                histogram[index] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                'values'    : [[name, list(labels), value] for (name, labels), value in self.values.items()],
+                'histograms': [[name, list(labels), list(data)] for (name, labels), data in self.histograms.items()],
+            }
+
+
+registry = Registry()
+
+_last_flush = 0.0
+
+
+def flush_snapshot(force: bool = False) -> None:
+    """
+    현재 프로세스의 registry snapshot 저장(METRICS_FLUSH_SECONDS 주기, 임시 파일에 쓴 뒤 교체)
+    """
+    global _last_flush
+    
+    if not settings.METRICS_DIR:
+        return
+    
+    now = time.time()
+    if not force and now - _last_flush < settings.METRICS_FLUSH_SECONDS:
+        return
+    _last_flush = now
+    
+    os.makedirs(settings.METRICS_DIR, exist_ok=True)
+    path = os.path.join(settings.METRICS_DIR, f'{os.getpid()}.json')
+    with open(f'{path}.tmp', 'w') as f:
+        json.dump(registry.snapshot(), f)
+    os.replace(f'{path}.tmp', path)
+
+
+def _load_snapshots() -> Iterable[dict]:
+    if not settings.METRICS_DIR:
+        yield registry.snapshot()
+        return
+    
+    flush_snapshot(force=True)
+    
+    expired_at = time.time() - settings.METRICS_SNAPSHOT_TTL_SECONDS
+    for path in glob.glob(os.path.join(settings.METRICS_DIR, '*.json')):
+        try:
+            if os.path.getmtime(path) < expired_at:
+                os.remove(path)
+                continue
+            with open(path) as f:
+                yield json.load(f)
+        except (OSError, ValueError):
+            continue
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _format_labels(labels: Labels, **extra) -> str:
+    items = list(labels) + list(extra.items())
+    if not items:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in items) + '}'
+
+
+def render_metrics() -> str:
+    """
+    모든 프로세스의 snapshot을 합산하여 Prometheus 텍스트 형식으로 변환
+    """
+    values     = defaultdict(float)
+    histograms = {}
+    
+    for snapshot in _load_snapshots():
+        for name, labels, value in snapshot['values']:
+            values[(name, tuple(map(tuple, labels)))] += value
+        for name, labels, data in snapshot['histograms']:
+            key = (name, tuple(map(tuple, labels)))
+            if key not in histograms:
+                histograms[key] = [0] * len(data)
+            histograms[key] = [total + value for total, value in zip(histograms[key], data)]
+    
+    lines = []
+    for name, (kind, help, buckets) in METRICS.items():
+        lines += [f'# HELP {name} {help}', f'# TYPE {name} {kind}']
+        
+        if kind != 'histogram':
+            for (metric, labels), value in sorted(values.items()):
+                if metric == name:
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+            continue
+        
+        for (metric, labels), data in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, data):
+                cumulative += count
+                lines.append(f'{name}_bucket{_format_labels(labels, le=repr(float(bound)))} {_format_value(cumulative)}')
+            lines.append(f'{name}_bucket{_format_labels(labels, le="+Inf")} {_format_value(data[-1])}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(data[-2])}')
+            lines.append(f'{name}_count{_format_labels(labels)} {_format_value(data[-1])}')
+    
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,454 @@
+import cProfile, hashlib, hmac, io, json, os, pstats, time
+
+from contextlib import contextmanager, ExitStack
+from datetime   import datetime, timedelta
+from functools  import partial
+
+from django.conf            import settings
+from django.core.cache      import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db              import IntegrityError, connections, transaction
+from django.http            import HttpResponse, JsonResponse
+from django.utils.cache     import patch_vary_headers
+
+from core.metrics           import registry, flush_snapshot
+from core.models            import IdempotencyKey
+from core.utils.auth        import get_user_id_from_request
+from core.utils.compression import get_available_encodings, choose_encoding, compress_bytes, compress_stream
+from core.utils.throttle    import acquire_in_flight, release_in_flight, get_throttle_identity, take_tokens
+from users.models           import User
+
+
+class AdmissionControlMiddleware:
+
+    """
+    description:
+        - API 요청에 대한 유입 제어(DB 과부하 방지)
+        - 노드별 동시 처리 요청 수 제한(모든 워커 프로세스 합계): 초과 시 즉시 503 반환
+        - 유저(비로그인은 IP)별 요청 제한: 초과 시 즉시 429 반환
+        - 카운터는 Django 캐시에 저장(core.utils.throttle 참고, 공유 캐시 사용 시 워커 간 공유, 프로세스별 캐시에서는 워커 수만큼 한도가 늘어남)
+        - 일괄 처리 API는 하위 요청 수만큼 같은 요청 제한에서 추가로 차감(core.api.run_batch)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not request.path.startswith('/api/'):
+            return self.get_response(request)
+        
+        """
+        동시 처리 요청 수 확인
+        """
+        in_flight_key = acquire_in_flight()
+        if not in_flight_key:
+            response = JsonResponse({'detail': '요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요.'}, status=503)
+            response['Retry-After'] = '1'
+            return response
+        
+        try:
+            """
+            유저별 요청 제한 확인
+            """
+            retry_after = take_tokens(get_throttle_identity(request))
+            if retry_after:
+                response = JsonResponse({'detail': '요청 한도를 초과했습니다. 잠시 후 다시 시도하세요.'}, status=429)
+                response['Retry-After'] = str(retry_after)
+                return response
+            
+            return self.get_response(request)
+        finally:
+            release_in_flight(in_flight_key)
+
+
+
+
+class IdempotencyMiddleware:
+
+    """
+    description:
+        - Idempotency-Key 헤더가 있는 쓰기 요청(POST/PUT/PATCH/DELETE)을 한번만 실행
+        - 최초 요청: 키를 처리중(in_progress)으로 저장 -> API 실행 -> 응답 저장(completed)
+        - 재요청: 저장된 응답을 그대로 반환(Idempotent-Replayed 헤더 포함)
+        - 처리중인 동일 키 요청: 409 반환(동시 중복 요청)
+        - 같은 키로 다른 요청(메서드/경로/본문)을 보낸 경우: 422 반환
+        - 성공(2xx) 응답과 같은 요청이면 결과가 같은 4xx 응답(입력값 에러 등)만 저장
+          (5xx, 인증/권한(401/403), 충돌(409), 요청 제한(429) 등 일시적인 응답은 저장하지 않으므로 같은 키로 재시도 가능)
+        - 키는 만료기간까지 검증한 JWT 토큰의 유저 기준으로 저장
+        - 저장된 응답은 IDEMPOTENCY_KEY_TTL_SECONDS 이후 만료
+    """
+    
+    METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+    
+    """
+    재시도 시 결과가 달라질 수 있어 저장하지 않는 4xx 응답
+    """
+    TRANSIENT_STATUSES = (401, 403, 408, 409, 425, 429)
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        key = request.headers.get('Idempotency-Key')
+        
+        if not key or request.method not in self.METHODS or not request.path.startswith('/api/'):
+            return self.get_response(request)
+        
+        user_id = get_user_id_from_request(request, verified=True)
+        if not user_id:
+            return self.get_response(request)
+        
+        if len(key) > 255:
+            return JsonResponse({'detail': 'Idempotency-Key는 255자 이하로 입력하세요.'}, status=400)
+        
+        request_hash = hashlib.sha256(
+            b'\n'.join([request.method.encode(), request.get_full_path().encode(), request.body])
+        ).hexdigest()
+        
+        record, response = self._begin(user_id, key, request_hash)
+        if response:
+            return response
+        if not record:
+            return self.get_response(request)
+        
+        try:
+            response = self.get_response(request)
+        except Exception:
+            record.delete()
+            raise
+        
+        """
+        성공(2xx) 응답, 일시적이지 않은 4xx 응답만 저장(그 외 응답, 스트리밍 응답은 키 삭제)
+        """
+        if not self._is_storable(response):
+            record.delete()
+            return response
+        
+        record.status          = 'completed'
+        record.response_status = response.status_code
+        record.response_type   = response.get('Content-Type')
+        record.response_body   = response.content
+        record.save(update_fields=['status', 'response_status', 'response_type', 'response_body', 'updated_at'])
+        
+        return response
+
+    def _is_storable(self, response) -> bool:
+        if response.streaming:
+            return False
+        if 200 <= response.status_code < 300:
+            return True
+        return 400 <= response.status_code < 500 and response.status_code not in self.TRANSIENT_STATUSES
+
+    def _begin(self, user_id, key, request_hash):
+        """
+        키 선점(insert) 시도:
+            - 성공 시 (키 객체, None) 반환
+            - 이미 존재하는 키인 경우 (None, 재사용 응답/에러 응답) 반환
+        """
+        now = datetime.now()
+        
+        for _ in range(2):
+            try:
+                with transaction.atomic():
+                    record = IdempotencyKey.objects.create(
+                        user_id      = user_id,
+                        key          = key,
+                        request_hash = request_hash,
+                        expires_at   = now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS)
+                    )
+                return record, None
+            except IntegrityError:
+                pass
+            
+            try:
+                existing = IdempotencyKey.objects.get(user_id=user_id, key=key)
+            except IdempotencyKey.DoesNotExist:
+                """
+                유저 정보가 없는 경우(FK 위반) 등은 키 없이 처리(인증 단계에서 처리됨)
+                """
+                return None, None
+            
+            """
+            만료된 키, 처리중 상태로 오래 남아있는 키(처리 중 프로세스 종료)는 삭제 후 다시 선점
+            """
+            abandoned = existing.status == 'in_progress'\
+                        and existing.updated_at < now - timedelta(seconds=settings.IDEMPOTENCY_KEY_LOCK_SECONDS)
+            if existing.expires_at < now or abandoned:
+                IdempotencyKey.objects.filter(id=existing.id, updated_at=existing.updated_at).delete()
+                continue
+            
+            if existing.request_hash != request_hash:
+                return None, JsonResponse({'detail': '다른 요청에 사용된 Idempotency-Key입니다.'}, status=422)
+            
+            if existing.status == 'in_progress':
+                response = JsonResponse({'detail': '동일한 Idempotency-Key의 요청이 처리중입니다.'}, status=409)
+                response['Retry-After'] = '1'
+                return None, response
+            
+            response = HttpResponse(
+                bytes(existing.response_body or b''),
+                status       = existing.response_status,
+                content_type = existing.response_type
+            )
+            response['Idempotent-Replayed'] = 'true'
+            return None, response
+        
+        return None, JsonResponse({'detail': '동일한 Idempotency-Key의 요청이 처리중입니다.'}, status=409)
+
+
+
+class CompressionMiddleware:
+
+    """
+    description:
+        - 응답 압축(Accept-Encoding에 따라 zstd/br/gzip 중 서버 선호 순서가 가장 높은 인코딩 사용)
+        - 압축 대상: COMPRESSION_CONTENT_TYPES에 포함된 응답 중 COMPRESSION_MIN_SIZE 이상인 응답
+        - 스트리밍 응답은 크기를 알 수 없으므로 content type만 확인하고 chunk 단위로 압축
+        - 압축 결과가 원본보다 크면 원본 그대로 반환
+        - 인증 정보가 포함된 API 응답이므로 BREACH 공격 대상이 될 수 있는 비밀값(CSRF 토큰 등)은 응답에 포함하지 않음
+    """
+
+    def __init__(self, get_response):
+        self.get_response  = get_response
+        self.encodings     = get_available_encodings()
+        self.min_size      = settings.COMPRESSION_MIN_SIZE
+        self.content_types = settings.COMPRESSION_CONTENT_TYPES
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        
+        if not self.encodings or response.has_header('Content-Encoding'):
+            return response
+        
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type not in self.content_types:
+            return response
+        
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+        
+        """
+        Accept-Encoding에 따라 응답이 달라지므로 캐시가 구분할 수 있도록 Vary 헤더 추가
+        """
+        patch_vary_headers(response, ('Accept-Encoding',))
+        
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), self.encodings)
+        if not encoding:
+            return response
+        
+        if response.streaming:
+            response.streaming_content = compress_stream(encoding, response.streaming_content)
+            del response['Content-Length']
+        else:
+            compressed = compress_bytes(encoding, response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content           = compressed
+            response['Content-Length'] = str(len(compressed))
+        
+        """
+        압축된 응답은 원본과 바이트가 다르므로 strong ETag를 weak ETag로 변경
+        """
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        
+        response['Content-Encoding'] = encoding
+        return response
+
+
+
+class MetricsMiddleware:
+
+    """
+    description:
+        - Prometheus 메트릭 수집(/metrics로 노출, core.metrics 참고)
+        - 요청 수(route/method/status), 요청 처리 시간(route/method), DB 쿼리 수/실행 시간(route), 열려있는 DB 연결 수
+        - route 라벨은 url 경로 대신 Ninja operation id 사용(경로 파라미터로 인한 라벨 개수 증가 방지)
+            - API가 아닌 url은 url name, 매칭되는 url이 없으면 unmatched
+        - METRICS_ENABLED가 아니면 미들웨어를 로드하지 않음
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed()
+        
+        self.get_response = get_response
+        self.routes       = {}
+
+    def __call__(self, request):
+        stats   = [0, 0.0]
+        started = time.perf_counter()
+        
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(partial(_count_query, stats)))
+            response = self.get_response(request)
+        
+        elapsed = time.perf_counter() - started
+        route   = self._get_route(request)
+        
+        registry.inc('http_requests_total', route=route, method=request.method, status=str(response.status_code))
+        registry.observe('http_request_duration_seconds', elapsed, route=route, method=request.method)
+        if stats[0]:
+            registry.inc('db_queries_total', stats[0], route=route)
+            registry.observe('db_query_duration_seconds', stats[1], route=route)
+        
+        for alias in connections:
+            registry.set('db_connections_open', int(connections[alias].connection is not None), alias=alias)
+        
+        flush_snapshot()
+        return response
+
+    def _get_route(self, request) -> str:
+        match = getattr(request, 'resolver_match', None)
+        if not match:
+            return 'unmatched'
+        
+        """
+        Ninja url의 view는 PathView의 bound method(경로별 operation 목록), 요청 메서드에 해당하는 operation id 사용
+        """
+        path_view = getattr(match.func, '__self__', None)
+        key       = (id(path_view), request.method)
+        if key in self.routes:
+            return self.routes[key]
+        
+        route = match.url_name or match.view_name or 'unmatched'
+        for operation in getattr(path_view, 'operations', []):
+            if request.method in operation.methods:
+                route = operation.operation_id or operation.api.get_openapi_operation_id(operation)
+                break
+        
+        self.routes[key] = route
+        return route
+
+
+
+class ProfilerMiddleware:
+
+    """
+    description:
+        - 요청 단위 프로파일링(cProfile) 및 SQL 실행 시간 수집
+        - PROFILER_ENABLED가 아니면 미들웨어를 로드하지 않음(MiddlewareNotUsed, 비활성화 시 오버헤드 없음)
+        - X-Profile 헤더가 있는 요청 중 아래 조건을 만족하는 요청만 프로파일링
+            - 헤더 값이 PROFILER_SECRET과 일치
+            - 또는 요청한 유저(JWT)가 관리자(is_admin)
+        - 결과 저장:
+            - 기본: PROFILER_DIR에 pstats 파일(.prof)과 SQL 실행 시간(.sql.json) 저장, 응답의 X-Profile-Id 헤더로 파일명 전달
+            - X-Profile: inline 옵션(ex. X-Profile: <secret>;inline): 원래 응답 대신 프로파일 결과(JSON) 반환
+        - 분당 최대 프로파일링 횟수 제한(초과 시 프로파일링 없이 처리, 공유 캐시 사용 시 모든 워커 합산)
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROFILER_ENABLED:
+            raise MiddlewareNotUsed()
+        
+        self.get_response = get_response
+        self.secret       = settings.PROFILER_SECRET
+        self.directory    = settings.PROFILER_DIR
+        self.rate_limit   = settings.PROFILER_MAX_PER_MINUTE
+        
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __call__(self, request):
+        header = request.headers.get('X-Profile')
+        if not header:
+            return self.get_response(request)
+        
+        token, _, option = header.partition(';')
+        if not self._is_allowed(request, token.strip()):
+            return self.get_response(request)
+        
+        if not self._take_slot():
+            response = self.get_response(request)
+            response['X-Profile-Skipped'] = 'rate-limited'
+            return response
+        
+        queries  = []
+        profiler = cProfile.Profile()
+        started  = time.perf_counter()
+        
+        with _capture_queries(queries):
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        
+        elapsed = time.perf_counter() - started
+        summary = {
+            'method'      : request.method,
+            'path'        : request.get_full_path(),
+            'status'      : response.status_code,
+            'elapsed_ms'  : round(elapsed * 1000, 3),
+            'sql_count'   : len(queries),
+            'sql_total_ms': round(sum(query['duration_ms'] for query in queries), 3),
+            'sql'         : queries,
+        }
+        
+        if option.strip() == 'inline':
+            stats = io.StringIO()
+            pstats.Stats(profiler, stream=stats).sort_stats('cumulative').print_stats(settings.PROFILER_INLINE_LINES)
+            return JsonResponse({**summary, 'profile': stats.getvalue()})
+        
+        profile_id = f'{time.strftime("%Y%m%d%H%M%S")}-{os.getpid()}-{id(request):x}'
+        profiler.dump_stats(os.path.join(self.directory, f'{profile_id}.prof'))
+        with open(os.path.join(self.directory, f'{profile_id}.sql.json'), 'w') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        
+        response['X-Profile-Id'] = profile_id
+        return response
+
+    def _is_allowed(self, request, token: str) -> bool:
+        if self.secret and hmac.compare_digest(token.encode(), self.secret.encode()):
+            return True
+        
+        user_id = get_user_id_from_request(request)
+        return bool(user_id) and User.objects.filter(id=user_id, is_admin=True).exists()
+
+    def _take_slot(self) -> bool:
+        """
+        분 단위 고정 윈도우로 프로파일링 횟수 제한
+        """
+        key = f'profiler:{int(time.time() // 60)}'
+        cache.add(key, 0, 60)
+        try:
+            return cache.incr(key) <= self.rate_limit
+        except ValueError:
+            return False
+
+
+@contextmanager
+def _capture_queries(queries: list):
+    """
+    모든 DB 연결의 SQL 실행 시간 수집(execute_wrapper)
+    """
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(partial(_record_query, queries, alias)))
+        yield
+
+
+def _record_query(queries, alias, execute, sql, params, many, context):
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        queries.append({
+            'alias'      : alias,
+            'sql'        : sql,
+            'many'       : many,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 3),
+        })
+
+
+def _count_query(stats, execute, sql, params, many, context):
+    """
+    요청 단위 DB 쿼리 수/실행 시간 합계 수집(쿼리 1건마다 호출되므로 최소한의 연산만 수행)
+    """
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats[0] += 1
+        stats[1] += time.perf_counter() - started
@@ -7,4 +7,72 @@ class TimeStampModel(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
-        abstract = True
\ No newline at end of file
+        abstract = True
+
+class IdempotencyKey(TimeStampModel):
+    
+    """
+    description:
+        - Idempotency-Key 헤더로 요청한 쓰기 API(생성/수정/삭제)의 최초 응답을 저장
+        - 동일한 키로 재요청하는 경우 API를 다시 실행하지 않고 저장된 응답을 반환
+        - (유저, 키) unique 제약조건으로 동시에 들어온 중복 요청을 구분
+    """
+    
+    STATUS_TYPES = [
+        ('in_progress', 'IdempotencyKey in progress'),
+        ('completed', 'IdempotencyKey completed'),
+    ]
+    
+    user            = models.ForeignKey('users.User', on_delete=models.CASCADE)
+    key             = models.CharField(max_length=255)
+    request_hash    = models.CharField(max_length=64)
+    status          = models.CharField(max_length=20, choices=STATUS_TYPES, default='in_progress')
+    response_status = models.PositiveSmallIntegerField(null=True)
+    response_type   = models.CharField(max_length=100, null=True)
+    response_body   = models.BinaryField(null=True)
+    expires_at      = models.DateTimeField(db_index=True)
+    
+    class Meta:
+        db_table    = 'idempotency_keys'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='idempotency_keys_user_key'),
+        ]
+
+
+class Job(TimeStampModel):
+    
+    """
+    description:
+        - 요청 처리 흐름 밖에서 실행할 작업(내보내기, 보관처리 등) 큐
+        - 워커(run_job_worker)가 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가 실행
+        - 실패 시 max_attempts까지 backoff 후 재시도
+    """
+    
+    STATUS_TYPES = [
+        ('queued', 'Job queued'),
+        ('running', 'Job running'),
+        ('succeeded', 'Job succeeded'),
+        ('failed', 'Job failed'),
+    ]
+    
+    user         = models.ForeignKey('users.User', on_delete=models.CASCADE, null=True, blank=True)
+    name         = models.CharField(max_length=100)
+    payload      = models.JSONField(default=dict)
+    status       = models.CharField(max_length=20, choices=STATUS_TYPES, default='queued')
+    attempts     = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_at       = models.DateTimeField()
+    locked_at    = models.DateTimeField(null=True, blank=True)
+    locked_by    = models.CharField(max_length=100, null=True, blank=True)
+    finished_at  = models.DateTimeField(null=True, blank=True)
+    result       = models.JSONField(null=True, blank=True)
+    error        = models.TextField(null=True, blank=True)
+    
+    def __str__(self):
+        return f'{self.name} - {self.status}'
+    
+    class Meta:
+        db_table = 'jobs'
+        indexes  = [
+            models.Index(fields=['status', 'run_at'], name='jobs_status_run_at'),
+        ]
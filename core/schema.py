@@ -1,6 +1,49 @@
+from typing   import Optional, Any, List
+from datetime import datetime
+
 from ninja import Schema
 
 
 class ErrorMessage(Schema):
     detail: str
-    status: int
\ No newline at end of file
+    status: int
+
+
+class JobOutput(Schema):
+    id          : int
+    name        : str
+    status      : str
+    attempts    : int
+    max_attempts: int
+    run_at      : datetime
+    finished_at : Optional[datetime] = None
+    error       : Optional[str] = None
+    created_at  : datetime
+
+
+class JobResultOutput(Schema):
+    id    : int
+    status: str
+    result: Any = None
+
+
+class BatchOperationInput(Schema):
+    method         : str
+    path           : str
+    body           : Any = None
+    idempotency_key: Optional[str] = None
+
+
+class BatchInput(Schema):
+    operations    : List[BatchOperationInput]
+    all_or_nothing: bool = True
+
+
+class BatchOperationOutput(Schema):
+    status: int
+    body  : Any = None
+
+
+class BatchOutput(Schema):
+    committed: bool
+    results  : List[BatchOperationOutput]
\ No newline at end of file
@@ -0,0 +1,12 @@
+from django.db.backends.signals import connection_created
+from django.dispatch            import receiver
+
+from core.metrics import registry
+
+
+"""
+DB 연결 생성 수 수집(메트릭)
+"""
+@receiver(connection_created)
+def count_connection_created(sender, connection, **kwargs):
+    registry.inc('db_connections_opened_total', alias=connection.alias)
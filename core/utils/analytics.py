@@ -0,0 +1,229 @@
+import numpy as np
+
+from datetime import date, timedelta
+from typing   import Dict, List, Optional, Tuple
+
+from django.conf                import settings
+from django.core.cache          import cache
+from django.db.models           import F, Value, IntegerField, ExpressionWrapper
+from django.db.models.functions import Coalesce
+
+from account_books.models import AccountBookLog, TYPES_VALUES
+from core.utils.cache     import get_user_cache_key
+
+
+"""
+description:
+    - 유저의 사용중인 가계부 기록을 컬럼별 배열(ledger)로 메모리에 적재하여 통계(중앙값/백분위수/이동평균/지출 속도) 산출
+    - 적재: 하나의 쿼리를 chunk 단위로 스트리밍(iterator)하여 ORM 객체 생성 없이 구조화 배열로 변환
+    - 캐시: 유저 캐시 버전을 포함한 키로 LEDGER_CACHE_SECONDS 동안 유지
+      (가계부/카테고리/기록이 변경되면 유저 캐시 버전이 올라가므로 다음 조회 시 다시 적재,
+       여러 워커 프로세스에서는 공유 캐시를 사용해야 다른 워커의 변경이 반영됨)
+    - 통계: 카테고리별 반복문 없이 bincount/lexsort로 모든 카테고리를 한번에 계산
+"""
+
+LEDGER_DTYPE = np.dtype([
+    ('occurred_at', 'datetime64[D]'),
+    ('price'      , 'i8'),
+    ('types'      , 'i1'),
+    ('category_id', 'i8'),
+    ('book_id'    , 'i8'),
+])
+
+"""
+카테고리가 없는 기록의 category_id(배열에는 NULL이 없으므로 0으로 저장)
+"""
+NO_CATEGORY = 0
+
+LEDGER_CHUNK_SIZE = 2000
+
+STATS_PERCENTILES    = (25, 50, 75, 90)
+STATS_DEFAULT_DAYS   = 90
+STATS_MAX_DAYS       = 366 * 2
+STATS_DEFAULT_WINDOW = 7
+STATS_MAX_WINDOW     = 90
+
+
+def load_ledger(user_id: int) -> np.ndarray:
+    """
+    유저의 사용중인 기록(삭제된 가계부의 기록 제외)을 발생일 순서의 구조화 배열로 적재
+    (타입은 문자열 변환 없이 저장값(정수) 그대로 조회)
+    """
+    rows = AccountBookLog.objects\
+                         .filter(user_id=user_id, status='in_use')\
+                         .exclude(book__status='deleted')\
+                         .order_by('occurred_at', 'id')\
+                         .values_list(
+                             'occurred_at',
+                             'price',
+                             ExpressionWrapper(F('types'), output_field=IntegerField()),
+                             Coalesce('category_id', Value(NO_CATEGORY)),
+                             'book_id'
+                         )\
+                         .iterator(chunk_size=LEDGER_CHUNK_SIZE)
+    return np.fromiter(rows, dtype=LEDGER_DTYPE)
+
+
+def get_ledger(user_id: int) -> np.ndarray:
+    cache_key = get_user_cache_key('ledger', user_id)
+    ledger    = cache.get(cache_key)
+    
+    if ledger is None:
+        ledger = load_ledger(user_id)
+        cache.set(cache_key, ledger, settings.LEDGER_CACHE_SECONDS)
+    
+    return ledger
+
+
+def get_stats_period(
+    date_from: Optional[date],
+    date_to  : Optional[date]
+    ) -> Tuple[Optional[date], Optional[date], Optional[str]]:
+    """
+    조회 기간 산출(기본값: 오늘까지 최근 STATS_DEFAULT_DAYS일)
+    (기본 조회 시작일이 표현 가능한 날짜 범위를 벗어나면 에러 메시지 반환)
+    """
+    date_to = date_to or date.today()
+    try:
+        date_from = date_from or date_to - timedelta(days=STATS_DEFAULT_DAYS - 1)
+    except OverflowError:
+        return None, None, f'{date_to}은/는 올바른 조회 종료일이 아닙니다.'
+    return date_from, date_to, None
+
+
+def _group_stats(group: np.ndarray, groups: int, prices: np.ndarray, days_index: np.ndarray, days: int, window: int) -> Dict[str, np.ndarray]:
+    """
+    description:
+        - 그룹(카테고리)별 통계를 그룹 수 길이의 배열로 산출
+        - 백분위수: (그룹, 가격) 순으로 정렬한 뒤 그룹별 시작 위치에서 선형 보간(numpy percentile의 linear 방식과 동일)
+        - 일별 합계: 그룹 x 일 행렬, 이동평균은 누적합의 차이로 계산
+            - rolling_average: 마지막 window일의 일평균
+            - velocity: rolling_average - 직전 window일의 일평균(양수면 지출/수입이 빨라지는 중)
+    """
+    counts = np.bincount(group, minlength=groups)
+    totals = np.bincount(group, weights=prices, minlength=groups)
+    
+    order   = np.lexsort((prices, group))
+    ordered = prices[order].astype(np.float64)
+    starts  = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    
+    stats = {
+        'count': counts,
+        'total': totals,
+        'mean' : totals / counts,
+    }
+    for percent in STATS_PERCENTILES:
+        position = (counts - 1) * percent / 100
+        lower    = np.floor(position).astype(np.int64)
+        upper    = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+        stats[f'p{percent}'] = ordered[starts + lower] * (1 - fraction) + ordered[starts + upper] * fraction
+    
+    daily      = np.bincount(group * days + days_index, weights=prices, minlength=groups * days).reshape(groups, days)
+    cumulative = np.concatenate((np.zeros((groups, 1)), np.cumsum(daily, axis=1)), axis=1)
+
+    def rolling_average(end: int) -> np.ndarray:
+        start = max(end - window, 0)
+        if end <= start:
+            return np.zeros(groups)
+        return (cumulative[:, end] - cumulative[:, start]) / (end - start)
+    
+    stats['daily_average']   = totals / days
+    stats['rolling_average'] = rolling_average(days)
+    stats['velocity']        = stats['rolling_average'] - rolling_average(days - window)
+    stats['daily']           = daily
+    return stats
+
+
+def _stats_items(stats: Dict[str, np.ndarray]) -> List[dict]:
+    """
+    그룹별 통계 배열을 응답용 dict 리스트로 변환(금액은 원 단위 정수, 그 외 소수점 둘째 자리까지)
+    """
+    items = []
+    for index in range(len(stats['count'])):
+        items.append({
+            'count'          : int(stats['count'][index]),
+            'total'          : int(stats['total'][index]),
+            'mean'           : round(float(stats['mean'][index]), 2),
+            'median'         : round(float(stats['p50'][index]), 2),
+            'p25'            : round(float(stats['p25'][index]), 2),
+            'p75'            : round(float(stats['p75'][index]), 2),
+            'p90'            : round(float(stats['p90'][index]), 2),
+            'daily_average'  : round(float(stats['daily_average'][index]), 2),
+            'rolling_average': round(float(stats['rolling_average'][index]), 2),
+            'velocity'       : round(float(stats['velocity'][index]), 2),
+        })
+    return items
+
+
+def get_log_stats(
+    ledger      : np.ndarray,
+    types       : str,
+    date_from   : date,
+    date_to     : date,
+    window      : int,
+    book_id     : Optional[int] = None,
+    category_ids: Optional[List[int]] = None
+    ) -> dict:
+    """
+    description:
+        - ledger에서 조건(타입/기간/가계부/카테고리)에 맞는 기록을 mask로 선택하여 전체/카테고리별 통계 산출
+        - days/rolling: 조회 기간의 일별 이동평균(window일) 시계열(전체 기록 기준)
+        - categories: 카테고리별 통계(category_id 순, 카테고리가 없는 기록은 category_id None)
+    """
+    start = np.datetime64(date_from, 'D')
+    days  = (date_to - date_from).days + 1
+    
+    mask  = ledger['types'] == TYPES_VALUES[types]
+    mask &= ledger['occurred_at'] >= start
+    mask &= ledger['occurred_at'] <= np.datetime64(date_to, 'D')
+    if book_id:
+        mask &= ledger['book_id'] == book_id
+    if category_ids:
+        mask &= np.isin(ledger['category_id'], category_ids)
+    
+    rows       = ledger[mask]
+    prices     = rows['price']
+    days_index = (rows['occurred_at'] - start).astype(np.int64)
+    
+    data = {
+        'types'    : types,
+        'date_from': date_from,
+        'date_to'  : date_to,
+        'window'   : window,
+        'days'     : [(date_from + timedelta(days=index)).isoformat() for index in range(days)],
+    }
+    
+    if not len(rows):
+        data['rolling']    = [0.0] * days
+        data['overall']    = {
+            'count'          : 0,
+            'total'          : 0,
+            'mean'           : 0.0,
+            'median'         : 0.0,
+            'p25'            : 0.0,
+            'p75'            : 0.0,
+            'p90'            : 0.0,
+            'daily_average'  : 0.0,
+            'rolling_average': 0.0,
+            'velocity'       : 0.0,
+        }
+        data['categories'] = []
+        return data
+    
+    overall = _group_stats(np.zeros(len(rows), dtype=np.int64), 1, prices, days_index, days, window)
+    
+    category_ids, group = np.unique(rows['category_id'], return_inverse=True)
+    categories          = _group_stats(group.reshape(-1), len(category_ids), prices, days_index, days, window)
+    
+    cumulative = np.concatenate(([0], np.cumsum(overall['daily'][0])))
+    ends       = np.arange(1, days + 1)
+    starts     = np.maximum(ends - window, 0)
+    
+    data['rolling']    = np.round((cumulative[ends] - cumulative[starts]) / (ends - starts), 2).tolist()
+    data['overall']    = _stats_items(overall)[0]
+    data['categories'] = [
+        {'category_id': int(category_id) if category_id != NO_CATEGORY else None, **item}
+        for category_id, item in zip(category_ids, _stats_items(categories))
+    ]
+    return data
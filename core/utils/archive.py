@@ -0,0 +1,151 @@
+from typing import Iterable, List
+
+from django.db        import transaction
+from django.db.models import Model
+
+from account_books.models import AccountBook, AccountBookCategory, AccountBookLog,\
+                                 AccountBookArchive, AccountBookCategoryArchive, AccountBookLogArchive
+from users.models         import User
+
+
+"""
+hot 테이블 모델 - cold(보관) 테이블 모델 매핑
+"""
+ARCHIVE_MODELS = {
+    AccountBook        : AccountBookArchive,
+    AccountBookCategory: AccountBookCategoryArchive,
+    AccountBookLog     : AccountBookLogArchive,
+}
+
+BULK_BATCH_SIZE = 500
+
+
+def _copy_rows(rows: Iterable[dict], target_model: Model) -> List[Model]:
+    """
+    values()로 조회한 row 데이터를 대상 모델의 객체로 변환
+    (archived_at과 같이 대상 모델에만 존재하는 컬럼은 제외)
+    """
+    attnames = [field.attname for field in target_model._meta.concrete_fields]
+    return [
+        target_model(**{attname: row[attname] for attname in attnames if attname in row})
+        for row in rows
+    ]
+
+
+def archive_records(model: Model, ids: List[int]) -> int:
+    """
+    description:
+        - hot 테이블의 레코드를 cold 테이블로 이동(insert 후 delete)
+        - 호출하는 쪽에서 transaction.atomic()으로 감싸서 사용
+    """
+    if not ids:
+        return 0
+
+    archive_model = ARCHIVE_MODELS[model]
+    attnames      = [field.attname for field in model._meta.concrete_fields]
+
+    rows = model.objects\
+                .filter(id__in=ids)\
+                .values(*attnames)
+    objs = _copy_rows(rows, archive_model)
+
+    """
+    재실행 시(중단 이후) 이미 보관된 동일 id의 레코드가 있다면 최신 데이터로 교체
+    """
+    archive_model.objects.filter(id__in=ids).delete()
+    archive_model.objects.bulk_create(objs, batch_size=BULK_BATCH_SIZE)
+
+    model.objects.filter(id__in=ids).delete()
+
+    return len(objs)
+
+
+def _restore_records(model: Model, ids: Iterable[int]) -> int:
+    """
+    description:
+        - cold 테이블의 레코드를 hot 테이블로 이동(insert 후 delete)
+        - bulk_create 시 auto_now_add 값이 현재시간으로 덮어써지므로
+          bulk_update로 생성일자를 원래 값으로 되돌림
+        - 수정일자는 복원 시점으로 갱신(변경분 동기화 API에서 복원된 레코드를 조회할 수 있도록)
+    """
+    ids = [id for id in ids if id is not None]
+    if not ids:
+        return 0
+
+    archive_model = ARCHIVE_MODELS[model]
+
+    rows = list(archive_model.objects.filter(id__in=ids).values())
+    if not rows:
+        return 0
+
+    objs       = _copy_rows(rows, model)
+    created_at = [obj.created_at for obj in objs]
+
+    model.objects.bulk_create(objs, batch_size=BULK_BATCH_SIZE)
+
+    for obj, value in zip(objs, created_at):
+        obj.created_at = value
+    model.objects.bulk_update(objs, ['created_at'], batch_size=BULK_BATCH_SIZE)
+
+    archive_model.objects.filter(id__in=[row['id'] for row in rows]).delete()
+
+    return len(rows)
+
+
+def restore_archived_book(account_book_id: int, user: User) -> bool:
+    """
+    description:
+        - 보관된 가계부를 hot 테이블로 복원(본인의 가계부만 복원)
+        - 가계부와 함께 보관된 기록, 기록이 참조하는 카테고리도 함께 복원
+    """
+    with transaction.atomic():
+        if not AccountBookArchive.objects\
+                                 .select_for_update()\
+                                 .filter(id=account_book_id, user_id=user.id)\
+                                 .exists():
+            return False
+
+        logs = AccountBookLogArchive.objects.filter(book_id=account_book_id)
+
+        _restore_records(AccountBook, [account_book_id])
+        _restore_records(AccountBookCategory, set(logs.values_list('category_id', flat=True)))
+        _restore_records(AccountBookLog, list(logs.values_list('id', flat=True)))
+
+    return True
+
+
+def restore_archived_category(account_book_category_id: int, user: User) -> bool:
+    """
+    description:
+        - 보관된 가계부 카테고리를 hot 테이블로 복원(본인의 카테고리만 복원)
+    """
+    with transaction.atomic():
+        if not AccountBookCategoryArchive.objects\
+                                         .select_for_update()\
+                                         .filter(id=account_book_category_id, user_id=user.id)\
+                                         .exists():
+            return False
+
+        _restore_records(AccountBookCategory, [account_book_category_id])
+
+    return True
+
+
+def restore_archived_log(account_book_log_id: int, book: AccountBook) -> bool:
+    """
+    description:
+        - 보관된 가계부 기록을 hot 테이블로 복원(해당 가계부의 기록만 복원)
+        - 기록이 참조하는 카테고리가 보관된 상태라면 카테고리도 함께 복원
+    """
+    with transaction.atomic():
+        log = AccountBookLogArchive.objects\
+                                   .select_for_update()\
+                                   .filter(id=account_book_log_id, book_id=book.id)\
+                                   .first()
+        if not log:
+            return False
+
+        _restore_records(AccountBookCategory, [log.category_id])
+        _restore_records(AccountBookLog, [account_book_log_id])
+
+    return True
@@ -2,15 +2,71 @@ import jwt
 
 from ninja.security  import HttpBearer
 from datetime        import datetime
-from typing          import Union, Any
+from typing          import Union, Any, Optional
 
 from config.settings import SECRET_KEY
 from users.models    import User
 
 
+def get_user_id_from_request(request, verified: bool = False) -> Optional[int]:
+    """
+    description:
+        - Authorization 헤더의 JWT 토큰에서 유저 id만 추출(DB 조회 없음)
+        - 미들웨어(요청 제한 등)에서 유저를 구분하는 용도로 사용
+        - verified: 만료기간까지 확인(만료된 토큰이면 None), 유저별로 데이터를 저장하는 경우 사용
+    """
+    header = request.headers.get('Authorization', '')
+    if not header.startswith('Bearer '):
+        return None
+    
+    if verified:
+        return get_user_id_from_token(header[len('Bearer '):])
+    
+    try:
+        payload = jwt.decode(
+            header[len('Bearer '):], 
+            SECRET_KEY, 
+            algorithms = 'HS256'
+        )
+        return int(payload['user_id'])
+    except Exception:
+        return None
+
+
+def get_user_id_from_token(token: str) -> Optional[int]:
+    """
+    description:
+        - JWT 토큰 검증(만료기간 포함) 후 유저 id 추출(DB 조회 없음)
+        - 헤더를 지정할 수 없는 클라이언트(EventSource 등)의 스트림 연결 인증에 사용
+    """
+    try:
+        payload = jwt.decode(
+            token, 
+            SECRET_KEY, 
+            algorithms = 'HS256'
+        )
+        token_exp_date = datetime.strptime(
+            payload['exp_date'], 
+            '%Y-%m-%d %H:%M:%S.%f'
+        )
+        if datetime.now() > token_exp_date:
+            return None
+        
+        return int(payload['user_id'])
+    except Exception:
+        return None
+
+
 class AuthBearer(HttpBearer):
     def authenticate(self, request, token: str) -> Union[Any, bool]:
         
+        """
+        일괄 처리 API의 하위 요청은 일괄 처리 요청에서 인증한 유저를 그대로 사용
+        """
+        batch_user = getattr(request, 'batch_user', None)
+        if batch_user:
+            return batch_user
+        
         try:
             """
             JWT 토큰 decode
@@ -0,0 +1,116 @@
+import asyncio, json
+
+from io           import BytesIO
+from typing       import Any, Optional
+from urllib.parse import urlsplit
+
+from asgiref.sync              import async_to_sync
+from django.core.exceptions    import MiddlewareNotUsed
+from django.core.handlers.wsgi import WSGIRequest
+from django.http               import HttpRequest, HttpResponse
+from django.urls               import resolve, Resolver404
+
+from core.middleware import IdempotencyMiddleware, MetricsMiddleware
+from users.models    import User
+
+
+"""
+description:
+    - 일괄 처리 API의 하위 요청 실행 유틸
+    - 하위 요청은 원본 요청의 헤더를 그대로 사용하고, URL resolver로 찾은 API 함수를 직접 호출
+      (인증은 원본 요청에서 한번만 수행한 유저를 그대로 사용)
+    - 하위 요청마다 적용하는 미들웨어(SUB_REQUEST_MIDDLEWARE)
+        - IdempotencyMiddleware: 하위 요청별 idempotency_key(원본 요청의 Idempotency-Key는 일괄 처리 요청 전체에만 적용)
+        - MetricsMiddleware: 하위 요청의 route별 요청 수/처리 시간
+    - 요청 제한은 일괄 처리 API에서 하위 요청 수만큼 한번에 차감(core.api.run_batch)
+"""
+
+BATCH_METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')
+
+SUB_REQUEST_MIDDLEWARE = (IdempotencyMiddleware, MetricsMiddleware)
+
+
+def build_sub_request(
+    request        : HttpRequest,
+    user           : User,
+    method         : str,
+    path           : str,
+    body           : Optional[Any],
+    idempotency_key: Optional[str] = None
+    ) -> HttpRequest:
+    url     = urlsplit(path)
+    content = json.dumps(body).encode() if body is not None else b''
+    
+    environ = {
+        key: value for key, value in request.META.items()
+        if isinstance(value, str) and not key.startswith('wsgi.') and key != 'HTTP_IDEMPOTENCY_KEY'
+    }
+    if idempotency_key:
+        environ['HTTP_IDEMPOTENCY_KEY'] = idempotency_key
+    environ.update({
+        'REQUEST_METHOD': method,
+        'SCRIPT_NAME'   : '',
+        'PATH_INFO'     : url.path,
+        'QUERY_STRING'  : url.query,
+        'CONTENT_TYPE'  : 'application/json',
+        'CONTENT_LENGTH': str(len(content)),
+        'wsgi.input'    : BytesIO(content),
+    })
+    
+    sub_request            = WSGIRequest(environ)
+    sub_request.batch_user = user
+    return sub_request
+
+
+def get_sub_request_handler():
+    """
+    SUB_REQUEST_MIDDLEWARE를 적용한 하위 요청 실행 함수(비활성화된 미들웨어는 제외)
+    """
+    handler = _call_view
+    for middleware in SUB_REQUEST_MIDDLEWARE:
+        try:
+            handler = middleware(handler)
+        except MiddlewareNotUsed:
+            pass
+    return handler
+
+
+def dispatch_sub_request(sub_request: HttpRequest) -> HttpResponse:
+    """
+    하위 요청의 경로에 해당하는 API 함수 실행(존재하지 않는 경로는 404 응답)
+    """
+    try:
+        sub_request.resolver_match = resolve(sub_request.path_info)
+    except Resolver404:
+        sub_request.resolver_match = None
+    
+    return get_sub_request_handler()(sub_request)
+
+
+def _call_view(sub_request: HttpRequest) -> HttpResponse:
+    match = sub_request.resolver_match
+    if not match:
+        return HttpResponse(
+            json.dumps({'detail': 'Not Found'}),
+            status       = 404,
+            content_type = 'application/json'
+        )
+    
+    response = match.func(sub_request, *match.args, **match.kwargs)
+    if asyncio.iscoroutine(response):
+        response = async_to_sync(_await)(response)
+    
+    return response
+
+
+async def _await(coroutine):
+    return await coroutine
+
+
+def get_response_body(response: HttpResponse) -> Any:
+    if response.streaming or not response.content:
+        return None
+    
+    if 'json' in response.get('Content-Type', ''):
+        return json.loads(response.content)
+    return response.content.decode()
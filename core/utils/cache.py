@@ -0,0 +1,40 @@
+import hashlib, json, time
+
+from django.core.cache import cache
+
+
+"""
+description:
+    - 유저별 캐시 버전을 이용한 캐시 무효화 유틸
+    - 가계부/카테고리/기록이 변경되면 유저의 캐시 버전을 올려 기존 캐시를 모두 무효화
+      (버전이 키에 포함되므로 이전 버전의 캐시는 TTL이 지나면 자연스럽게 만료)
+    - 캐시 버전은 Django 캐시에 저장되므로 다른 워커의 변경이 무효화에 반영되려면 공유 캐시(Redis 등)가 필요
+      (프로세스별 캐시(LocMemCache)에서는 변경한 워커의 캐시만 무효화됨)
+    - 버전 키가 없으면(최초 조회, 캐시에서 제거된 경우) 현재 시각(ns)으로 시작
+      (작은 정수로 다시 시작하면 이전에 같은 버전으로 저장된 캐시가 다시 유효해짐)
+"""
+
+USER_CACHE_VERSION_KEY = 'account_books:version:{user_id}'
+
+
+def get_user_cache_version(user_id: int) -> int:
+    return cache.get_or_set(USER_CACHE_VERSION_KEY.format(user_id=user_id), time.time_ns, None)
+
+
+def bump_user_cache_version(user_id: int) -> None:
+    key = USER_CACHE_VERSION_KEY.format(user_id=user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def get_user_cache_key(prefix: str, user_id: int, **params) -> str:
+    """
+    유저 캐시 버전과 요청 파라미터를 포함한 캐시 키 생성
+    """
+    version = get_user_cache_version(user_id)
+    digest  = hashlib.md5(
+        json.dumps(params, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f'{prefix}:{user_id}:{version}:{digest}'
@@ -0,0 +1,129 @@
+import zlib
+
+from typing import Iterable, Iterator, List, Optional
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+"""
+description:
+    - 응답 압축 유틸(gzip/brotli/zstd)
+    - brotli, zstandard 패키지가 설치되지 않은 경우 해당 인코딩은 사용하지 않음
+    - 압축 객체는 compress(chunk)/sync_flush()/flush() 인터페이스로 통일하여 스트리밍 응답도 chunk 단위로 압축
+        - sync_flush: 지금까지 입력한 데이터를 모두 출력(스트림은 종료하지 않음, 클라이언트가 바로 압축 해제 가능)
+"""
+
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data)
+
+    def sync_flush(self) -> bytes:
+        return self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def flush(self) -> bytes:
+        return self.compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, level: int):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data)
+
+    def sync_flush(self) -> bytes:
+        return self.compressor.flush()
+
+    def flush(self) -> bytes:
+        return self.compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data)
+
+    def sync_flush(self) -> bytes:
+        return self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def flush(self) -> bytes:
+        return self.compressor.flush()
+
+
+"""
+인코딩(Content-Encoding) - 압축 객체
+"""
+COMPRESSORS = {'gzip': GzipCompressor}
+
+if brotli:
+    COMPRESSORS['br'] = BrotliCompressor
+if zstandard:
+    COMPRESSORS['zstd'] = ZstdCompressor
+
+
+def get_available_encodings() -> List[str]:
+    """
+    설정된 인코딩 중 사용 가능한 인코딩(서버 선호 순서)
+    """
+    return [encoding for encoding in settings.COMPRESSION_ENCODINGS if encoding in COMPRESSORS]
+
+
+def get_compressor(encoding: str, level: Optional[int] = None):
+    if level is None:
+        level = settings.COMPRESSION_LEVELS[encoding]
+    return COMPRESSORS[encoding](level)
+
+
+def choose_encoding(accept_encoding: str, encodings: Iterable[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 클라이언트가 허용(q > 0)한 인코딩 중 서버 선호 순서가 가장 높은 인코딩 선택
+    """
+    accepted = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    
+    for encoding in encodings:
+        if accepted.get(encoding, accepted.get('*', 0)) > 0:
+            return encoding
+    return None
+
+
+def compress_bytes(encoding: str, data: bytes, level: Optional[int] = None) -> bytes:
+    compressor = get_compressor(encoding, level)
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_stream(encoding: str, chunks: Iterable[bytes], level: Optional[int] = None) -> Iterator[bytes]:
+    """
+    스트리밍 응답 압축: chunk마다 압축한 뒤 sync flush하여 바로 전달(SSE 등 chunk 단위로 전달되어야 하는 응답),
+    마지막에 스트림 종료 데이터 전달
+    """
+    compressor = get_compressor(encoding, level)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        yield compressor.compress(chunk) + compressor.sync_flush()
+    yield compressor.flush()
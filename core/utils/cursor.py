@@ -0,0 +1,78 @@
+import base64, json
+
+from datetime import datetime
+from decimal  import Decimal
+from typing   import Any, Dict, Optional, Tuple
+
+from django.db.models import Q, Model
+
+
+"""
+description:
+    - keyset(커서) 페이지네이션 유틸
+    - 커서는 마지막으로 반환한 객체의 (정렬 컬럼 값, id)를 base64로 인코딩한 문자열
+"""
+
+
+def encode_cursor(obj: Model, order_field: str) -> str:
+    field = order_field.lstrip('-')
+    value = getattr(obj, field)
+    
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    
+    payload = json.dumps({'v': value, 'id': obj.id}).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str, model: Model, order_field: str) -> Tuple[Any, Optional[str]]:
+    field = order_field.lstrip('-')
+    
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        value   = model._meta.get_field(field).to_python(payload['v'])
+        last_id = int(payload['id'])
+    except Exception:
+        return None, '올바르지 않은 커서입니다.'
+    
+    return (value, last_id), None
+
+
+def get_cursor_filter(value: Any, last_id: int, order_field: str) -> Q:
+    """
+    (정렬 컬럼, id) 순서로 정렬된 목록에서 커서 이후의 객체만 필터링
+    """
+    field = order_field.lstrip('-')
+    
+    if order_field.startswith('-'):
+        return Q(**{f'{field}__lt': value}) | Q(**{field: value, 'id__lt': last_id})
+    return Q(**{f'{field}__gt': value}) | Q(**{field: value, 'id__gt': last_id})
+
+
+def encode_sync_cursor(positions: Dict[str, Tuple[datetime, int]], synced_at: datetime) -> str:
+    """
+    변경분 동기화 커서: 모델별 마지막으로 반환한 객체의 (수정일자, id)와 커서 발급 시각
+    """
+    payload = json.dumps({
+        'synced_at': synced_at.isoformat(),
+        'positions': {
+            name: [updated_at.isoformat(), id] for name, (updated_at, id) in positions.items()
+        }
+    }).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_sync_cursor(cursor: str) -> Tuple[Any, Optional[str]]:
+    try:
+        payload   = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        synced_at = datetime.fromisoformat(payload['synced_at'])
+        positions = {
+            name: (datetime.fromisoformat(updated_at), int(id))
+            for name, (updated_at, id) in payload['positions'].items()
+        }
+    except Exception:
+        return None, '올바르지 않은 커서입니다.'
+    
+    return (positions, synced_at), None
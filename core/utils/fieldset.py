@@ -0,0 +1,83 @@
+from functools import lru_cache
+from typing    import Dict, FrozenSet, List, Optional, Tuple, Type
+
+from django.db.models import QuerySet
+from django.http      import JsonResponse
+from ninja            import Schema
+from ninja.responses  import NinjaJSONEncoder
+
+
+"""
+description:
+    - 리스트 API의 sparse fieldset(fields=id,title,price) 유틸
+    - 응답 스키마에서 요청한 필드만 남긴 스키마를 동적으로 생성(필드 조합별로 캐시)
+    - 요청한 필드에 필요한 컬럼만 .only()로 조회하여 DB에서 읽는 데이터 양을 줄임
+    - id는 항상 포함
+"""
+
+
+def parse_fields(fields: str, schema: Type[Schema]) -> Tuple[Optional[FrozenSet[str]], Optional[str]]:
+    names   = {name.strip() for name in fields.split(',') if name.strip()}
+    invalid = sorted(names - set(schema.__fields__))
+    if invalid:
+        return None, f'{", ".join(invalid)}은/는 조회할 수 없는 필드입니다.(조회 가능: {", ".join(schema.__fields__)})'
+    
+    return frozenset(names | {'id'}), None
+
+
+@lru_cache(maxsize=256)
+def get_partial_schema(schema: Type[Schema], names: FrozenSet[str]) -> Type[Schema]:
+    """
+    응답 스키마에서 요청한 필드(와 해당 필드의 resolver)만 남긴 스키마 생성
+    """
+    namespace = {
+        '__annotations__': {
+            name: field.outer_type_ if field.required or not field.allow_none else Optional[field.outer_type_]
+            for name, field in schema.__fields__.items() if name in names
+        },
+        '__module__': schema.__module__,
+    }
+    for name, field in schema.__fields__.items():
+        if name in names and not field.required:
+            namespace[name] = field.default
+    
+    partial = type(f'{schema.__name__}Partial', (Schema,), namespace)
+    partial._ninja_resolvers = {
+        name: resolver for name, resolver in schema._ninja_resolvers.items() if name in names
+    }
+    return partial
+
+
+def get_only_columns(names: FrozenSet[str], columns: Dict[str, List[str]]) -> Tuple[List[str], List[str]]:
+    """
+    응답 필드에 필요한 컬럼(.only())과 select_related 대상 관계 산출
+        - columns: 응답 필드명이 모델 필드와 다른 경우의 필요 컬럼 목록(ex. {'book': ['book__name']})
+    """
+    only = []
+    for name in sorted(names):
+        only += columns.get(name, [name])
+    
+    select_related = sorted({column.split('__')[0] for column in only if '__' in column})
+    return only, select_related
+
+
+def apply_fieldset(queryset: QuerySet, names: FrozenSet[str], columns: Dict[str, List[str]]) -> QuerySet:
+    only, select_related = get_only_columns(names, columns)
+    
+    """
+    인자 없는 select_related()는 모든 관계를 조회하므로 필요한 관계가 있는 경우에만 지정
+    """
+    queryset = queryset.select_related(None)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    
+    return queryset.only(*only)
+
+
+def serialize_fieldset(objs, schema: Type[Schema], names: FrozenSet[str]) -> List[dict]:
+    partial = get_partial_schema(schema, names)
+    return [partial.from_orm(obj).dict() for obj in objs]
+
+
+def fieldset_response(data, status: int = 200) -> JsonResponse:
+    return JsonResponse(data, status=status, safe=False, encoder=NinjaJSONEncoder)
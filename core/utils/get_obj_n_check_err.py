@@ -1,6 +1,6 @@
 from typing import Tuple, Any
 
-from account_books.models import AccountBook, AccountBookCategory, AccountBookLog
+from account_books.models import AccountBook, AccountBookCategory, AccountBookLog, AccountBookRecurringLog
 from users.models         import User
 
 
@@ -25,7 +25,7 @@ class GetAccountBook:
         """
         본인의 가계부인지 확인
         """
-        if not user.nickname == book.user.nickname:
+        if not user.id == book.user_id:
             return None, '다른 유저의 가계부입니다.'
         
         return book, None
@@ -51,7 +51,7 @@ class GetAccountBookCategory:
         """
         본인의 카테고리인지 확인
         """
-        if not user.nickname == category.user.nickname:
+        if not user.id == category.user_id:
             return None, '다른 유저의 가계부 카테고리입니다.'
         
         return category, None
@@ -76,15 +76,42 @@ class GetAccountBookLog:
             return None, f'가계부 기록 {account_book_log_id}(id)는 존재하지 않습니다.'
         
         """
-        본인의 가계부 기록인지 확인
+        본인의 가계부 기록인지 확인(기록의 유저정보 컬럼으로 확인, 가계부/유저 조인 불필요)
         """
-        if not user.nickname == log.book.user.nickname:
+        if not user.id == log.user_id:
             return None, '다른 유저의 가계부 기록입니다.'
         
         """
         해당 가계부에 존재하는 기록인지 확인
         """
-        if log not in book.logs.all():
+        if not log.book_id == book.id:
             return None, f'해당 기록은 가계부 {book.id}(id)의 기록이 아닙니다.'
         
-        return log, None
\ No newline at end of file
+        return log, None
+
+
+class GetAccountBookRecurringLog:
+    """
+    description:
+        - 반복 기록 id를 통해 반복 기록 객체(정보)의 존재여부 확인
+        - 반복 기록 객체의 유저정보와 API를 요청한 유저정보가 일치하는지 확인
+    """
+    
+    def get_recurring_log_n_check_error(account_book_recurring_log_id: int, user: User) -> Tuple[Any, str]:
+        """
+        반복 기록 존재여부 확인
+        """
+        try:
+            recurring_log = AccountBookRecurringLog.objects\
+                                                   .select_related('book', 'category')\
+                                                   .get(id=account_book_recurring_log_id)
+        except AccountBookRecurringLog.DoesNotExist:
+            return None, f'가계부 반복 기록 {account_book_recurring_log_id}(id)는 존재하지 않습니다.'
+        
+        """
+        본인의 반복 기록인지 확인
+        """
+        if not user.id == recurring_log.user_id:
+            return None, '다른 유저의 가계부 반복 기록입니다.'
+        
+        return recurring_log, None
\ No newline at end of file
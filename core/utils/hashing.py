@@ -0,0 +1,69 @@
+import asyncio
+
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from functools          import partial
+from typing             import Optional, Tuple
+
+from django.conf                 import settings
+from django.contrib.auth.hashers import check_password, make_password, identify_hasher, get_hasher
+
+
+"""
+description:
+    - 패스워드 해싱(의도적으로 느린 연산)을 별도의 제한된 풀에서 실행하는 유틸
+    - 해싱 중에도 이벤트 루프(워커)가 다른 요청을 처리할 수 있도록 비동기 API에서 사용
+    - PASSWORD_HASH_EXECUTOR: thread(기본값, hashlib PBKDF2는 GIL을 해제) 또는 process
+"""
+
+_executor: Optional[Executor] = None
+
+
+def get_executor() -> Executor:
+    global _executor
+    
+    if _executor is None:
+        if settings.PASSWORD_HASH_EXECUTOR == 'process':
+            _executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers        = settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix = 'password-hash'
+            )
+    return _executor
+
+
+async def _run(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), partial(func, *args))
+
+
+async def amake_password(password: str) -> str:
+    return await _run(make_password, password)
+
+
+def must_update_password(encoded: str) -> bool:
+    """
+    해싱 알고리즘/파라미터(반복 횟수 등)가 현재 설정과 다른지 확인
+    """
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    
+    preferred = get_hasher('default')
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+async def acheck_password(password: str, encoded: str) -> Tuple[bool, Optional[str]]:
+    """
+    description:
+        - 패스워드 일치 여부 확인
+        - 일치하고 해싱 파라미터가 변경된 경우, 재해싱한 패스워드를 함께 반환
+    """
+    if not await _run(check_password, password, encoded):
+        return False, None
+    
+    if must_update_password(encoded):
+        return True, await amake_password(password)
+    
+    return True, None
@@ -0,0 +1,24 @@
+from typing import Optional, Sequence
+
+from django.db import IntegrityError
+
+
+def get_unique_violation_field(error: IntegrityError, fields: Sequence[str]) -> Optional[str]:
+    """
+    description:
+        - unique 제약조건 위반(IntegrityError)이 발생한 필드 확인
+        - PostgreSQL: 위반한 제약조건 이름(ex. users_email_key)으로 확인
+        - 그 외 DB: 에러 메세지(ex. UNIQUE constraint failed: users.email)로 확인
+    """
+    diag       = getattr(error.__cause__, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None)
+    message    = str(error)
+    
+    for field in fields:
+        if constraint:
+            if f'_{field}_' in f'_{constraint}_':
+                return field
+        elif f'({field})' in message or f'.{field}' in message:
+            return field
+    
+    return None
@@ -0,0 +1,385 @@
+import json, random, subprocess, threading, time, urllib.error, urllib.parse, urllib.request
+
+from collections import defaultdict
+from datetime    import date, datetime, timedelta
+from typing      import Dict, List, Optional, Tuple
+
+
+"""
+description:
+    - 부하 테스트 유틸(실제 서버에 HTTP 요청을 보내는 가상 유저)
+    - 가상 유저는 세션 단위로 동작: 로그인 -> 가계부 리스트 조회 -> 유저 유형별 가중치에 따라 행동 반복(행동 사이 think time)
+    - 요청마다 (요청 이름, 상태 코드, 응답 시간, 완료 시각)을 기록하여 처리량/응답 시간 분위수/에러율 리포트 생성
+      (ramp-up 중에는 가상 유저 수가 적으므로 ramp-up 이후에 완료된 요청만 집계)
+    - 리포트는 JSON으로 저장하여 커밋 간 비교 가능
+"""
+
+PASSWORD = 'Loadtest1!'
+WORDS    = ['점심', '저녁', '커피', '교통비', '월급', '관리비', '통신비', '쇼핑', '병원', '간식']
+SORTS    = ['up_to_date', 'out_of_date', 'high_price', 'low_price']
+
+
+"""
+유저 유형 - 행동별 가중치
+"""
+USER_PROFILES = {
+    'reader': {
+        'list_books'    : 2,
+        'list_logs'     : 5,
+        'search_logs'   : 3,
+        'book_dashboard': 1,
+    },
+    'writer': {
+        'list_books' : 1,
+        'list_logs'  : 3,
+        'search_logs': 1,
+        'create_log' : 3,
+        'update_log' : 2,
+        'delete_log' : 1,
+    },
+}
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class Recorder:
+    def __init__(self):
+        self.lock         = threading.Lock()
+        self.samples      : List[Tuple[str, int, float, float]] = []
+        self.started      = None
+        self.measure_from = None
+        self.stopped      = None
+
+    def add(self, name: str, status: int, latency: float) -> None:
+        with self.lock:
+            self.samples.append((name, status, latency, time.time()))
+
+    def report(self) -> dict:
+        """
+        measure_from(ramp-up 종료 시각) 이후에 완료된 요청만 집계(처리량은 measure_from부터 종료까지의 시간 기준)
+        """
+        measure_from = self.measure_from or self.started
+        elapsed      = (self.stopped or time.time()) - measure_from
+        samples      = [sample for sample in self.samples if sample[3] >= measure_from]
+        grouped      = defaultdict(list)
+        for sample in samples:
+            grouped[sample[0]].append(sample)
+        
+        return {
+            'ramp_up_requests': len(self.samples) - len(samples),
+            'total'           : _summarize(samples, elapsed),
+            'endpoints'       : {name: _summarize(samples, elapsed) for name, samples in sorted(grouped.items())},
+        }
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """
+    nearest-rank 분위수(values는 정렬된 값)
+    """
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, round(percent / 100 * len(values) + 0.5) - 1))
+    return values[index]
+
+
+def _summarize(samples: List[Tuple[str, int, float, float]], elapsed: float) -> dict:
+    latencies = sorted(sample[2] for sample in samples)
+    statuses  = defaultdict(int)
+    for sample in samples:
+        statuses[str(sample[1])] += 1
+    errors    = sum(count for status, count in statuses.items() if is_error(int(status)))
+    
+    summary = {
+        'requests'  : len(samples),
+        'rps'       : round(len(samples) / elapsed, 2) if elapsed else 0,
+        'errors'    : errors,
+        'error_rate': round(errors / len(samples), 4) if samples else 0,
+        'mean_ms'   : round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0,
+        'max_ms'    : round(latencies[-1] * 1000, 2) if latencies else 0,
+        'statuses'  : dict(sorted(statuses.items())),
+    }
+    for percent in PERCENTILES:
+        summary[f'p{percent}_ms'] = round(_percentile(latencies, percent) * 1000, 2)
+    return summary
+
+
+def is_error(status: int) -> bool:
+    """
+    연결 실패/타임아웃(0), 4xx/5xx 응답(429/503 유입 제어 응답 포함)은 에러로 집계
+    """
+    return status == 0 or status >= 400
+
+
+class Client:
+    def __init__(self, base_url: str, recorder: Optional[Recorder] = None, timeout: float = 10):
+        self.base_url = base_url.rstrip('/')
+        self.recorder = recorder
+        self.timeout  = timeout
+        self.token    = None
+
+    def request(self, name: str, method: str, path: str, params: dict = None, data: dict = None) -> Tuple[int, object]:
+        url = self.base_url + path
+        if params:
+            url += '?' + urllib.parse.urlencode({key: value for key, value in params.items() if value is not None})
+        
+        headers = {'Accept': 'application/json'}
+        body    = None
+        if data is not None:
+            body = json.dumps(data, default=str).encode()
+            headers['Content-Type'] = 'application/json'
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, body, headers, method=method), timeout=self.timeout) as response:
+                status, content = response.status, response.read()
+        except urllib.error.HTTPError as e:
+            status, content = e.code, e.read()
+        except (urllib.error.URLError, OSError):
+            status, content = 0, b''
+        latency = time.perf_counter() - started
+        
+        if self.recorder:
+            self.recorder.add(name, status, latency)
+        
+        try:
+            return status, json.loads(content) if content else None
+        except ValueError:
+            return status, None
+
+
+class VirtualUser:
+
+    """
+    가상 유저(스레드 1개)
+        - account: 로그인 계정 정보(email, book_id, category_id)
+        - profile: 유저 유형(USER_PROFILES)
+    """
+
+    def __init__(self, client: Client, account: dict, profile: str, think_time: Tuple[float, float], rand: random.Random):
+        self.client     = client
+        self.account    = account
+        self.actions    = list(USER_PROFILES[profile])
+        self.weights    = list(USER_PROFILES[profile].values())
+        self.think_time = think_time
+        self.rand       = rand
+        self.log_ids    : List[int] = []
+        self.created    : List[int] = []
+
+    def run(self, deadline: float) -> None:
+        while time.time() < deadline:
+            if not self.signin():
+                self.think()
+                continue
+            self.list_books()
+            
+            for _ in range(self.rand.randint(5, 15)):
+                if time.time() >= deadline:
+                    return
+                self.think()
+                getattr(self, self.rand.choices(self.actions, self.weights)[0])()
+
+    def think(self) -> None:
+        low, high = self.think_time
+        if high > 0:
+            time.sleep(self.rand.uniform(low, high))
+
+    def signin(self) -> bool:
+        self.client.token = None
+        status, body = self.client.request(
+            'signin', 'POST', '/api/users/signin', data={'email': self.account['email'], 'password': PASSWORD}
+        )
+        if status != 200:
+            return False
+        self.client.token = body['access_token']
+        return True
+
+    def list_books(self) -> None:
+        self.client.request('list_books', 'GET', '/api/account-books', params={'sort': self.rand.choice(SORTS[:2])})
+
+    def book_dashboard(self) -> None:
+        today = date.today()
+        self.client.request(
+            'book_dashboard', 'GET', '/api/account-books/dashboard',
+            params={'date_from': today.replace(day=1), 'date_to': today}
+        )
+
+    def list_logs(self) -> None:
+        self._list_logs('list_logs', {'sort': self.rand.choice(SORTS), 'offset': self.rand.choice([0, 0, 0, 10, 20])})
+
+    def search_logs(self) -> None:
+        self._list_logs('search_logs', {'search': self.rand.choice(WORDS), 'sort': self.rand.choice(SORTS)})
+
+    def _list_logs(self, name: str, params: dict) -> None:
+        status, body = self.client.request(
+            name, 'GET', '/api/account-books/logs', params={'book_id': self.account['book_id'], 'limit': 20, **params}
+        )
+        if status == 200 and body and body.get('logs'):
+            self.log_ids = [log['id'] for log in body['logs']]
+
+    def create_log(self) -> None:
+        status, body = self.client.request(
+            'create_log', 'POST', '/api/account-books/logs', data=make_log(self.account, self.rand)
+        )
+        if status == 200:
+            self.created.append(body['id'])
+
+    def update_log(self) -> None:
+        log_ids = self.created or self.log_ids
+        if not log_ids:
+            return self.create_log()
+        self.client.request(
+            'update_log', 'PATCH', f'/api/account-books/logs/{self.rand.choice(log_ids)}',
+            data={
+                'book_id'    : self.account['book_id'],
+                'category_id': self.account['category_id'],
+                'title'      : f'{self.rand.choice(WORDS)} {self.rand.choice(WORDS)}',
+                'price'      : self.rand.randint(1, 500) * 100,
+            }
+        )
+
+    def delete_log(self) -> None:
+        """
+        테스트 데이터 크기가 유지되도록 이번 실행에서 생성한 기록만 삭제
+        """
+        if not self.created:
+            return self.create_log()
+        self.client.request(
+            'delete_log', 'DELETE', f'/api/account-books/logs/{self.created.pop()}',
+            params={'account_book_id': self.account['book_id']}
+        )
+
+
+def make_log(account: dict, rand: random.Random) -> dict:
+    return {
+        'book_id'    : account['book_id'],
+        'category_id': account['category_id'],
+        'title'      : f'{rand.choice(WORDS)} {rand.choice(WORDS)}',
+        'types'      : rand.choice(['income', 'expenditure', 'expenditure', 'expenditure']),
+        'price'      : rand.randint(1, 500) * 100,
+        'description': ' '.join(rand.choice(WORDS) for _ in range(rand.randint(1, 8))),
+        'occurred_at': date.today() - timedelta(days=rand.randint(0, 90)),
+    }
+
+
+def prepare_account(base_url: str, index: int, seed_logs: int, timeout: float = 30) -> dict:
+    """
+    description:
+        - 부하 테스트 계정 준비(loadtest{index}@example.com, 이미 존재하면 재사용)
+        - 계정별 가계부/카테고리가 없으면 생성하고, 가계부를 새로 만든 경우 seed_logs개의 기록 생성
+    """
+    client  = Client(base_url, timeout=timeout)
+    rand    = random.Random(index)
+    account = {'email': f'loadtest{index}@example.com'}
+    
+    client.request('signup', 'POST', '/api/users/signup', data={
+        'email'   : account['email'],
+        'nickname': f'loadtest{index}',
+        'password': PASSWORD,
+    })
+    status, body = client.request('signin', 'POST', '/api/users/signin', data={'email': account['email'], 'password': PASSWORD})
+    if status != 200:
+        raise RuntimeError(f'{account["email"]} 로그인 실패({status}): {body}')
+    client.token = body['access_token']
+    
+    _, books = client.request('list_books', 'GET', '/api/account-books', params={'search': 'loadtest'})
+    created  = not books
+    if created:
+        _, book = client.request('create_book', 'POST', '/api/account-books', data={'name': 'loadtest', 'budget': 1000000})
+        books   = [book]
+    account['book_id'] = books[0]['id']
+    
+    _, categories = client.request('list_categories', 'GET', '/api/account-books/categories')
+    if not categories:
+        _, category = client.request('create_category', 'POST', '/api/account-books/categories', data={'name': 'loadtest'})
+        categories  = [category]
+    account['category_id'] = categories[0]['id']
+    
+    if created:
+        for _ in range(seed_logs):
+            client.request('create_log', 'POST', '/api/account-books/logs', data=make_log(account, rand))
+    
+    return account
+
+
+def assign_profiles(mix: Dict[str, int], users: int) -> List[str]:
+    """
+    유저 유형 배정: 앞에서부터 몇 명만 시작하더라도(ramp-up 중) 비율이 유지되도록 비율 대비 가장 부족한 유형을 순서대로 배정
+    """
+    total    = sum(mix.values())
+    assigned = defaultdict(int)
+    profiles = []
+    for index in range(users):
+        profile = max(
+            (profile for profile, ratio in mix.items() if ratio),
+            key=lambda profile: (index + 1) * mix[profile] / total - assigned[profile]
+        )
+        assigned[profile] += 1
+        profiles.append(profile)
+    return profiles
+
+
+def run_load(
+    base_url  : str,
+    accounts  : List[dict],
+    users     : int,
+    mix       : Dict[str, int],
+    duration  : float,
+    ramp_up   : float,
+    think_time: Tuple[float, float],
+    timeout   : float = 10,
+    seed      : int = 0
+    ) -> Recorder:
+    """
+    description:
+        - users개의 가상 유저(스레드)를 ramp_up 동안 균등한 간격으로 시작하여 duration 동안 실행
+        - 리포트는 ramp-up 이후 duration 동안 완료된 요청만 집계
+        - 유저 유형은 mix 비율(ex. {'reader': 7, 'writer': 3})에 따라 배정, 계정은 순서대로 배정(계정 수보다 유저가 많으면 재사용)
+    """
+    recorder = Recorder()
+    profiles = assign_profiles(mix, users)
+    threads  = []
+    
+    recorder.started      = time.time()
+    recorder.measure_from = recorder.started + ramp_up
+    deadline              = recorder.measure_from + duration
+    
+    for index in range(users):
+        user = VirtualUser(
+            client     = Client(base_url, recorder, timeout),
+            account    = accounts[index % len(accounts)],
+            profile    = profiles[index],
+            think_time = think_time,
+            rand       = random.Random(seed * 100003 + index)
+        )
+        thread = threading.Thread(target=user.run, args=(deadline,), daemon=True)
+        thread.start()
+        threads.append(thread)
+        if ramp_up and index < users - 1:
+            time.sleep(ramp_up / users)
+    
+    for thread in threads:
+        thread.join()
+    recorder.stopped = time.time()
+    return recorder
+
+
+def get_git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--always', '--dirty'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(recorder: Recorder, **meta) -> dict:
+    return {
+        'meta': {
+            'revision'  : get_git_revision(),
+            'started_at': datetime.fromtimestamp(recorder.started).isoformat(timespec='seconds'),
+            **meta,
+        },
+        **recorder.report(),
+    }
@@ -0,0 +1,89 @@
+from typing   import List, Optional, Tuple
+from datetime import date
+
+from django.db.models import Q, Model
+
+from account_books.models import AccountBookLog
+from core.fields          import get_enum_value
+
+
+"""
+가계부 기록 정렬 기준
+"""
+LOG_SORT_SET = {
+    'up_to_date' : '-created_at',
+    'out_of_date': 'created_at',
+    'high_price' : '-price',
+    'low_price'  : 'price',
+}
+
+
+def get_log_filter(
+    search     : Optional[str] = None,
+    category_id: Optional[str] = None,
+    types      : Optional[str] = None,
+    date_from  : Optional[date] = None,
+    date_to    : Optional[date] = None,
+    ) -> Q:
+    """
+    Q 객체 활용:
+        - 검색 기능(가계부 기록 제목/설명/카테고리를 기준으로 검색 필터링)
+        - 필터링 기능(가계부 기록 카테고리/타입을 기준으로 필터링)
+        - 필터링 기능(가계부 기록 거래일자를 기준으로 기간 필터링)
+    """
+    q = Q()
+    
+    if search:
+        q |= Q(title__icontains = search)
+        q |= Q(description__icontains = search)
+        q |= Q(category__name__icontains = search)
+    if category_id:
+        categories = category_id.split(',')
+        q &= Q(category_id__in = categories)
+    if types:
+        q &= Q(types = get_enum_value(AccountBookLog, 'types', types))
+    if date_from:
+        q &= Q(occurred_at__gte = date_from)
+    if date_to:
+        q &= Q(occurred_at__lte = date_to)
+    
+    return q
+
+
+def check_date_range(date_from: Optional[date], date_to: Optional[date]) -> Optional[str]:
+    """
+    조회 기간(시작일/종료일) 확인
+    """
+    if date_from and date_to and date_from > date_to:
+        return '조회 시작일은 종료일보다 이후일 수 없습니다.'
+    return None
+
+
+def check_status(model: Model, status: Optional[str]) -> Optional[str]:
+    """
+    조회에서 제외할 상태값 확인(대소문자 구분 없음)
+    """
+    if status and not get_enum_value(model, 'status', status):
+        return f'{status}은/는 올바른 상태값이 아닙니다.'
+    return None
+
+
+def check_log_types(types: Optional[str]) -> Optional[str]:
+    """
+    가계부 기록 타입 확인(대소문자 구분 없음)
+    """
+    if types and not get_enum_value(AccountBookLog, 'types', types):
+        return f'{types}은/는 올바른 가계부 기록 타입이 아닙니다.'
+    return None
+
+
+def parse_ids(value: Optional[str]) -> Tuple[Optional[List[int]], Optional[str]]:
+    """
+    콤마로 구분된 id 목록 변환(정수가 아닌 값이 있으면 에러 메시지 반환)
+    """
+    if not value:
+        return None, None
+    try:
+        return [int(id) for id in value.split(',')], None
+    except ValueError:
+        return None, f'{value}은/는 올바른 id 목록이 아닙니다.'
@@ -0,0 +1,198 @@
+import asyncio, fcntl, hashlib, json, os, threading, time
+
+from typing import Any, Dict, Set, Tuple
+
+from django.conf import settings
+
+
+"""
+description:
+    - 채널 단위의 프로세스 내 pub/sub(SSE 스트림 fan-out 용도)
+    - 구독자는 이벤트 루프의 asyncio.Queue로 메시지를 받으므로 연결마다 스레드가 필요하지 않음
+    - 발행은 동기 코드(뷰, 시그널 등 다른 스레드)에서도 호출할 수 있도록 call_soon_threadsafe로 전달
+    - PUBSUB_BACKEND
+        - local: 같은 프로세스의 구독자에게만 전달
+        - file : 공유 spool 파일에 메시지를 추가하고, 프로세스마다 파일을 읽어 로컬 구독자에게 전달
+                 (여러 워커 프로세스 간 전달을 위한 로컬 대체 구현, 운영 환경에서는 Redis 등으로 교체)
+            - 구독자 표시: 구독중인 프로세스가 채널별 표시 파일의 수정 시각을 주기적으로 갱신하고,
+              발행하는 프로세스는 subscriber_ttl 이내에 갱신된 채널에만 발행
+            - 교체: spool 파일이 spool_max_bytes 이상이면 {spool_path}.1로 교체(이전 파일은 덮어씀),
+              구독중인 프로세스는 기존 파일을 끝까지 읽은 뒤 새 파일을 처음부터 읽음
+"""
+
+Subscriber = Tuple[asyncio.AbstractEventLoop, asyncio.Queue]
+
+
+class Broker:
+    def __init__(
+        self,
+        backend        : str   = 'local',
+        spool_path     : str   = '',
+        poll_seconds   : float = 0.5,
+        spool_max_bytes: int   = 10 * 1024 * 1024,
+        subscriber_ttl : float = 30
+        ):
+        self.backend         = backend
+        self.spool_path      = spool_path
+        self.poll_seconds    = poll_seconds
+        self.spool_max_bytes = spool_max_bytes
+        self.subscriber_ttl  = subscriber_ttl
+        self.channels        : Dict[str, Set[Subscriber]] = {}
+        self.tail_tasks      : Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+        self.lock            = threading.Lock()
+
+    def subscribe(self, channel: str, maxsize: int = 100) -> asyncio.Queue:
+        """
+        현재 이벤트 루프에서 채널 구독(반드시 이벤트 루프 안에서 호출)
+        """
+        loop  = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=maxsize)
+        with self.lock:
+            self.channels.setdefault(channel, set()).add((loop, queue))
+        
+        if self.backend == 'file':
+            self._touch_marker(channel)
+            if loop not in self.tail_tasks:
+                self.tail_tasks[loop] = loop.create_task(self._tail_spool(loop))
+        
+        return queue
+
+    def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        with self.lock:
+            subscribers = self.channels.get(channel, set())
+            for subscriber in [subscriber for subscriber in subscribers if subscriber[1] is queue]:
+                subscribers.discard(subscriber)
+            if not subscribers:
+                self.channels.pop(channel, None)
+
+    def has_subscribers(self, channel: str) -> bool:
+        """
+        구독자 존재 여부(file 백엔드는 다른 프로세스가 subscriber_ttl 이내에 갱신한 구독자 표시 파일로 확인)
+        """
+        if channel in self.channels:
+            return True
+        if self.backend != 'file':
+            return False
+        
+        try:
+            return os.stat(self._marker_path(channel)).st_mtime >= time.time() - self.subscriber_ttl
+        except FileNotFoundError:
+            return False
+
+    def publish(self, channel: str, message: Any) -> None:
+        """
+        메시지 발행(스레드 안전)
+        """
+        if self.backend == 'file':
+            self._append_spool(json.dumps({'channel': channel, 'message': message}, default=str) + '\n')
+            return
+        
+        self._dispatch(channel, message)
+
+    def _marker_path(self, channel: str) -> str:
+        return os.path.join(f'{self.spool_path}.subscribers', hashlib.md5(channel.encode()).hexdigest())
+
+    def _touch_marker(self, channel: str) -> None:
+        path = self._marker_path(channel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a'):
+            os.utime(path)
+
+    def _append_spool(self, line: str) -> None:
+        """
+        description:
+            - 프로세스 간 배타 잠금(flock) 상태에서 spool 파일에 추가
+            - 잠금을 기다리는 동안 다른 프로세스가 파일을 교체했다면 새 파일을 다시 열어서 추가
+            - 추가한 뒤 spool_max_bytes 이상이면 {spool_path}.1로 교체
+        """
+        while True:
+            with open(self.spool_path, 'a') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    if os.stat(self.spool_path).st_ino != os.fstat(f.fileno()).st_ino:
+                        continue
+                except FileNotFoundError:
+                    continue
+                
+                f.write(line)
+                f.flush()
+                if f.tell() >= self.spool_max_bytes:
+                    os.replace(self.spool_path, f'{self.spool_path}.1')
+                return
+
+    def _dispatch(self, channel: str, message: Any) -> None:
+        with self.lock:
+            subscribers = list(self.channels.get(channel, ()))
+        
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_put_latest, queue, message)
+            except RuntimeError:
+                """
+                이벤트 루프가 이미 종료된 구독자
+                """
+                self.unsubscribe(channel, queue)
+
+    async def _tail_spool(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        description:
+            - spool 파일 끝에서부터 새로 추가된 메시지를 읽어 로컬 구독자에게 전달
+            - 파일이 교체되면(inode 변경) 기존 파일을 끝까지 읽은 뒤 새 파일을 처음부터 읽음
+            - subscriber_ttl의 1/3 주기로 로컬 구독중인 채널의 구독자 표시 파일 갱신
+        """
+        open(self.spool_path, 'a').close()
+        f = open(self.spool_path)
+        f.seek(0, os.SEEK_END)
+        buffer  = ''
+        touched = time.monotonic()
+        try:
+            while True:
+                if time.monotonic() - touched >= self.subscriber_ttl / 3:
+                    with self.lock:
+                        channels = list(self.channels)
+                    for channel in channels:
+                        self._touch_marker(channel)
+                    touched = time.monotonic()
+                
+                chunk = f.read()
+                if not chunk:
+                    try:
+                        rotated = os.stat(self.spool_path).st_ino != os.fstat(f.fileno()).st_ino
+                    except FileNotFoundError:
+                        rotated = False
+                    if not rotated:
+                        await asyncio.sleep(self.poll_seconds)
+                        continue
+                    
+                    chunk = f.read()
+                    f.close()
+                    f = open(self.spool_path)
+                
+                buffer += chunk
+                *lines, buffer = buffer.split('\n')
+                for line in lines:
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._dispatch(data['channel'], data['message'])
+        finally:
+            f.close()
+
+
+def _put_latest(queue: asyncio.Queue, message: Any) -> None:
+    """
+    느린 구독자의 큐가 가득 찬 경우 가장 오래된 메시지를 버리고 최신 메시지를 추가
+    """
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+broker = Broker(
+    backend         = settings.PUBSUB_BACKEND,
+    spool_path      = settings.PUBSUB_SPOOL_PATH,
+    poll_seconds    = settings.PUBSUB_POLL_SECONDS,
+    spool_max_bytes = settings.PUBSUB_SPOOL_MAX_BYTES,
+    subscriber_ttl  = settings.PUBSUB_SUBSCRIBER_TTL_SECONDS
+)
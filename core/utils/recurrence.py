@@ -0,0 +1,119 @@
+import calendar
+
+from datetime import date, datetime, timedelta
+from typing   import Iterable, List
+
+from django.db import transaction
+
+from account_books.models import AccountBookLog, AccountBookRecurringLog
+from account_books.events import publish_book_balances
+from core.utils.cache     import bump_user_cache_version
+
+
+"""
+반복 주기
+"""
+RECURRING_RULES = [rule for rule, _ in AccountBookRecurringLog.RULE_TYPES]
+
+BULK_BATCH_SIZE = 1000
+
+
+def get_next_date(current: date, rule: str, start_date: date) -> date:
+    """
+    description:
+        - 반복 주기에 따른 다음 거래일자 산출
+        - monthly: 시작일의 일(day)을 기준으로 하며, 해당 월에 없는 날짜는 말일로 조정(ex. 31일 -> 2월 28일)
+    """
+    if rule == 'daily':
+        return current + timedelta(days=1)
+    if rule == 'weekly':
+        return current + timedelta(weeks=1)
+    
+    year, month = (current.year + 1, 1) if current.month == 12 else (current.year, current.month + 1)
+    day = min(start_date.day, calendar.monthrange(year, month)[1])
+    return date(year, month, day)
+
+
+def get_due_dates(recurring: AccountBookRecurringLog, until: date) -> List[date]:
+    """
+    다음 거래일자부터 기준일(종료일이 더 이른 경우 종료일)까지 생성해야 하는 거래일자 목록
+    (실행되지 못한 기간의 거래일자 포함)
+    """
+    if recurring.end_date and recurring.end_date < until:
+        until = recurring.end_date
+    
+    dates   = []
+    current = recurring.next_run_date
+    
+    while current <= until:
+        dates.append(current)
+        current = get_next_date(current, recurring.rule, recurring.start_date)
+    
+    return dates
+
+
+def materialize_recurring_logs(recurring_logs: Iterable[AccountBookRecurringLog], until: date) -> int:
+    """
+    description:
+        - 반복 기록 템플릿의 도래한 거래일자 기록을 bulk_create로 일괄 생성
+        - (반복 기록, 거래일자) unique 제약조건으로 같은 기간의 기록은 한번만 생성(재실행해도 중복 없음)
+        - 생성 후 템플릿의 다음 거래일자를 갱신
+        - 호출하는 쪽에서 템플릿을 select_for_update로 잠근 상태에서 호출
+        - 실제로 생성한 기록 수 반환(이미 생성된 거래일자의 기록은 제외)
+    """
+    logs     = []
+    updated  = []
+    book_ids = {}
+    
+    for recurring in recurring_logs:
+        dates = get_due_dates(recurring, until)
+        if not dates:
+            continue
+        
+        logs += [
+            AccountBookLog(
+                user_id     = recurring.user_id,
+                book_id     = recurring.book_id,
+                category_id = recurring.category_id,
+                recurring   = recurring,
+                title       = recurring.title,
+                price       = recurring.price,
+                description = recurring.description,
+                types       = recurring.types,
+                occurred_at = occurred_at
+            )
+            for occurred_at in dates
+        ]
+        
+        recurring.next_run_date = get_next_date(dates[-1], recurring.rule, recurring.start_date)
+        recurring.updated_at    = datetime.now()
+        updated.append(recurring)
+        book_ids.setdefault(recurring.user_id, set()).add(recurring.book_id)
+    
+    """
+    이미 생성된 (반복 기록, 거래일자)의 기록 제외
+    (템플릿이 잠긴 상태이므로 조회 이후 같은 템플릿의 기록이 생성되지 않음, ignore_conflicts는 중복 방지용으로 유지)
+    """
+    if logs:
+        existing = set(
+            AccountBookLog.objects\
+                          .filter(
+                              recurring_id__in = [recurring.id for recurring in updated],
+                              occurred_at__gte = min(log.occurred_at for log in logs)
+                          )\
+                          .values_list('recurring_id', 'occurred_at')
+        )
+        logs = [log for log in logs if (log.recurring_id, log.occurred_at) not in existing]
+    
+    with transaction.atomic():
+        AccountBookLog.objects.bulk_create(logs, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+        AccountBookRecurringLog.objects.bulk_update(updated, ['next_run_date', 'updated_at'], batch_size=BULK_BATCH_SIZE)
+    
+    """
+    bulk_create는 시그널이 발생하지 않으므로 유저의 집계 캐시 무효화, 가계부 잔액 변경 이벤트 발행을 직접 처리
+    """
+    for user_id, ids in book_ids.items():
+        transaction.on_commit(lambda user_id=user_id: bump_user_cache_version(user_id))
+        transaction.on_commit(lambda user_id=user_id, ids=ids: publish_book_balances(user_id, ids))
+    
+    return len(logs)
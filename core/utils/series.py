@@ -0,0 +1,123 @@
+from datetime import date, timedelta
+from typing   import List, Optional, Tuple
+
+from django.db.models           import Q, Sum
+from django.db.models.functions import Trunc
+
+from account_books.models import AccountBookLog
+
+
+"""
+시계열 집계 단위
+"""
+SERIES_INTERVALS = ('day', 'week', 'month')
+
+"""
+집계 단위별 기본 조회 기간(조회 시작일이 없는 경우)
+"""
+SERIES_DEFAULT_PERIODS = {
+    'day'  : timedelta(days=30),
+    'week' : timedelta(weeks=12),
+    'month': timedelta(days=365),
+}
+
+SERIES_MAX_BUCKETS = 1000
+
+
+def truncate_date(value: date, interval: str) -> date:
+    """
+    DB의 date_trunc와 동일한 기준으로 날짜를 절사(week: 월요일, month: 1일)
+    """
+    if interval == 'week':
+        return value - timedelta(days=value.weekday())
+    if interval == 'month':
+        return value.replace(day=1)
+    return value
+
+
+def next_bucket(value: date, interval: str) -> date:
+    if interval == 'week':
+        return value + timedelta(weeks=1)
+    if interval == 'month':
+        if value.month == 12:
+            return value.replace(year=value.year+1, month=1)
+        return value.replace(month=value.month+1)
+    return value + timedelta(days=1)
+
+
+def get_bucket_count(date_from: date, date_to: date, interval: str) -> int:
+    """
+    조회 기간의 구간 수를 구간 생성 없이 산출(조회 시작일 <= 종료일)
+    """
+    if interval == 'week':
+        return (truncate_date(date_to, interval) - truncate_date(date_from, interval)).days // 7 + 1
+    if interval == 'month':
+        return (date_to.year - date_from.year) * 12 + date_to.month - date_from.month + 1
+    return (date_to - date_from).days + 1
+
+
+def get_buckets(date_from: date, date_to: date, interval: str) -> List[date]:
+    """
+    조회 기간의 모든 구간(빈 구간 포함) 생성
+    (마지막 구간 다음 날짜는 계산하지 않으므로 date.max가 포함된 기간도 생성 가능)
+    """
+    buckets = [truncate_date(date_from, interval)]
+    
+    for _ in range(get_bucket_count(date_from, date_to, interval) - 1):
+        buckets.append(next_bucket(buckets[-1], interval))
+    
+    return buckets
+
+
+def get_series_period(
+    interval : str,
+    date_from: Optional[date],
+    date_to  : Optional[date]
+    ) -> Tuple[Optional[date], Optional[date], Optional[str]]:
+    """
+    조회 기간 산출(기본값: 오늘까지, 집계 단위별 기본 조회 기간)
+    (기본 조회 시작일이 표현 가능한 날짜 범위를 벗어나면 에러 메시지 반환)
+    """
+    date_to = date_to or date.today()
+    try:
+        date_from = date_from or date_to - SERIES_DEFAULT_PERIODS[interval]
+    except OverflowError:
+        return None, None, f'{date_to}은/는 올바른 조회 종료일이 아닙니다.'
+    return date_from, date_to, None
+
+
+def get_log_series(q: Q, interval: str, date_from: date, date_to: date) -> dict:
+    """
+    description:
+        - 가계부 기록의 구간별 총수입/총지출 산출
+        - 구간 집계는 DB에서 date_trunc로 처리하고, 빈 구간은 0으로 채움
+        - 포인트별 객체 대신 구간/수입/지출 배열을 반환하여 응답 크기 최소화
+    """
+    q &= Q(occurred_at__gte=date_from, occurred_at__lte=date_to)
+    
+    rows = AccountBookLog.objects\
+                         .filter(q)\
+                         .annotate(bucket=Trunc('occurred_at', interval))\
+                         .values('bucket')\
+                         .annotate(
+                             income      = Sum('price', filter=Q(types='income')),
+                             expenditure = Sum('price', filter=Q(types='expenditure'))
+                         )\
+                         .order_by('bucket')
+    totals = {row['bucket']: row for row in rows}
+    
+    buckets     = get_buckets(date_from, date_to, interval)
+    income      = []
+    expenditure = []
+    
+    for bucket in buckets:
+        row = totals.get(bucket)
+        income.append(int(row['income'] or 0) if row else 0)
+        expenditure.append(int(row['expenditure'] or 0) if row else 0)
+    
+    return {
+        'interval'   : interval,
+        'buckets'    : [bucket.isoformat() for bucket in buckets],
+        'income'     : income,
+        'expenditure': expenditure
+    }
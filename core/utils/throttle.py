@@ -0,0 +1,92 @@
+import math, socket, time
+
+from django.conf       import settings
+from django.core.cache import cache
+
+from core.utils.auth import get_user_id_from_request
+
+
+"""
+description:
+    - 유입 제어 유틸(Django 캐시의 원자적 연산(add/incr/decr)만 사용하므로 공유 캐시 사용 시 모든 워커 프로세스 합산)
+    - 노드별 동시 처리 요청 수(MAX_IN_FLIGHT_REQUESTS)
+        - 노드(호스트)의 모든 워커 프로세스가 하나의 카운터를 증가/감소
+        - 카운터는 IN_FLIGHT_WINDOW_SECONDS마다 새로 시작하므로 처리 도중 종료된 워커가 감소시키지 못한 요청 수는
+          최대 IN_FLIGHT_WINDOW_SECONDS 동안만 남음(새로 시작한 직후에는 이전 카운터에서 처리중인 요청만큼 제한이 느슨해짐)
+    - 유저(비로그인은 IP)별 요청 제한(THROTTLE_RATE/THROTTLE_BURST)
+        - THROTTLE_BURST / THROTTLE_RATE초 단위 고정 윈도우에서 최대 THROTTLE_BURST개
+        - 유입 제어 미들웨어(요청마다 1개), 일괄 처리 API(하위 요청마다 1개)에서 같은 윈도우를 차감
+"""
+
+
+def get_in_flight_key() -> str:
+    window = int(time.time() // settings.IN_FLIGHT_WINDOW_SECONDS)
+    return f'in_flight:{socket.gethostname()}:{window}'
+
+
+def acquire_in_flight() -> str:
+    """
+    노드의 동시 처리 요청 수 증가(제한을 넘으면 되돌리고 빈 문자열 반환, 성공 시 release_in_flight에 전달할 키 반환)
+    """
+    key = get_in_flight_key()
+    if not settings.MAX_IN_FLIGHT_REQUESTS:
+        return key
+    
+    cache.add(key, 0, settings.IN_FLIGHT_WINDOW_SECONDS * 2)
+    try:
+        count = cache.incr(key)
+    except ValueError:
+        return key
+    
+    if count > settings.MAX_IN_FLIGHT_REQUESTS:
+        release_in_flight(key)
+        return ''
+    return key
+
+
+def release_in_flight(key: str) -> None:
+    if not settings.MAX_IN_FLIGHT_REQUESTS:
+        return
+    try:
+        cache.decr(key)
+    except ValueError:
+        """
+        카운터가 만료된 경우
+        """
+        pass
+
+
+def get_throttle_identity(request) -> str:
+    user_id = get_user_id_from_request(request)
+    if user_id:
+        return f'user:{user_id}'
+    return f'ip:{request.META.get("REMOTE_ADDR", "")}'
+
+
+def take_tokens(identity: str, count: int = 1) -> int:
+    """
+    현재 윈도우에서 요청 count개 차감(한도를 넘으면 되돌리고 다음 윈도우까지 남은 시간(초) 반환)
+    """
+    rate  = settings.THROTTLE_RATE
+    burst = settings.THROTTLE_BURST
+    if not rate or count < 1:
+        return 0
+    
+    window = burst / rate
+    now    = time.time()
+    index  = int(now // window)
+    key    = f'throttle:{identity}:{index}'
+    
+    cache.add(key, 0, math.ceil(window) + 1)
+    try:
+        used = cache.incr(key, count)
+    except ValueError:
+        return 0
+    
+    if used > burst:
+        try:
+            cache.decr(key, count)
+        except ValueError:
+            pass
+        return max(math.ceil((index + 1) * window - now), 1)
+    return 0
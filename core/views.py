@@ -1,3 +1,24 @@
-from django.shortcuts import render
+import hmac
 
-# Create your views here.
+from django.conf                  import settings
+from django.http                  import HttpResponse, JsonResponse
+from django.views.decorators.http import require_GET
+
+from core.metrics import render_metrics
+
+
+"""
+Prometheus 메트릭 조회(text exposition format)
+    - METRICS_TOKEN이 설정된 경우 Authorization: Bearer <token> 헤더 필요
+"""
+@require_GET
+def metrics(request):
+    if not settings.METRICS_ENABLED:
+        return JsonResponse({'detail': '메트릭 수집이 비활성화되어 있습니다.'}, status=404)
+    
+    if settings.METRICS_TOKEN:
+        token = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+        if not hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+            return JsonResponse({'detail': '인증 정보가 올바르지 않습니다.'}, status=401)
+    
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
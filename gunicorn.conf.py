@@ -0,0 +1,41 @@
+"""
+gunicorn 설정(운영)
+
+    - preload_app: 마스터 프로세스에서 앱을 로드하고 warm-up한 뒤 워커를 fork
+    - post_fork: 워커마다 DB 연결 등 공유할 수 없는 자원을 미리 생성
+    - 두 개의 프로세스로 실행
+        - API(config.wsgi): 동기 워커(sync), 아래 경로를 제외한 모든 요청 처리
+        - ASGI(config.asgi): uvicorn 워커, 프록시에서 아래 경로만 전달
+            - /api/account-books/stream(SSE 스트림, 연결마다 워커를 점유하지 않음)
+            - /api/users/signup, /api/users/signin(비동기 뷰, 패스워드 해싱 중 다른 요청 처리)
+    - 두 프로세스 간 잔액 변경 이벤트 전달을 위해 PUBSUB_BACKEND=file(운영 설정 기본값) 사용
+
+usage:
+    gunicorn -c gunicorn.conf.py config.wsgi
+    GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker GUNICORN_BIND=0.0.0.0:8001 gunicorn -c gunicorn.conf.py config.asgi
+"""
+
+import multiprocessing, os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings_production')
+
+
+bind         = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers      = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+preload_app  = True
+
+
+def when_ready(server):
+    from config.warmup import warm_up
+    
+    timings = warm_up()
+    server.log.info(
+        'warm-up: ' + ', '.join(f'{name} {seconds * 1000:.1f}ms' for name, seconds in timings.items())
+    )
+
+
+def post_fork(server, worker):
+    from config.warmup import warm_up_worker
+    
+    warm_up_worker()
@@ -1,23 +1,43 @@
 import re, jwt
 
-from ninja    import Router
-from datetime import datetime, timedelta
+from ninja       import Router
+from datetime    import datetime, timedelta
+from asgiref.sync import sync_to_async
 
-from django.http                 import JsonResponse
-from django.core.validators      import validate_email
-from django.core.exceptions      import ValidationError
-from django.contrib.auth.hashers import check_password
+from django.db              import IntegrityError, transaction
+from django.http            import JsonResponse
+from django.core.validators import validate_email
+from django.core.exceptions import ValidationError
 
-from users.schema    import UserSignUpInput, UserSignUpOutput, UserSignInInput, UserSignInOutput
-from users.models    import User
-from config.settings import SECRET_KEY
+from users.schema       import UserSignUpInput, UserSignUpOutput, UserSignInInput, UserSignInOutput
+from users.models       import User
+from config.settings    import SECRET_KEY
+from core.utils.hashing   import amake_password, acheck_password
+from core.utils.integrity import get_unique_violation_field
 
 
 router = Router()
 
 
+"""
+패스워드 조건: 길이 8~20 자리, 최소 1개 이상의 소문자, 대문자, 숫자, (숫자키)특수문자로 구성
+(모듈 로드 시 한번만 컴파일)
+"""
+PASSWORD_REGEX = re.compile(r'^(?=.*[\d])(?=.*[A-Z])(?=.*[a-z])(?=.*[!@#$%^&*()])[\w\d!@#$%^&*()]{8,20}$')
+
+
+def create_user(**kwargs) -> User:
+    """
+    insert 실패(IntegrityError) 시 바깥 트랜잭션에 영향이 없도록 savepoint 안에서 생성
+    """
+    with transaction.atomic():
+        return User.objects.create_user(**kwargs)
+
+
 """
 유저 회원가입 API
+    - 패스워드 해싱은 별도의 해싱 풀에서 실행(비동기)
+    - 이메일/닉네임 중복은 DB unique 제약조건으로 확인(중복 확인 쿼리 없이 한번의 insert)
 """
 @router.post(
     '/signup',
@@ -25,10 +45,10 @@ router = Router()
     response = UserSignUpOutput,
     summary  = "유저 회원가입"
 )
-def user_signup(request, data: UserSignUpInput):
+async def user_signup(request, data: UserSignUpInput):
     
     """
-    이메일 필수값/중복/형식 확인
+    이메일 필수값/형식 확인
     """
     email = data.email
     if not email:
@@ -37,8 +57,6 @@ def user_signup(request, data: UserSignUpInput):
         validate_email(email)
     except ValidationError:
         return JsonResponse({'detail': '이메일 형식이 잘못되었습니다.'}, status=400)
-    if User.objects.filter(email=email).exists():
-        return JsonResponse({'detail': f'{email}은/는 이미 존재합니다.'}, status=400)
     
     """
     패스워드 필수값/형식 확인
@@ -47,31 +65,44 @@ def user_signup(request, data: UserSignUpInput):
     password = data.password
     if not password:
         return JsonResponse({'detail': '패스워드는 필수 입력값입니다.'}, status=400)
-    password_regex = '^(?=.*[\d])(?=.*[A-Z])(?=.*[a-z])(?=.*[!@#$%^&*()])[\w\d!@#$%^&*()]{8,20}$'
-    if not re.match(password_regex, password):
+    if not PASSWORD_REGEX.match(password):
         return JsonResponse({'detail': '올바른 비밀번호를 입력하세요.'}, status=400)
     
     """
-    닉네임 필수값/중복 확인
+    닉네임 필수값 확인
     """
     nickname = data.nickname
     if not nickname:
         return JsonResponse({'detail': '닉네임은 필수 입력값입니다.'}, status=400)
-    if User.objects.filter(nickname=nickname).exists():
-        return JsonResponse({'detail': f'{nickname}은/는 이미 존재합니다.'}, status=400)
     
-    user = User.objects\
-               .create_user(
-                   email    = data.email,
-                   nickname = data.nickname,
-                   password = password
-               )
+    encoded_password = await amake_password(password)
+    
+    """
+    유저 생성 및 이메일/닉네임 중복 확인:
+        - unique 제약조건 위반(IntegrityError) 시 위반한 필드의 에러 메세지 반환
+        - 동시에 같은 이메일/닉네임으로 가입하는 경우에도 한 명만 생성
+    """
+    try:
+        user = await sync_to_async(create_user)(
+            email            = email,
+            nickname         = nickname,
+            encoded_password = encoded_password
+        )
+    except IntegrityError as e:
+        field = get_unique_violation_field(e, ('email', 'nickname'))
+        if field == 'email':
+            return JsonResponse({'detail': f'{email}은/는 이미 존재합니다.'}, status=400)
+        if field == 'nickname':
+            return JsonResponse({'detail': f'{nickname}은/는 이미 존재합니다.'}, status=400)
+        raise
     
     return user
 
 
+
 """
 유저 로그인 API
+    - 패스워드 확인은 별도의 해싱 풀에서 실행(비동기)
 """
 @router.post(
     '/signin',
@@ -79,7 +110,7 @@ def user_signup(request, data: UserSignUpInput):
     response = UserSignInOutput,
     summary  = "유저 로그인"
 )
-def user_signin(request, data: UserSignInInput):
+async def user_signin(request, data: UserSignInInput):
     
     """
     이메일/패스워드 필수값 확인
@@ -95,16 +126,23 @@ def user_signin(request, data: UserSignInInput):
     입력받은 이메일 정보와 매칭되는 유저객체 추출
     """
     try:
-        user = User.objects.values('id', 'password').get(email=email)
+        user = await sync_to_async(User.objects.values('id', 'password').get)(email=email)
     except User.DoesNotExist:
         return JsonResponse({'detail': '올바른 유저정보를 입력하세요.'}, status=400)
     
     """
     입력받은 패스워드가 유저의 패스워드와 일치하는지 확인
     """
-    if not check_password(password, user['password']):
+    is_valid, encoded_password = await acheck_password(password, user['password'])
+    if not is_valid:
         return JsonResponse({'detail': '올바른 유저정보를 입력하세요.'}, status=400)
     
+    """
+    해싱 알고리즘/파라미터가 변경된 경우 새 파라미터로 해싱한 패스워드로 교체
+    """
+    if encoded_password:
+        await sync_to_async(User.objects.filter(id=user['id']).update)(password=encoded_password)
+    
     """
     액세스/리프레시 토큰 발급
     토큰 만료기간: 액세스 토큰(1일), 리프레시 토큰(7일) 
@@ -6,7 +6,7 @@ from core.models import TimeStampModel
 
 class UserManager(BaseUserManager):
     
-    def create_user(self, email, nickname, password=None):
+    def create_user(self, email, nickname, password=None, encoded_password=None):
 
         if not email:
             raise ValueError('Users must have an email address')
@@ -16,7 +16,13 @@ class UserManager(BaseUserManager):
             nickname = nickname,
         )
         
-        user.set_password(password)
+        """
+        이미 해싱된 패스워드가 주어진 경우(비동기 해싱) 그대로 저장
+        """
+        if encoded_password:
+            user.password = encoded_password
+        else:
+            user.set_password(password)
         user.is_active = True
         user.save(using=self._db)
         return user